@@ -0,0 +1,54 @@
+"""
+Compare two `benchmarks.run` reports and flag regressions, exits with status 1 when there is any.
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Metric -> whether a higher value is better
+METRICS = {"ops_per_sec": True, "latency_p50": False, "latency_p99": False, "cpu_seconds": False, "peak_rss_mb": False}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """The regressions of `current` over `baseline`: metrics that got worse by more than `threshold` (a ratio)"""
+    baseline_results = {(result["scenario"], result["pattern"]): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["scenario"], result["pattern"])
+        if key not in baseline_results:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            before, after = baseline_results[key][metric], result[metric]
+            if not before:
+                continue
+            change = (after - before) / before
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{key[0]}/{key[1]} {metric}: {before:.4g} -> {after:.4g} ({change:+.1%})")
+        if result["errors"] > baseline_results[key]["errors"]:
+            regressions.append(f"{key[0]}/{key[1]} errors: {baseline_results[key]['errors']} -> {result['errors']}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1, help="Tolerated relative change (0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    baseline, current = json.loads(args.baseline.read_text()), json.loads(args.current.read_text())
+    print(f"{baseline['version']} -> {current['version']}")
+    regressions = compare(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regression")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
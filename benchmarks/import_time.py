@@ -0,0 +1,71 @@
+"""
+Import time benchmark: how long importing the client takes in a fresh interpreter, and which heavy dependencies it loads.
+
+Every statement is run `--repeat` times in a new process (`python -X importtime`), the median is reported. Exits with
+status 1 when a statement takes more than `--max-ms` or loads one of the dependencies that must stay lazy.
+
+    python -m benchmarks.import_time --repeat 10 --max-ms 400
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+STATEMENTS = (
+    "import bria_client",
+    "from bria_client import BriaSyncClient",
+    "from bria_client import BriaAsyncClient",
+    "from bria_client.toolkit import Image",
+)
+# Loaded on first use only: the statements that do not use them must not import them
+LAZY_DEPENDENCIES = ("numpy", "PIL", "werkzeug", "requests")
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    """The import time of `statement` in a fresh interpreter (seconds) and the lazy dependencies it loaded"""
+    check = f"import sys; print(','.join(name for name in {LAZY_DEPENDENCIES!r} if name in sys.modules))"
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"{statement}; {check}"], capture_output=True, text=True, check=True)
+    # `import time: self [us] | cumulative | imported package`, the top level imports are not indented
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        _, _, fields = line.partition("import time:")
+        parts = fields.split("|")
+        if len(parts) == 3 and parts[2].startswith(" ") and not parts[2].startswith("  ") and parts[1].strip().isdigit():
+            total_us += int(parts[1])
+    loaded = completed.stdout.strip()
+    return total_us / 1e6, loaded.split(",") if loaded else []
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per statement")
+    parser.add_argument("--max-ms", type=float, help="Fail when a statement takes longer (median, in milliseconds)")
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    # The interpreter start up imports (`site`, `encodings`...) are not the client's
+    baseline_ms = statistics.median(measure("pass")[0] for _ in range(args.repeat)) * 1000
+    results, failures = [], []
+    for statement in STATEMENTS:
+        measurements = [measure(statement) for _ in range(args.repeat)]
+        median_ms = statistics.median(seconds for seconds, _ in measurements) * 1000 - baseline_ms
+        loaded = measurements[0][1]
+        results.append({"statement": statement, "median_ms": median_ms, "loaded": loaded})
+        print(f"{statement:<45} {median_ms:8.1f} ms  {'loads ' + ', '.join(loaded) if loaded else ''}")
+        if args.max_ms is not None and median_ms > args.max_ms:
+            failures.append(f"{statement}: {median_ms:.1f} ms > {args.max_ms} ms")
+        # `Image` needs numpy and Pillow, the other statements must not load any of them
+        if "Image" not in statement and loaded:
+            failures.append(f"{statement}: loads {', '.join(loaded)}")
+    if args.output is not None:
+        args.output.write_text(json.dumps({"results": results}, indent=2))
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+A local stand-in for the Bria API, for benchmarks: answers instantly (or after the configured delays) so what is measured
+is the client itself.
+
+    POST /v2/video/upload     -> a presigned upload target on this server
+    POST /upload              -> the presigned storage target (204)
+    POST /v2/<endpoint>       -> a result when `sync` is true, otherwise a request_id to poll
+    GET  /v2/status/<id>      -> IN_PROGRESS until the job is `job_duration` old, then its result
+"""
+
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+@dataclass
+class MockServerConfig:
+    # Seconds a `sync` request takes
+    sync_delay: float = 0.0
+    # Seconds an async job stays IN_PROGRESS after its submission
+    job_duration: float = 0.0
+    # Share of the API requests answered with `error_status` (a transient error the client retries)
+    error_rate: float = 0.0
+    error_status: int = 503
+    # `Retry-After` of the injected errors, in seconds
+    retry_after: float | None = None
+    seed: int | None = None
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under concurrent load (clients then wait a 1s SYN retransmit)
+    request_queue_size = 1024
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients closing their connection (e.g. when retrying) are expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class MockBriaServer:
+    """
+    Threaded HTTP/1.1 server (keep-alive) running in a background thread.
+
+    Usage:
+    >>> with MockBriaServer(MockServerConfig(job_duration=0.1)) as server:
+    ...     client = BriaSyncClient(base_url=server.base_url, api_token="benchmark")
+    """
+
+    def __init__(self, config: MockServerConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or MockServerConfig()
+        self.requests = 0
+        self.injected_errors = 0
+        self._jobs: dict[str, float] = {}
+        self._ids = itertools.count()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockBriaServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-bria-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockBriaServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _inject_error(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            if self.config.error_rate and self._random.random() < self.config.error_rate:
+                self.injected_errors += 1
+                return True
+            return False
+
+    def _submit(self) -> str:
+        request_id = f"bench-{next(self._ids)}"
+        with self._lock:
+            self._jobs[request_id] = time.monotonic() + self.config.job_duration
+        return request_id
+
+    def _job_status(self, request_id: str) -> str | None:
+        """`IN_PROGRESS` or `COMPLETED` (the job is then forgotten), `None` for an unknown job"""
+        with self._lock:
+            done_at = self._jobs.get(request_id)
+            if done_at is None:
+                return None
+            if time.monotonic() < done_at:
+                return "IN_PROGRESS"
+            del self._jobs[request_id]
+            return "COMPLETED"
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, without TCP_NODELAY every response would wait for a delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                path = self.path.split("?")[0]
+                if not path.startswith("/v2/status/"):
+                    return self._send(404, {"error": {"code": 404, "message": "Not Found", "details": path}})
+                if server._inject_error():
+                    return self._send_error()
+                request_id = path.removeprefix("/v2/status/")
+                status = server._job_status(request_id)
+                if status is None:
+                    return self._send(404, {"error": {"code": 404, "message": "Not Found", "details": request_id}})
+                if status == "IN_PROGRESS":
+                    return self._send(200, {"request_id": request_id, "status": status})
+                self._send(200, {"request_id": request_id, "status": status, "result": _result(request_id)})
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                path = self.path.split("?")[0]
+                if path == "/upload":
+                    return self._send(204)
+                if server._inject_error():
+                    return self._send_error()
+                if path == "/v2/video/upload":
+                    request_id = f"upload-{next(server._ids)}"
+                    result = {
+                        "upload_url": f"{server.base_url}/upload",
+                        "upload_fields": {"key": request_id},
+                        "file_url": f"https://storage.example.com/{request_id}",
+                    }
+                    return self._send(200, {"request_id": request_id, "result": result})
+                payload = json.loads(body or b"{}")
+                if payload.get("sync"):
+                    time.sleep(server.config.sync_delay)
+                    request_id = f"bench-{next(server._ids)}"
+                    return self._send(200, {"request_id": request_id, "result": _result(request_id)})
+                request_id = server._submit()
+                self._send(202, {"request_id": request_id, "status_url": f"{server.base_url}/v2/status/{request_id}"})
+
+            def _send_error(self) -> None:
+                headers = {"Retry-After": str(server.config.retry_after)} if server.config.retry_after is not None else {}
+                error = {"code": server.config.error_status, "message": "Injected error", "details": ""}
+                self._send(server.config.error_status, {"error": error}, headers)
+
+            def _send(self, status: int, body: dict | None = None, headers: dict[str, str] | None = None) -> None:
+                content = json.dumps(body).encode() if body is not None else b""
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if content:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
+
+
+def _result(request_id: str) -> dict[str, str]:
+    return {"image_url": f"https://storage.example.com/{request_id}.png"}
@@ -0,0 +1,339 @@
+"""
+Throughput / latency benchmarks of the client against the local mock API (`benchmarks/mock_server.py`).
+
+Every (scenario, pattern) pair runs in a fresh process, so its CPU time and peak memory are its own, while the mock
+server runs in this process. Results are printed (or written with `--output`) as JSON, compare two runs with
+`python -m benchmarks.compare`.
+
+    python -m benchmarks.run --scenarios run submit_poll --patterns sync async --operations 500 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+from httpx_retries import Retry
+
+from benchmarks.mock_server import MockBriaServer, MockServerConfig
+from bria_client import BriaAsyncClient, BriaSyncClient
+from bria_client._version import __version__
+from bria_client.toolkit import Image
+
+SCENARIOS = ("run", "run_image", "submit_poll", "upload", "image_encode")
+PATTERNS = ("sync", "threaded", "async", "multiprocess")
+# `Image` encoding does not do I/O, there is nothing to run on an event loop
+UNSUPPORTED = {("image_encode", "async")}
+ENDPOINT = "image/edit/remove_background"
+IMAGE_URL = "https://example.com/image.png"
+
+
+@dataclass
+class BenchmarkOptions:
+    base_url: str
+    operations: int = 200
+    concurrency: int = 16
+    processes: int = 4
+    poll_interval: float = 0.01
+    image_size: int = 512
+    encoding: str = "fast"
+    upload_size: int = 1024 * 1024
+    http2: bool = False
+    # Retry fast on the injected errors, the benchmark measures the client and not the backoff
+    retry_backoff: float = 0.01
+
+
+@dataclass
+class Measurement:
+    latencies: list[float]
+    errors: int
+    duration: float
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    pattern: str
+    operations: int
+    errors: int
+    duration: float
+    ops_per_sec: float
+    latency_mean: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+    cpu_seconds: float
+    peak_rss_mb: float
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return math.nan
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))]
+
+
+# region Operations: one call of a scenario, returns whether it succeeded
+
+
+def _test_image(size: int) -> np.ndarray:
+    # A gradient compresses like a photo would, unlike random noise
+    row = np.linspace(0, 255, size, dtype=np.uint8)
+    return np.dstack([np.tile(row, (size, 1)), np.tile(row[:, None], (1, size)), np.full((size, size), 128, dtype=np.uint8)])
+
+
+def _client_options(options: BenchmarkOptions) -> dict:
+    return {
+        "base_url": options.base_url,
+        "api_token": "benchmark",
+        "retry": Retry(total=5, backoff_factor=options.retry_backoff, allowed_methods=["GET", "POST"]),
+        "http2": options.http2,
+        "max_connections": max(options.concurrency, 100),
+    }
+
+
+def _sync_operation(scenario: str, options: BenchmarkOptions, client: BriaSyncClient, upload_path: Path) -> Callable[[], bool]:
+    array = _test_image(options.image_size)
+    operations = {
+        "run": lambda: client.run(ENDPOINT, payload={"image": IMAGE_URL}).error is None,
+        "run_image": lambda: client.run(ENDPOINT, payload={"image": Image(array, encoding=options.encoding)}).error is None,
+        "submit_poll": lambda: client.poll(client.submit(ENDPOINT, payload={"image": IMAGE_URL}), interval=options.poll_interval).error is None,
+        "upload": lambda: bool(client.upload(upload_path, media_type="video/mp4")),
+        "image_encode": lambda: Image(array, encoding=options.encoding).resolve().base64_length > 0,
+    }
+    return operations[scenario]
+
+
+def _async_operation(scenario: str, options: BenchmarkOptions, client: BriaAsyncClient, upload_path: Path) -> Callable[[], object]:
+    array = _test_image(options.image_size)
+
+    async def run() -> bool:
+        return (await client.run(ENDPOINT, payload={"image": IMAGE_URL})).error is None
+
+    async def run_image() -> bool:
+        return (await client.run(ENDPOINT, payload={"image": Image(array, encoding=options.encoding)})).error is None
+
+    async def submit_poll() -> bool:
+        submitted = await client.submit(ENDPOINT, payload={"image": IMAGE_URL})
+        return (await client.poll(submitted, interval=options.poll_interval)).error is None
+
+    async def upload() -> bool:
+        return bool(await client.upload(upload_path, media_type="video/mp4"))
+
+    return {"run": run, "run_image": run_image, "submit_poll": submit_poll, "upload": upload}[scenario]
+
+
+def _timed(operation: Callable[[], bool], latencies: list[float]) -> bool:
+    started_at = time.perf_counter()
+    try:
+        ok = operation()
+    except Exception:
+        ok = False
+    latencies.append(time.perf_counter() - started_at)
+    return ok
+
+
+async def _timed_async(operation: Callable[[], object], latencies: list[float]) -> bool:
+    started_at = time.perf_counter()
+    try:
+        ok = await operation()
+    except Exception:
+        ok = False
+    latencies.append(time.perf_counter() - started_at)
+    return bool(ok)
+
+
+# endregion
+
+# region Patterns: run `operations` calls, returns the latencies, the number of errors and the duration (set-up excluded)
+
+
+def _run_sync(scenario: str, options: BenchmarkOptions, operations: int, upload_path: Path) -> Measurement:
+    with BriaSyncClient(**_client_options(options)) as client:
+        operation = _sync_operation(scenario, options, client, upload_path)
+        latencies: list[float] = []
+        started_at = time.perf_counter()
+        errors = sum(not _timed(operation, latencies) for _ in range(operations))
+        return Measurement(latencies, errors, time.perf_counter() - started_at)
+
+
+def _run_threaded(scenario: str, options: BenchmarkOptions, operations: int, upload_path: Path) -> Measurement:
+    with BriaSyncClient(**_client_options(options)) as client:
+        operation = _sync_operation(scenario, options, client, upload_path)
+        latencies: list[float] = []
+        with ThreadPoolExecutor(max_workers=options.concurrency) as executor:
+            started_at = time.perf_counter()
+            errors = sum(not ok for ok in executor.map(lambda _: _timed(operation, latencies), range(operations)))
+            return Measurement(latencies, errors, time.perf_counter() - started_at)
+
+
+def _run_async(scenario: str, options: BenchmarkOptions, operations: int, upload_path: Path) -> Measurement:
+    async def main() -> Measurement:
+        async with BriaAsyncClient(**_client_options(options)) as client:
+            operation = _async_operation(scenario, options, client, upload_path)
+            latencies: list[float] = []
+            slots = asyncio.Semaphore(options.concurrency)
+
+            async def bounded() -> bool:
+                async with slots:
+                    return await _timed_async(operation, latencies)
+
+            started_at = time.perf_counter()
+            results = await asyncio.gather(*(bounded() for _ in range(operations)))
+            return Measurement(latencies, sum(not ok for ok in results), time.perf_counter() - started_at)
+
+    return asyncio.run(main())
+
+
+def _run_multiprocess(scenario: str, options: BenchmarkOptions, operations: int, upload_path: Path) -> Measurement:
+    # Each worker process runs its share like `examples/multi_process_async.py` (async, except for the CPU-bound encoding)
+    worker_pattern = "threaded" if scenario == "image_encode" else "async"
+    shares = [operations // options.processes + (index < operations % options.processes) for index in range(options.processes)]
+    with ProcessPoolExecutor(max_workers=options.processes, mp_context=get_context("spawn")) as executor:
+        # Start the workers (and their imports) before measuring
+        list(executor.map(_warm_up, range(options.processes)))
+        started_at = time.perf_counter()
+        futures = [executor.submit(PATTERN_RUNNERS[worker_pattern], scenario, options, share, upload_path) for share in shares if share]
+        measurements = [future.result() for future in futures]
+        duration = time.perf_counter() - started_at
+    return Measurement([latency for measurement in measurements for latency in measurement.latencies], sum(m.errors for m in measurements), duration)
+
+
+def _warm_up(_: int) -> None:
+    time.sleep(0.1)
+
+
+PATTERN_RUNNERS = {"sync": _run_sync, "threaded": _run_threaded, "async": _run_async, "multiprocess": _run_multiprocess}
+
+# endregion
+
+
+def _peak_rss_mb(who: int) -> float:
+    peak = resource.getrusage(who).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _cpu_seconds() -> float:
+    own, children = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def run_scenario(scenario: str, pattern: str, options: BenchmarkOptions, upload_path: Path) -> ScenarioResult:
+    """Run one scenario in the current process and measure it"""
+    cpu_started = _cpu_seconds()
+    measurement = PATTERN_RUNNERS[pattern](scenario, options, options.operations, upload_path)
+    latencies, errors, duration = sorted(measurement.latencies), measurement.errors, measurement.duration
+    return ScenarioResult(
+        scenario=scenario,
+        pattern=pattern,
+        operations=len(latencies),
+        errors=errors,
+        duration=duration,
+        ops_per_sec=len(latencies) / duration if duration else math.nan,
+        latency_mean=sum(latencies) / len(latencies) if latencies else math.nan,
+        latency_p50=percentile(latencies, 0.50),
+        latency_p90=percentile(latencies, 0.90),
+        latency_p99=percentile(latencies, 0.99),
+        latency_max=latencies[-1] if latencies else math.nan,
+        cpu_seconds=_cpu_seconds() - cpu_started,
+        peak_rss_mb=max(_peak_rss_mb(resource.RUSAGE_SELF), _peak_rss_mb(resource.RUSAGE_CHILDREN)),
+    )
+
+
+def _summary(result: ScenarioResult) -> str:
+    latencies = f"p50 {result.latency_p50 * 1000:8.2f} ms  p99 {result.latency_p99 * 1000:8.2f} ms"
+    return f"{result.scenario:>12} {result.pattern:>12}: {result.ops_per_sec:10.1f} ops/s  {latencies}  errors {result.errors}"
+
+
+def run_benchmarks(scenarios: list[str], patterns: list[str], options: BenchmarkOptions, server: MockBriaServer) -> dict:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        upload_path = Path(directory) / "upload.mp4"
+        upload_path.write_bytes(os.urandom(options.upload_size))
+        for scenario in scenarios:
+            for pattern in patterns:
+                if (scenario, pattern) in UNSUPPORTED:
+                    continue
+                # A fresh process per scenario: its own CPU time and peak memory, and no GIL shared with the server
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                    result = executor.submit(run_scenario, scenario, pattern, options, upload_path).result()
+                print(_summary(result), file=sys.stderr)
+                results.append(asdict(result))
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "options": {name: value for name, value in asdict(options).items() if name != "base_url"},
+        "server": asdict(server.config),
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--patterns", nargs="+", choices=PATTERNS, default=list(PATTERNS))
+    parser.add_argument("--operations", type=int, default=200, help="Calls per scenario and pattern")
+    parser.add_argument("--concurrency", type=int, default=16, help="Threads / tasks in flight (per process)")
+    parser.add_argument("--processes", type=int, default=4, help="Worker processes of the multiprocess pattern")
+    parser.add_argument("--poll-interval", type=float, default=0.01)
+    parser.add_argument("--image-size", type=int, default=512, help="Side of the square test image, in pixels")
+    parser.add_argument("--encoding", default="fast", help="Encode preset of the test image")
+    parser.add_argument("--upload-size", type=int, default=1024 * 1024, help="Size of the uploaded file, in bytes")
+    parser.add_argument("--http2", action="store_true", help="Use HTTP/2 (the mock server only speaks HTTP/1.1, so this measures the fallback)")
+    parser.add_argument("--sync-delay", type=float, default=0.0, help="Seconds the mock server takes for a sync request")
+    parser.add_argument("--job-duration", type=float, default=0.05, help="Seconds a submitted job stays in progress")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of API requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=503, choices=[429, 503])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    config = MockServerConfig(
+        sync_delay=args.sync_delay,
+        job_duration=args.job_duration,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    with MockBriaServer(config) as server:
+        options = BenchmarkOptions(
+            base_url=server.base_url,
+            operations=args.operations,
+            concurrency=args.concurrency,
+            processes=args.processes,
+            poll_interval=args.poll_interval,
+            image_size=args.image_size,
+            encoding=args.encoding,
+            upload_size=args.upload_size,
+            http2=args.http2,
+        )
+        report = run_benchmarks(args.scenarios, args.patterns, options, server)
+        report["server"]["requests"], report["server"]["injected_errors"] = server.requests, server.injected_errors
+
+    output = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
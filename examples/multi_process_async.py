@@ -5,6 +5,7 @@ import multiprocessing
 from dotenv import load_dotenv
 
 from bria_client import BriaAsyncClient
+from bria_client.engines import SharedRateLimiter
 from bria_client.toolkit import Image
 
 load_dotenv()
@@ -13,10 +14,18 @@ load_dotenv()
 logging.basicConfig(level=logging.ERROR)
 logging.getLogger("bria_client").setLevel(logging.DEBUG)
 
-aclient = BriaAsyncClient()
+aclient: BriaAsyncClient | None = None
+
+
+def init_worker(rate_limiter: SharedRateLimiter):
+    # Every worker process runs its own client, all of them draw from the same request budget
+    global aclient
+    aclient = BriaAsyncClient(rate_limiter=rate_limiter)
 
 
 async def request_and_poll():
+    assert aclient is not None
+
     async def request_with_polling():
         response = await aclient.submit(
             endpoint="image/edit/remove_background",
@@ -36,6 +45,7 @@ def pool_worker(_):
 
 
 if __name__ == "__main__":
-    with multiprocessing.Pool(processes=3) as pool:
+    limiter = SharedRateLimiter(rate=10, max_concurrency=8, adaptive=True)
+    with multiprocessing.Pool(processes=3, initializer=init_worker, initargs=(limiter,)) as pool:
         results = pool.map(pool_worker, range(3))
     x = 1
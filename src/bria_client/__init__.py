@@ -1,4 +1,19 @@
-from bria_client._version import __version__
-from bria_client.clients import BriaAsyncClient, BriaSyncClient
+from typing import TYPE_CHECKING
+
+from bria_client._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from bria_client._version import __version__
+    from bria_client.clients import BriaAsyncClient, BriaSyncClient
 
 __all__ = ["BriaSyncClient", "BriaAsyncClient", "__version__"]
+
+# The exports are imported on first access, importing the package alone stays cheap
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BriaAsyncClient": "bria_client.clients",
+        "BriaSyncClient": "bria_client.clients",
+        "__version__": "bria_client._version",
+    },
+)
@@ -0,0 +1,38 @@
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_attributes(package: str, attributes: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    The module level `__getattr__` / `__dir__` of a package re-exporting `attributes` (name -> module) without importing
+    their modules until first accessed, so importing the package does not pull in their dependencies.
+
+    Usage (in the package `__init__.py`):
+    >>> __getattr__, __dir__ = lazy_attributes(__name__, {"Image": "bria_client.toolkit.image"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # Set on the package, later accesses do not go through `__getattr__`
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *attributes})
+
+    return __getattr__, __dir__
+
+
+def if_imported(module: str, name: str) -> Any | None:
+    """
+    `module.name` when `module` was already imported, `None` otherwise (without importing it).
+
+    E.g. no `Image` value can exist before `bria_client.toolkit.image` is imported, so payloads are only searched for images once it is.
+    """
+    loaded = sys.modules.get(module)
+    return None if loaded is None else getattr(loaded, name, None)
@@ -1,5 +1,62 @@
-from bria_client.clients.async_client import BriaAsyncClient
-from bria_client.clients.settings import BriaSettings
-from bria_client.clients.sync_client import BriaSyncClient
+from typing import TYPE_CHECKING
 
-__all__ = ["BriaSyncClient", "BriaAsyncClient", "BriaSettings"]
+from bria_client._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from bria_client.clients.async_client import BriaAsyncClient
+    from bria_client.clients.download_cache import DownloadCache
+    from bria_client.clients.polling import (
+        CompletionTimeModel,
+        DecorrelatedJitter,
+        ExponentialBackoff,
+        FixedInterval,
+        LearnedSchedule,
+        PollingStrategy,
+        ServerHinted,
+    )
+    from bria_client.clients.result_cache import BaseResultCache, CacheStats, MemoryResultCache, SQLiteResultCache
+    from bria_client.clients.settings import BriaSettings
+    from bria_client.clients.sync_client import BriaSyncClient
+    from bria_client.clients.upload_cache import UploadCache
+
+__all__ = [
+    "BriaSyncClient",
+    "BriaAsyncClient",
+    "BriaSettings",
+    "PollingStrategy",
+    "FixedInterval",
+    "ExponentialBackoff",
+    "DecorrelatedJitter",
+    "ServerHinted",
+    "LearnedSchedule",
+    "CompletionTimeModel",
+    "BaseResultCache",
+    "MemoryResultCache",
+    "SQLiteResultCache",
+    "CacheStats",
+    "UploadCache",
+    "DownloadCache",
+]
+
+# The exports are imported on first access, importing the package alone stays cheap
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BriaAsyncClient": "bria_client.clients.async_client",
+        "DownloadCache": "bria_client.clients.download_cache",
+        "CompletionTimeModel": "bria_client.clients.polling",
+        "DecorrelatedJitter": "bria_client.clients.polling",
+        "ExponentialBackoff": "bria_client.clients.polling",
+        "FixedInterval": "bria_client.clients.polling",
+        "LearnedSchedule": "bria_client.clients.polling",
+        "PollingStrategy": "bria_client.clients.polling",
+        "ServerHinted": "bria_client.clients.polling",
+        "BaseResultCache": "bria_client.clients.result_cache",
+        "CacheStats": "bria_client.clients.result_cache",
+        "MemoryResultCache": "bria_client.clients.result_cache",
+        "SQLiteResultCache": "bria_client.clients.result_cache",
+        "BriaSettings": "bria_client.clients.settings",
+        "BriaSyncClient": "bria_client.clients.sync_client",
+        "UploadCache": "bria_client.clients.upload_cache",
+    },
+)
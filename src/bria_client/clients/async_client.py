@@ -1,26 +1,42 @@
 import asyncio
 import logging
+import os
+import threading
 import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 from httpx_retries import Retry
 
 from bria_client.clients.base import BaseBriaClient
+from bria_client.clients.poller import StatusPoller
+from bria_client.clients.polling import PollingStrategy
+from bria_client.clients.settings import BriaSettings
+from bria_client.clients.upload import DEFAULT_MAX_BYTES_IN_FLIGHT, AsyncByteBudget, ProgressFile, UploadProgressCallback
+from bria_client.clients.upload_cache import file_digest
 from bria_client.engines.base import AsyncHTTPRequest
 from bria_client.toolkit import BriaResponse
-from bria_client.toolkit.errors.exception import BriaException
 from bria_client.toolkit.models import Status
 
+if TYPE_CHECKING:
+    from PIL import Image as PilImage
+
 logger = logging.getLogger(__name__)
 
 
 class BriaAsyncClient(BaseBriaClient):
     """Asynchronous Bria API client"""
 
-    def _setup_http_client(self, retry: Retry | None) -> None:
+    def _setup_http_client(self, retry: Retry | None, settings: BriaSettings) -> None:
         """Set up the asynchronous HTTP client"""
-        self.engine.set_http_client(http_client=AsyncHTTPRequest(retry=retry))
+        self.engine.set_http_client(http_client=AsyncHTTPRequest(retry=retry, **self._http_request_options(settings)))
+        # One status poller per event loop, shared by every `.map()` call running on that loop
+        self._pollers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, StatusPoller] = weakref.WeakKeyDictionary()
+        self._pollers_lock = threading.Lock()
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -32,6 +48,11 @@ class BriaAsyncClient(BaseBriaClient):
 
     async def aclose(self) -> None:
         """Close the async HTTP client"""
+        with self._pollers_lock:
+            pollers = list(self._pollers.values())
+            self._pollers.clear()
+        for poller in pollers:
+            await poller.aclose()
         if isinstance(self.engine.client, AsyncHTTPRequest):
             await self.engine.client.close()
 
@@ -51,7 +72,16 @@ class BriaAsyncClient(BaseBriaClient):
         """
         self._validate_run_payload(payload)
         # Unpack payload and headers to avoid mutating the original input
-        bria_response = await self.engine.post_async(endpoint=endpoint, payload={**payload, "sync": True}, headers={**(headers or {})}, **kwargs)
+        payload = {**payload, "sync": True}
+        cache_key = None
+        if self.result_cache is not None:
+            # Hashing encodes the payload images, keep it off the event loop
+            loop = asyncio.get_running_loop()
+            cache_key = await loop.run_in_executor(self.engine.image_executor, self._result_cache_key, endpoint, payload, kwargs)
+            if (cached_response := self.result_cache.get(cache_key)) is not None:
+                return cached_response
+        bria_response = await self.engine.post_async(endpoint=endpoint, payload=payload, headers={**(headers or {})}, **kwargs)
+        self._cache_result(cache_key, bria_response)
         if raise_for_status:
             bria_response.raise_for_status()
         return bria_response
@@ -65,7 +95,8 @@ class BriaAsyncClient(BaseBriaClient):
             payload: Request payload
             headers: Optional headers
             raise_for_status: Whether to raise exception on error status
-            webhook_url: Optional URL to receive a POST when the job reaches a terminal state.
+            webhook_url: Optional URL to receive a POST when the job reaches a terminal state
+                         (defaults to the URL of the client's ``webhook_receiver``).
                          Bria will sign the request with HMAC-SHA256; use
                          ``verify_webhook_signature`` from ``bria_client.toolkit`` to verify on receipt.
             **kwargs: Additional arguments (e.g., api_token)
@@ -75,9 +106,12 @@ class BriaAsyncClient(BaseBriaClient):
         """
         self._validate_submit_payload(payload)
         merged_payload = {**payload, "sync": False}
+        webhook_url = self._resolve_webhook_url(payload, webhook_url)
         if webhook_url is not None:
             merged_payload["webhook_url"] = webhook_url
         bria_response = await self.engine.post_async(endpoint=endpoint, payload=merged_payload, headers={**(headers or {})}, **kwargs)
+        self._record_submission(endpoint, bria_response)
+        self._expect_delivery(webhook_url, bria_response)
         if raise_for_status:
             bria_response.raise_for_status()
         return bria_response
@@ -102,7 +136,7 @@ class BriaAsyncClient(BaseBriaClient):
             bria_response.raise_for_status()
         return bria_response
 
-    async def upload(self, path: str | Path, media_type: str, headers: dict | None = None, **kwargs) -> str:
+    async def upload(self, path: str | Path, media_type: str, headers: dict | None = None, *, progress: UploadProgressCallback | None = None, **kwargs) -> str:
         """
         Upload a local file to Bria's storage and return a URL ready for use in API calls.
 
@@ -114,6 +148,7 @@ class BriaAsyncClient(BaseBriaClient):
                         which affects how web clients retrieve and render it.
                         Only "video/*" types are currently accepted.
             headers: Optional extra headers forwarded to the Bria API request.
+            progress: Optional callback called with ``(bytes_sent, total_bytes)`` while the file is sent.
             **kwargs: Additional arguments forwarded to the Bria API call (e.g., api_token).
 
         Returns:
@@ -124,8 +159,28 @@ class BriaAsyncClient(BaseBriaClient):
             NotImplementedError: If media_type is not a video type.
             BriaException: If the Bria API request or the file upload fails.
         """
-        if not media_type.startswith("video/"):
-            raise NotImplementedError(f"Upload not yet supported for media type: {media_type!r}")
+        self._validate_upload_media_type(media_type)
+        return await self._upload(path, media_type, headers, progress, kwargs)
+
+    async def _upload(
+        self,
+        path: str | Path,
+        media_type: str,
+        headers: dict | None,
+        progress: UploadProgressCallback | None,
+        kwargs: dict,
+        transfer_slot: Callable[[], AbstractAsyncContextManager] = nullcontext,
+    ) -> str:
+        """Upload one file: reuse a cached upload, or request an upload target and send the file within `transfer_slot()`"""
+        # Imported on use, werkzeug is only needed to report failures
+        from bria_client.toolkit.errors.exception import BriaException
+
+        digest, identity = None, None
+        if self.upload_cache is not None:
+            digest, identity = await asyncio.to_thread(file_digest, path), self._auth_identity(kwargs)
+            if (file_url := self.upload_cache.get(digest, media_type, identity)) is not None:
+                return file_url
+        issued_at = time.time()
         bria_response = await self.engine.post_async(
             endpoint="video/upload",
             payload={"media_type": media_type},
@@ -136,18 +191,220 @@ class BriaAsyncClient(BaseBriaClient):
         result = bria_response.result
         assert result is not None
         path = Path(path)
-        with path.open("rb") as f:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    result.upload_url,
-                    data={**result.upload_fields, "Content-Type": media_type},
-                    files={"file": (path.name, f, media_type)},
-                    timeout=None,
-                )
+        progress = self._upload_progress(path, progress)
+        assert isinstance(self.engine.client, AsyncHTTPRequest)
+        async with transfer_slot():
+            with path.open("rb") as f:
+                try:
+                    response = await self.engine.client.upload(
+                        result.upload_url,
+                        data={**result.upload_fields, "Content-Type": media_type},
+                        files={"file": (path.name, ProgressFile(f, progress) if progress is not None else f, media_type)},
+                    )
+                except httpx.TransportError as e:
+                    raise BriaException(status_code=503, message="Upload failed", details=str(e)) from e
         if response.status_code != 204:
             raise BriaException(status_code=response.status_code, message="Upload failed", details=response.text)
+        if self.upload_cache is not None and digest is not None:
+            self.upload_cache.set(digest, media_type, result.file_url, identity, issued_at=issued_at)
         return result.file_url
 
+    async def fetch_image(self, url: str, headers: dict | None = None) -> "PilImage.Image":
+        """
+        Download an image (e.g. a result URL) and decode it, through the pooled storage connections of the running event loop.
+        The image is decoded in the engine's image thread pool, not on the event loop.
+
+        With a `download_cache`, an image already downloaded is only revalidated (`If-None-Match`) and reused when unchanged.
+
+        Args:
+            url: The image URL.
+            headers: Optional headers sent with the download (e.g. authorization of a private bucket).
+
+        Returns:
+            PIL.Image.Image: The decoded image.
+
+        Raises:
+            BriaException: If the download fails.
+        """
+        # Imported on use, werkzeug is only needed to report failures and Pillow to decode
+        from bria_client.toolkit.errors.exception import BriaException
+        from bria_client.toolkit.image import Image
+
+        # The disk side of the cache is read / written off the event loop
+        on_disk = self.download_cache is not None and self.download_cache.directory is not None
+        cached = await asyncio.to_thread(self._cached_download, url) if on_disk else self._cached_download(url)
+        assert isinstance(self.engine.client, AsyncHTTPRequest)
+        try:
+            download = await self.engine.client.download(url, headers=headers, etag=cached[0] if cached is not None else None)
+        except httpx.HTTPStatusError as e:
+            raise BriaException(status_code=e.response.status_code, message="Download failed", details=url) from e
+        except httpx.TransportError as e:
+            raise BriaException(status_code=503, message="Download failed", details=str(e)) from e
+        body = await asyncio.to_thread(self._downloaded_body, url, cached, download) if on_disk else self._downloaded_body(url, cached, download)
+        return await asyncio.get_running_loop().run_in_executor(self.engine.image_executor, Image._bytes_2_pil, body)
+
+    async def upload_many(
+        self,
+        paths: Iterable[str | Path],
+        media_type: str,
+        concurrency: int = 8,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> dict[str | Path, str | Exception]:
+        """
+        Upload many local files, overlapping the upload target requests of the next files with the transfers of the current ones.
+
+        Args:
+            paths: Local paths of the files.
+            media_type: MIME type of every file (e.g. "video/mp4"). Only "video/*" types are currently accepted.
+            concurrency: Maximum number of files transferred at the same time (as many upload targets are requested ahead).
+            max_bytes_in_flight: Maximum total size of the files transferred at the same time.
+            headers: Optional extra headers forwarded to the Bria API requests.
+            **kwargs: Additional arguments forwarded to the Bria API calls (e.g., api_token).
+
+        Returns:
+            dict[str | Path, str | Exception]: The file URL of each path, or the exception its upload failed with.
+
+        Raises:
+            NotImplementedError: If media_type is not a video type.
+        """
+        self._validate_upload_media_type(media_type)
+        paths = list(paths)
+        # Twice as many files in progress as transfers: while `concurrency` files are sent, the others fetch their upload target
+        in_progress = asyncio.Semaphore(2 * concurrency)
+        transfers = asyncio.Semaphore(concurrency)
+        budget = AsyncByteBudget(max_bytes_in_flight)
+
+        @asynccontextmanager
+        async def transfer_slot(path: str | Path) -> AsyncIterator[None]:
+            async with budget.reserve(os.path.getsize(path)), transfers:
+                yield
+
+        async def upload_one(path: str | Path) -> str | Exception:
+            async with in_progress:
+                try:
+                    return await self._upload(path, media_type, headers, None, kwargs, lambda: transfer_slot(path))
+                except Exception as e:
+                    return e
+
+        return dict(zip(paths, await asyncio.gather(*(upload_one(path) for path in paths)), strict=True))
+
+    async def map(
+        self,
+        endpoint: str,
+        payloads: Iterable[dict],
+        concurrency: int = 16,
+        headers: dict | None = None,
+        interval: int | float | None = None,
+        timeout: int = 60,
+        raise_for_status: bool = False,
+        *,
+        strategy: PollingStrategy | None = None,
+        **kwargs,
+    ) -> list[BriaResponse]:
+        """
+        Submit many requests to the same endpoint and wait for all of them to complete.
+
+        Status checks of all outstanding jobs are multiplexed through a single poller instead of one polling loop per job.
+
+        Args:
+            endpoint: API endpoint to call
+            payloads: Request payloads, one per job
+            concurrency: Maximum number of jobs submitted and not yet completed at the same time
+            headers: Optional headers
+            interval: Fixed polling interval in seconds (when omitted, polling starts fast and backs off)
+            timeout: Per-job timeout in seconds, measured from the job's submission
+            raise_for_status: Whether to raise exception on error status
+            strategy: Polling strategy to use instead of a fixed interval (keyword-only)
+            **kwargs: Additional arguments (e.g., api_token)
+
+        Returns:
+            list[BriaResponse]: The final responses, in the same order as `payloads`
+
+        Raises:
+            TimeoutError: If a job does not complete within `timeout`, the jobs not completed yet are no longer tracked
+                and the payloads not submitted yet are not submitted
+        """
+        payloads = list(payloads)
+        for payload in payloads:
+            self._validate_submit_payload(payload)
+        poller = self._get_status_poller()
+        polling_strategy = self._resolve_polling_strategy(interval, strategy)
+        in_flight = asyncio.Semaphore(concurrency)
+
+        tasks: list[asyncio.Task] = []
+
+        def stop() -> None:
+            # The caller can no longer see the other jobs, stop tracking them and submitting the payloads waiting for a slot
+            for task in tasks:
+                task.cancel()
+
+        async def submit_and_track(payload: dict) -> BriaResponse:
+            try:
+                async with in_flight:
+                    bria_response = await self.submit(endpoint=endpoint, payload=payload, headers=headers, **kwargs)
+                    if bria_response.in_progress:
+                        bria_response = await self._track(poller, bria_response.request_id, headers, timeout, polling_strategy, kwargs)
+                        self._record_completion(bria_response)
+                if raise_for_status:
+                    bria_response.raise_for_status()
+                return bria_response
+            except Exception:
+                # Before the freed slot wakes up the next submit
+                stop()
+                raise
+
+        tasks.extend(asyncio.ensure_future(submit_and_track(payload)) for payload in payloads)
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            stop()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _track(
+        self, poller: StatusPoller, request_id: str, headers: dict | None, timeout: float, strategy: PollingStrategy, kwargs: dict
+    ) -> BriaResponse:
+        """
+        Wait for the final response of a submitted job: its webhook delivery when one is expected, status checks by the poller
+        once the delivery is late (or right away without webhook)
+        """
+        pending = self._pending_delivery(request_id)
+        if pending is None:
+            return await poller.track(request_id, headers=headers, timeout=timeout, strategy=strategy, **kwargs)
+        try:
+            waited = min(pending.late_in(), timeout)
+            if (delivered := await pending.wait_async(waited)) is not None:
+                return delivered
+            tracked = poller.track(request_id, headers=headers, timeout=timeout - waited, strategy=strategy, **kwargs)
+            # Shielded: the delivery is shared with the other waiters of the job
+            delivery = asyncio.shield(asyncio.wrap_future(pending.future))
+            try:
+                await asyncio.wait({tracked, delivery}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                # The poller drops the cancelled requests
+                tracked.cancel()
+                delivery.cancel()
+            return delivery.result() if delivery.done() and not delivery.cancelled() else tracked.result()
+        finally:
+            self._forget_delivery(request_id)
+
+    def _get_status_poller(self) -> StatusPoller:
+        """
+        Get the status poller of the current event loop, create one only if needed.
+
+        Returns:
+            `StatusPoller` - The status poller for the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._pollers_lock:
+            poller = self._pollers.get(loop)
+            if poller is None:
+                poller = StatusPoller(engine=self.engine, on_progress=self._record_progress)
+                self._pollers[loop] = poller
+        return poller
+
     async def status(self, request_id: str, headers: dict | None = None, **kwargs):
         """
         Get the status of a request
@@ -167,12 +424,13 @@ class BriaAsyncClient(BaseBriaClient):
         self,
         target: str | BriaResponse | None = None,
         headers: dict | None = None,
-        interval: int | float = 1,
+        interval: int | float | None = None,
         timeout: int = 60,
         raise_for_status: bool = True,
         *,
         response: BriaResponse | None = None,
         request_id: str | None = None,
+        strategy: PollingStrategy | None = None,
         **kwargs,
     ):
         """
@@ -181,11 +439,12 @@ class BriaAsyncClient(BaseBriaClient):
         Args:
             target: Request ID string or BriaResponse object
             headers: Optional headers
-            interval: Polling interval in seconds
+            interval: Fixed polling interval in seconds (when omitted, polling starts fast and backs off)
             timeout: Timeout in seconds
             raise_for_status: Whether to raise exception on error status
             response: Alternative way to pass BriaResponse (keyword-only)
             request_id: Alternative way to pass request_id (keyword-only)
+            strategy: Polling strategy to use instead of a fixed interval (keyword-only)
             **kwargs: Additional arguments (e.g., api_token)
 
         Returns:
@@ -197,19 +456,52 @@ class BriaAsyncClient(BaseBriaClient):
         extracted_id = self._extract_request_id(target, response, request_id)
 
         headers = {**(headers or {})}
+        polling_strategy = self._resolve_polling_strategy(interval, strategy)
+
+        pending = self._pending_delivery(extracted_id)
 
         async def call_status_service():
             return await self.engine.get_async(endpoint=f"status/{extracted_id}", headers=headers, **kwargs)
 
-        bria_response = await call_status_service()
-        start_time = time.time()
-        while bria_response.in_progress or bria_response.status == Status.UNKNOWN:
-            logger.debug(f"Polling request ID: {extracted_id}, current status: {bria_response.status}")
-            await asyncio.sleep(interval)
-            bria_response = await call_status_service()
-            if time.time() - start_time >= timeout:
-                raise TimeoutError("Timeout reached while waiting for status request")
+        async def wait_for_status(delay: float) -> BriaResponse:
+            # The webhook delivery of the job, when expected and received within the delay, replaces the status call
+            if pending is None:
+                await asyncio.sleep(delay)
+            elif (delivered := await pending.wait_async(delay)) is not None:
+                return delivered
+            return await call_status_service()
 
+        start_time = time.time()
+        initial_delay = polling_strategy.initial_delay(extracted_id)
+        if pending is not None:
+            # The status is only polled once the delivery is late
+            initial_delay = max(initial_delay, pending.late_in())
+        try:
+            # Whether the last check was made at the deadline
+            at_deadline = initial_delay >= timeout
+            if (initial_delay := min(initial_delay, timeout)) > 0:
+                bria_response = await wait_for_status(initial_delay)
+            else:
+                bria_response = await call_status_service()
+            attempt, delay = 1, None
+            while bria_response.in_progress or bria_response.status == Status.UNKNOWN:
+                # No wait goes past the deadline, the job timed out only when it is still running at the check made there
+                if at_deadline:
+                    raise TimeoutError("Timeout reached while waiting for status request")
+                logger.debug(f"Polling request ID: {extracted_id}, current status: {bria_response.status}")
+                self._record_progress(bria_response)
+                delay = polling_strategy.next_delay(attempt, delay, bria_response)
+                self._emit_poll_tick(extracted_id, attempt, bria_response, delay)
+                remaining = max(0.0, timeout - (time.time() - start_time))
+                at_deadline = delay >= remaining
+                bria_response = await wait_for_status(min(delay, remaining))
+                attempt += 1
+        finally:
+            if pending is not None:
+                self._forget_delivery(extracted_id)
+
+        self._emit_poll_tick(extracted_id, attempt, bria_response, None)
+        self._record_completion(bria_response)
         if raise_for_status:
             bria_response.raise_for_status()
         return bria_response
@@ -1,11 +1,28 @@
 import logging
 import warnings
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from httpx_retries import Retry
 
+from bria_client.clients.download_cache import DownloadCache
+from bria_client.clients.polling import CompletionTimeModel, LearnedSchedule, PollingStrategy, resolve_polling_strategy
+from bria_client.clients.settings import BriaSettings
+from bria_client.clients.upload import UploadProgressCallback
+from bria_client.clients.upload_cache import UploadCache
 from bria_client.engines import ApiEngine, BriaEngine
+from bria_client.engines.events import EventHooks, PollTick, UploadProgress
+from bria_client.engines.rate_limiter import BaseRateLimiter
+from bria_client.engines.single_flight import SingleFlight
 from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.download import Download
+from bria_client.toolkit.models import Status
+from bria_client.toolkit.webhook_receiver import PendingDelivery, WebhookReceiver
+
+if TYPE_CHECKING:
+    from bria_client.clients.result_cache import BaseResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +39,84 @@ class BaseBriaClient(ABC):
         retry: Retry | None = None,
         *,
         api_engine: ApiEngine | None = None,
+        rate_limiter: BaseRateLimiter | None = None,
+        result_cache: "BaseResultCache | None" = None,
+        upload_cache: UploadCache | None = None,
+        download_cache: DownloadCache | None = None,
+        event_hooks: Iterable[EventHooks] | None = None,
+        single_flight: SingleFlight | bool = True,
+        webhook_receiver: WebhookReceiver | None = None,
+        http2: bool | None = None,
+        request_timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        endpoint_timeouts: dict[str, float] | None = None,
+        settings: BriaSettings | None = None,
     ):
         if (base_url is not None or api_token is not None) and api_engine is not None:
             warnings.warn("ApiEngine is provided..., Other input parameters will be ignored")
 
         self.engine = api_engine or BriaEngine(base_url=base_url.rstrip("/") if base_url else None, api_token=api_token)
-        self._setup_http_client(retry or Retry(total=3, backoff_factor=2))
+        # Transport settings from the environment (`BRIA_*`) or `settings`, overridden by the explicit arguments
+        overrides = {
+            "http2": http2,
+            "request_timeout": request_timeout,
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "endpoint_timeouts": endpoint_timeouts,
+        }
+        settings = settings or BriaSettings()
+        self.settings = settings.model_copy(update={name: value for name, value in overrides.items() if value is not None})
+        self._setup_http_client(retry or Retry(total=3, backoff_factor=2), self.settings)
+        if rate_limiter is not None:
+            self.engine.set_rate_limiter(rate_limiter)
+        for hooks in event_hooks or ():
+            self.engine.add_event_hooks(hooks)
+        # `True` keeps the engine's default (identical status polls in flight share one request), `False` turns it off
+        if single_flight is not True:
+            self.engine.set_single_flight(single_flight if isinstance(single_flight, SingleFlight) else None)
+        # Learns how long jobs of each endpoint take, to schedule the first status call of `.poll()`
+        self.completion_model = CompletionTimeModel()
+        # Completed `.run()` responses, returned again for identical requests without calling the API (opt-in)
+        self.result_cache = result_cache
+        # `file_url`s of files already uploaded, returned again by `.upload()` for the same content (opt-in)
+        self.upload_cache = upload_cache
+        # Bodies of the URLs fetched by `.fetch_image()`, revalidated with their `ETag` instead of downloaded again (opt-in)
+        self.download_cache = download_cache
+        # Resolves the jobs submitted with its URL as their `webhook_url`, `.poll()` then waits for their delivery (opt-in)
+        self.webhook_receiver = webhook_receiver
 
     @abstractmethod
-    def _setup_http_client(self, retry: Retry | None) -> None:
+    def _setup_http_client(self, retry: Retry | None, settings: BriaSettings) -> None:
         """Set up the HTTP client for this client instance"""
         pass
 
+    @staticmethod
+    def _http_request_options(settings: BriaSettings) -> dict:
+        """The `SyncHTTPRequest` / `AsyncHTTPRequest` arguments configured by `settings`"""
+        return {
+            "request_timeout": settings.request_timeout,
+            "timeout": settings.timeout,
+            # Left to the http client otherwise, which sizes the pool by `http2_max_connections` over HTTP/2
+            "limits": settings.limits if settings.limits_set else None,
+            "endpoint_timeouts": settings.endpoint_timeouts,
+            "http2": settings.http2,
+            "http2_max_connections": settings.http2_max_connections,
+        }
+
+    def _cached_download(self, url: str) -> tuple[str, bytes] | None:
+        """The `(etag, body)` of `url` kept by the download cache"""
+        return self.download_cache.get(url) if self.download_cache is not None else None
+
+    def _downloaded_body(self, url: str, cached: tuple[str, bytes] | None, download: Download) -> bytes | memoryview:
+        """The body of a download, the cached one when it was not modified, caching the new ones"""
+        if download.body is None:
+            assert cached is not None
+            return cached[1]
+        if self.download_cache is not None and download.etag is not None:
+            self.download_cache.set(url, download.etag, download.body)
+        return download.body
+
     @staticmethod
     def _validate_run_payload(payload: dict) -> None:
         """Validate payload for .run() method"""
@@ -44,6 +127,88 @@ class BaseBriaClient(ABC):
         """Validate payload for .submit() method"""
         assert "sync" not in payload, ".submit() always runs in sync=False (to use sync call .run())"
 
+    @staticmethod
+    def _validate_upload_media_type(media_type: str) -> None:
+        """Validate the media type of .upload() / .upload_many()"""
+        if not media_type.startswith("video/"):
+            raise NotImplementedError(f"Upload not yet supported for media type: {media_type!r}")
+
+    def _resolve_polling_strategy(self, interval: int | float | None, strategy: PollingStrategy | None) -> PollingStrategy:
+        """Resolve the polling strategy of a `.poll()` call, defaulting to the schedule learned from previous jobs"""
+        return resolve_polling_strategy(interval, strategy, default=LearnedSchedule(self.completion_model))
+
+    def _emit_poll_tick(self, request_id: str, attempt: int, bria_response: BriaResponse, next_delay: float | None) -> None:
+        if self.engine.events:
+            event = PollTick(request_id=request_id, attempt=attempt, status=str(bria_response.status), next_delay=next_delay)
+            self.engine.events.emit("on_poll_tick", event)
+
+    def _upload_progress(self, path: str | Path, progress: UploadProgressCallback | None) -> UploadProgressCallback | None:
+        """The progress callback of an upload, also reporting it to the event hooks"""
+        if not self.engine.events:
+            return progress
+
+        def report(bytes_sent: int, total_bytes: int) -> None:
+            self.engine.events.emit("on_upload_progress", UploadProgress(path=str(path), bytes_sent=bytes_sent, total_bytes=total_bytes))
+            if progress is not None:
+                progress(bytes_sent, total_bytes)
+
+        return report
+
+    def _record_submission(self, endpoint: str, bria_response: BriaResponse) -> None:
+        """Remember when a job was submitted and to which (normalized) endpoint"""
+        if bria_response.in_progress:
+            self.completion_model.record_submission(bria_response.request_id, self.engine._prepare_endpoint(endpoint))
+
+    def _record_progress(self, bria_response: BriaResponse) -> None:
+        """Remember that a job was seen running, its completion time is bounded by the last such check"""
+        if bria_response.in_progress:
+            self.completion_model.record_progress(bria_response.request_id)
+
+    def _record_completion(self, bria_response: BriaResponse) -> None:
+        """Add the duration of a completed job to its endpoint's history"""
+        if bria_response.status == Status.COMPLETED:
+            self.completion_model.record_completion(bria_response.request_id)
+
+    def _resolve_webhook_url(self, payload: dict, webhook_url: str | None) -> str | None:
+        """The `webhook_url` of a submission (argument first, then payload), defaulting to the URL of the webhook receiver"""
+        webhook_url = webhook_url if webhook_url is not None else payload.get("webhook_url")
+        if webhook_url is None and self.webhook_receiver is not None:
+            return self.webhook_receiver.url
+        return webhook_url
+
+    def _expect_delivery(self, webhook_url: str | None, bria_response: BriaResponse) -> None:
+        """Register a submitted job with the webhook receiver when its delivery goes to the receiver"""
+        if self.webhook_receiver is not None and webhook_url == self.webhook_receiver.url and bria_response.in_progress:
+            self.webhook_receiver.expect(bria_response.request_id)
+
+    def _pending_delivery(self, request_id: str) -> PendingDelivery | None:
+        """The webhook delivery expected for `request_id`, if any"""
+        if self.webhook_receiver is None:
+            return None
+        return self.webhook_receiver.pending(request_id)
+
+    def _forget_delivery(self, request_id: str) -> None:
+        if self.webhook_receiver is not None:
+            self.webhook_receiver.forget(request_id)
+
+    def _result_cache_key(self, endpoint: str, payload: dict, kwargs: dict) -> str:
+        """The cache key of a `.run()` call: its endpoint, prepared payload and auth identity"""
+        # Imported only once a result cache is used, the module loads sqlite3
+        from bria_client.clients.result_cache import result_cache_key
+
+        prepared_payload = self.engine._prepare_payload(payload) or {}
+        return result_cache_key(self.engine._prepare_endpoint(endpoint), prepared_payload, self._auth_identity(kwargs))
+
+    def _auth_identity(self, kwargs: dict) -> str:
+        """The auth identity a call with these kwargs is made with"""
+        # Copied since resolving the auth override pops it from the kwargs
+        return self.engine._auth_identity(self.engine._check_auth_override(kwargs={**kwargs}))
+
+    def _cache_result(self, cache_key: str | None, bria_response: BriaResponse) -> None:
+        """Only completed responses are cached, errors are always retried"""
+        if self.result_cache is not None and cache_key is not None and bria_response.status == Status.COMPLETED:
+            self.result_cache.set(cache_key, bria_response)
+
     @staticmethod
     def _extract_request_id(target: str | BriaResponse | None, response: BriaResponse | None = None, request_id: str | None = None) -> str:
         """Extract request_id from various input formats"""
@@ -0,0 +1,133 @@
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class DownloadCache:
+    """
+    Bodies of downloaded URLs (e.g. images fetched for local preprocessing), keyed by URL and `ETag`.
+
+    Only responses with an `ETag` are cached. A cached URL is revalidated on every download (`If-None-Match`), and its body
+    is reused when the server answers `304 Not Modified`, so a changed resource is never served stale.
+
+    Entries are kept in memory up to `max_bytes` (least recently used forgotten first) and, with a `directory`, on disk too,
+    where they outlive the process. Safe to share across threads and clients.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, directory: str | Path | None = None, max_disk_bytes: int = 1024 * 1024 * 1024) -> None:
+        """
+        Args:
+            `max_bytes: int` - Total size of the bodies kept in memory
+            `directory: str | Path | None` - Where to also keep the bodies on disk (memory only by default)
+            `max_disk_bytes: int` - Total size of the bodies kept on disk
+        """
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # Sizes of the files on disk, oldest first: scanned once, then kept up to date by the saves of this cache
+        self._files: OrderedDict[Path, int] = OrderedDict()
+        self._disk_size = 0
+        self._disk_lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> tuple[str, bytes] | None:
+        """The `(etag, body)` last downloaded from `url`, if cached"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+        entry = self._load(url)
+        if entry is not None:
+            self._remember(url, *entry)
+        return entry
+
+    def set(self, url: str, etag: str, body: bytes | memoryview) -> None:
+        body = bytes(body)
+        self._remember(url, etag, body)
+        self._save(url, etag, body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.directory is not None:
+            with self._disk_lock:
+                self._files.clear()
+                self._disk_size = 0
+            for path in self.directory.glob("*.body"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, url: str, etag: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(url, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+            self._entries[url] = (etag, body)
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _path(self, url: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.body"
+
+    def _load(self, url: str) -> tuple[str, bytes] | None:
+        if self.directory is None:
+            return None
+        path = self._path(url)
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        with self._disk_lock:
+            if path in self._files:
+                self._files.move_to_end(path)
+        # `<etag>\n<body>`, an ETag never holds a line break
+        etag, _, body = content.partition(b"\n")
+        return etag.decode("utf-8"), body
+
+    def _save(self, url: str, etag: str, body: bytes) -> None:
+        if self.directory is None or len(body) > self.max_disk_bytes:
+            return
+        path = self._path(url)
+        # Written aside then renamed, so a concurrent reader (thread or process) never sees a partial file
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+            f.write(etag.encode("utf-8") + b"\n")
+            f.write(body)
+        Path(f.name).replace(path)
+        size = len(etag.encode("utf-8")) + 1 + len(body)
+        with self._disk_lock:
+            self._disk_size += size - self._files.pop(path, 0)
+            self._files[path] = size
+            while self._disk_size > self.max_disk_bytes and self._files:
+                evicted, evicted_size = self._files.popitem(last=False)
+                self._disk_size -= evicted_size
+                evicted.unlink(missing_ok=True)
+
+    def _scan_disk(self) -> None:
+        assert self.directory is not None
+        files = []
+        for path in self.directory.glob("*.body"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process meanwhile
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(files):
+            self._files[path] = size
+            self._disk_size += size
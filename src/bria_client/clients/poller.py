@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from bria_client.clients.polling import PollingStrategy, resolve_polling_strategy
+from bria_client.engines import ApiEngine
+from bria_client.engines.events import PollTick
+from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.models import Status
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PollEntry:
+    request_id: str
+    future: asyncio.Future
+    started_at: float
+    strategy: PollingStrategy
+    timeout: float
+    attempt: int = 0
+    previous_delay: float | None = None
+    headers: dict = field(default_factory=dict)
+    kwargs: dict = field(default_factory=dict)
+
+
+class StatusPoller:
+    """
+    Owns many outstanding request_ids and checks their status from one shared schedule.
+
+    Instead of one polling coroutine per job, every tracked request is pushed to a priority queue ordered by its next due time.
+    A single background task wakes up for the earliest due entry, issues the status call (at most `max_concurrent_checks` at once)
+    and either resolves the job's future or reschedules it.
+
+    A poller is bound to the event loop it was created on.
+    """
+
+    def __init__(self, engine: ApiEngine, max_concurrent_checks: int = 16, on_progress: Callable[[BriaResponse], None] | None = None) -> None:
+        """
+        Args:
+            `engine: ApiEngine` - The engine used to call the `status/` endpoint
+            `max_concurrent_checks: int` - Maximum number of status calls in flight at the same time
+            `on_progress: Callable[[BriaResponse], None] | None` - Called with every status response of a job still running
+        """
+        self.engine = engine
+        self.on_progress = on_progress
+        self._loop = asyncio.get_running_loop()
+        self._queue: list[tuple[float, int, _PollEntry]] = []
+        self._counter = itertools.count()
+        self._slots = asyncio.Semaphore(max_concurrent_checks)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._checks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        """Number of requests waiting for their next status check"""
+        return len(self._queue)
+
+    def track(
+        self,
+        request_id: str,
+        headers: dict | None = None,
+        interval: int | float | None = None,
+        timeout: int | float = 60,
+        *,
+        strategy: PollingStrategy | None = None,
+        **kwargs,
+    ) -> "asyncio.Future[BriaResponse]":
+        """
+        Start tracking a submitted request.
+
+        Args:
+            `request_id: str` - The request to track
+            `headers: dict | None` - Optional headers for the status calls
+            `interval: int | float | None` - Fixed seconds between status checks of this request
+            `timeout: int | float` - Seconds after which the future fails with `TimeoutError`
+            `strategy: PollingStrategy | None` - Polling strategy, takes precedence over `interval` (defaults to backoff)
+            `**kwargs` - Additional arguments for the status calls (e.g., api_token)
+
+        Returns:
+            `asyncio.Future[BriaResponse]` - Resolved with the final response once the request leaves the running state
+        """
+        entry = _PollEntry(
+            request_id=request_id,
+            future=self._loop.create_future(),
+            started_at=self._loop.time(),
+            strategy=resolve_polling_strategy(interval, strategy),
+            timeout=timeout,
+            headers={**(headers or {})},
+            kwargs=kwargs,
+        )
+        # No delay goes past the timeout, the last check happens at the deadline
+        self._schedule(entry, delay=min(entry.strategy.initial_delay(request_id), timeout))
+        return entry.future
+
+    async def aclose(self) -> None:
+        """Stop the poller and cancel every pending future"""
+        if self._task is not None:
+            self._task.cancel()
+        for task in list(self._checks):
+            task.cancel()
+        for _, _, entry in self._queue:
+            entry.future.cancel()
+        self._queue.clear()
+        await asyncio.gather(*self._checks, return_exceptions=True)
+
+    def _schedule(self, entry: _PollEntry, delay: float) -> None:
+        heapq.heappush(self._queue, (self._loop.time() + delay, next(self._counter), entry))
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._queue:
+            due_time, _, entry = self._queue[0]
+            delay = due_time - self._loop.time()
+            if delay > 0:
+                # Sleep until the earliest entry is due, or until a new (possibly earlier) entry is scheduled
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._queue)
+            if entry.future.done():
+                # The caller gave up on this request (e.g. cancelled), drop it
+                continue
+            await self._slots.acquire()
+            check = self._loop.create_task(self._check(entry))
+            self._checks.add(check)
+            check.add_done_callback(self._checks.discard)
+
+    async def _check(self, entry: _PollEntry) -> None:
+        try:
+            bria_response = await self.engine.get_async(endpoint=f"status/{entry.request_id}", headers=entry.headers, **entry.kwargs)
+        except Exception as e:
+            if not entry.future.done():
+                entry.future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+
+        if entry.future.done():
+            return
+        if not (bria_response.in_progress or bria_response.status == Status.UNKNOWN):
+            self._emit_tick(entry, bria_response, attempt=entry.attempt + 1, next_delay=None)
+            entry.future.set_result(bria_response)
+            return
+        if self.on_progress is not None and bria_response.in_progress:
+            self.on_progress(bria_response)
+        remaining = entry.timeout - (self._loop.time() - entry.started_at)
+        if remaining <= 0:
+            entry.future.set_exception(TimeoutError("Timeout reached while waiting for status request"))
+            return
+        logger.debug(f"Polling request ID: {entry.request_id}, current status: {bria_response.status}")
+        entry.attempt += 1
+        entry.previous_delay = entry.strategy.next_delay(entry.attempt, entry.previous_delay, bria_response)
+        self._emit_tick(entry, bria_response, attempt=entry.attempt, next_delay=entry.previous_delay)
+        self._schedule(entry, delay=min(entry.previous_delay, remaining))
+
+    def _emit_tick(self, entry: _PollEntry, bria_response: BriaResponse, attempt: int, next_delay: float | None) -> None:
+        if self.engine.events:
+            event = PollTick(request_id=entry.request_id, attempt=attempt, status=str(bria_response.status), next_delay=next_delay)
+            self.engine.events.emit("on_poll_tick", event)
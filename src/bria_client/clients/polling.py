@@ -0,0 +1,239 @@
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
+
+from bria_client.toolkit import BriaResponse
+
+
+class PollingStrategy(ABC):
+    """Decides how long to wait before the next status call of a polled request"""
+
+    def initial_delay(self, request_id: str) -> float:
+        """Seconds to wait before the first status call of `request_id` (no wait by default)"""
+        return 0.0
+
+    @abstractmethod
+    def next_delay(self, attempt: int, previous_delay: float | None, response: BriaResponse) -> float:
+        """
+        Args:
+            `attempt: int` - Number of status calls made so far for this request (starts at 1)
+            `previous_delay: float | None` - The delay returned for the previous attempt, `None` on the first one
+            `response: BriaResponse` - The latest status response
+
+        Returns:
+            `float` - Seconds to wait before the next status call
+        """
+        pass
+
+
+class FixedInterval(PollingStrategy):
+    """Always wait the same interval (the historical `poll(interval=...)` behavior)"""
+
+    def __init__(self, interval: float = 1) -> None:
+        self.interval = interval
+
+    def next_delay(self, attempt: int, previous_delay: float | None, response: BriaResponse) -> float:
+        return self.interval
+
+
+class ExponentialBackoff(PollingStrategy):
+    """Start with a short delay and multiply it by `factor` after every attempt, up to `max_delay`"""
+
+    def __init__(self, initial: float = 0.25, factor: float = 1.5, max_delay: float = 10) -> None:
+        self.initial = initial
+        self.factor = factor
+        self.max_delay = max_delay
+
+    def next_delay(self, attempt: int, previous_delay: float | None, response: BriaResponse) -> float:
+        return min(self.max_delay, self.initial * self.factor ** (attempt - 1))
+
+
+class DecorrelatedJitter(PollingStrategy):
+    """
+    Randomized backoff where each delay is drawn between `base` and three times the previous delay (capped at `max_delay`).
+    Spreads the status calls of jobs submitted together so they do not hit the server in lockstep.
+    """
+
+    def __init__(self, base: float = 0.25, max_delay: float = 10) -> None:
+        self.base = base
+        self.max_delay = max_delay
+
+    def next_delay(self, attempt: int, previous_delay: float | None, response: BriaResponse) -> float:
+        upper = max(self.base, (previous_delay or self.base) * 3)
+        return min(self.max_delay, random.uniform(self.base, upper))
+
+
+class ServerHinted(PollingStrategy):
+    """
+    Honor a server provided hint (the `Retry-After` header by default, as seconds or an HTTP date) when the status response
+    carries one, otherwise fall back to another strategy.
+    """
+
+    def __init__(self, fallback: PollingStrategy | None = None, header: str = "retry-after", max_delay: float = 60) -> None:
+        self.fallback = fallback or ExponentialBackoff()
+        self.header = header.lower()
+        self.max_delay = max_delay
+
+    def next_delay(self, attempt: int, previous_delay: float | None, response: BriaResponse) -> float:
+        hint = self._parse_hint(response)
+        if hint is not None:
+            return min(self.max_delay, hint)
+        return self.fallback.next_delay(attempt, previous_delay, response)
+
+    def _parse_hint(self, response: BriaResponse) -> float | None:
+        value = next((v for k, v in response.headers.items() if k.lower() == self.header), None)
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class CompletionTimeModel:
+    """
+    Rolling per-endpoint record of how long submitted jobs take to complete.
+
+    Submissions are remembered by request_id (bounded, oldest forgotten first) and, once a job is seen completed,
+    its duration is added to a fixed size window of its endpoint. The job completed between the last check that saw it
+    running and the check that saw it completed, so the midpoint of the two is recorded: the completed check alone is
+    never earlier than the current estimate (the first check is scheduled there), the estimate could grow but never
+    shrink. Safe to share across threads.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 5, max_pending: int = 10_000) -> None:
+        """
+        Args:
+            `window: int` - Number of most recent durations kept per endpoint
+            `min_samples: int` - Number of durations required before an endpoint estimate is trusted
+            `max_pending: int` - Maximum number of submissions remembered while waiting for their completion
+        """
+        self.min_samples = min_samples
+        self._window = window
+        self._max_pending = max_pending
+        self._durations: dict[str, deque[float]] = {}
+        self._pending: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        # Monotonic time of the last check that saw each pending job running
+        self._running_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record_submission(self, request_id: str, endpoint: str) -> None:
+        with self._lock:
+            self._pending[request_id] = (endpoint, time.monotonic())
+            while len(self._pending) > self._max_pending:
+                forgotten, _ = self._pending.popitem(last=False)
+                self._running_at.pop(forgotten, None)
+
+    def record_progress(self, request_id: str) -> None:
+        """Remember that a pending job was just seen running"""
+        with self._lock:
+            if request_id in self._pending:
+                self._running_at[request_id] = time.monotonic()
+
+    def record_completion(self, request_id: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            submission = self._pending.pop(request_id, None)
+            if submission is None:
+                return
+            endpoint, submitted_at = submission
+            running_at = self._running_at.pop(request_id, submitted_at)
+            self._durations.setdefault(endpoint, deque(maxlen=self._window)).append((running_at + now) / 2 - submitted_at)
+
+    def submission(self, request_id: str) -> tuple[str, float] | None:
+        """The `(endpoint, monotonic submission time)` of a pending request, if known"""
+        with self._lock:
+            return self._pending.get(request_id)
+
+    def expected_duration(self, endpoint: str, percentile: float = 0.5) -> float | None:
+        """The `percentile` (0-1) of the recorded durations of `endpoint`, `None` until `min_samples` were recorded"""
+        with self._lock:
+            durations = sorted(self._durations.get(endpoint, ()))
+        if len(durations) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(percentile * len(durations)))
+        return durations[rank - 1]
+
+
+class LearnedSchedule(PollingStrategy):
+    """
+    Schedule the first status call at the expected completion time of the request's endpoint, poll densely around it,
+    then fall back to another strategy for the jobs that run late.
+
+    Requests whose endpoint has no estimate yet (or that were not submitted through the client) use the fallback right away.
+    """
+
+    def __init__(
+        self,
+        model: CompletionTimeModel,
+        percentile: float = 0.5,
+        dense_ratio: float = 0.1,
+        dense_attempts: int = 5,
+        min_interval: float = 0.1,
+        fallback: PollingStrategy | None = None,
+    ) -> None:
+        """
+        Args:
+            `model: CompletionTimeModel` - The durations recorded by the client
+            `percentile: float` - Expected completion percentile (0-1) to wait for before the first status call
+            `dense_ratio: float` - Interval of the dense polling phase, as a fraction of the expected duration
+            `dense_attempts: int` - Number of status calls in the dense polling phase
+            `min_interval: float` - Lower bound of the dense polling interval in seconds
+            `fallback: PollingStrategy | None` - Strategy once the dense phase is over (defaults to backoff)
+        """
+        self.model = model
+        self.percentile = percentile
+        self.dense_ratio = dense_ratio
+        self.dense_attempts = dense_attempts
+        self.min_interval = min_interval
+        self.fallback = fallback or default_polling_strategy()
+
+    def initial_delay(self, request_id: str) -> float:
+        estimate = self._estimate(request_id)
+        if estimate is None:
+            return self.fallback.initial_delay(request_id)
+        expected, submitted_at = estimate
+        return max(0.0, expected - (time.monotonic() - submitted_at))
+
+    def next_delay(self, attempt: int, previous_delay: float | None, response: BriaResponse) -> float:
+        estimate = self._estimate(response.request_id)
+        if estimate is None:
+            return self.fallback.next_delay(attempt, previous_delay, response)
+        expected, _ = estimate
+        if attempt <= self.dense_attempts:
+            return max(self.min_interval, expected * self.dense_ratio)
+        return self.fallback.next_delay(attempt - self.dense_attempts, previous_delay, response)
+
+    def _estimate(self, request_id: str) -> tuple[float, float] | None:
+        submission = self.model.submission(request_id)
+        if submission is None:
+            return None
+        endpoint, submitted_at = submission
+        expected = self.model.expected_duration(endpoint, self.percentile)
+        if expected is None:
+            return None
+        return expected, submitted_at
+
+
+def default_polling_strategy() -> PollingStrategy:
+    """Poll quickly at first (short jobs finish fast) and back off for long running ones, unless the server says otherwise"""
+    return ServerHinted(fallback=ExponentialBackoff(initial=0.25, factor=1.5, max_delay=10))
+
+
+def resolve_polling_strategy(
+    interval: int | float | None = None, strategy: PollingStrategy | None = None, default: PollingStrategy | None = None
+) -> PollingStrategy:
+    """An explicit `strategy` wins, a bare `interval` keeps the fixed interval behavior, otherwise `default` (or the default strategy) is used"""
+    if strategy is not None:
+        return strategy
+    if interval is not None:
+        return FixedInterval(interval)
+    return default or default_polling_strategy()
@@ -0,0 +1,192 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.hashing import hash_canonical
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BaseResultCache(ABC):
+    """
+    Cache of completed `.run()` responses, keyed by `result_cache_key()`.
+    Subclasses implement the storage, hit / miss accounting is done here.
+    """
+
+    def __init__(self) -> None:
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the hits and misses so far"""
+        with self._stats_lock:
+            return CacheStats(hits=self._stats.hits, misses=self._stats.misses)
+
+    def get(self, key: str) -> BriaResponse | None:
+        response = self._load(key)
+        with self._stats_lock:
+            if response is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return response
+
+    def set(self, key: str, response: BriaResponse) -> None:
+        # The timing of the original request would be misleading on the responses returned from the cache
+        self._store(key, response.model_copy(update={"timing": None}))
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry"""
+        pass
+
+    @abstractmethod
+    def _load(self, key: str) -> BriaResponse | None:
+        pass
+
+    @abstractmethod
+    def _store(self, key: str, response: BriaResponse) -> None:
+        pass
+
+
+class MemoryResultCache(BaseResultCache):
+    """In-process LRU cache, entries expire `ttl` seconds after being stored. Safe to share across threads and clients."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None) -> None:
+        """
+        Args:
+            `max_entries: int` - Number of responses kept, the least recently used one is evicted first
+            `ttl: float | None` - Seconds a response stays valid (`None` never expires)
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, BriaResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, key: str) -> BriaResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # A copy, so callers mutating their response do not alter the cached one
+        return response.model_copy(deep=True)
+
+    def _store(self, key: str, response: BriaResponse) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, response.model_copy(deep=True))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteResultCache(BaseResultCache):
+    """
+    On-disk cache in a SQLite database, persisting across runs and shared by the processes pointing at the same file.
+    Entries expire `ttl` seconds (wall clock) after being stored. Response headers are not persisted.
+    """
+
+    def __init__(self, path: str | Path, ttl: float | None = None, max_entries: int | None = None) -> None:
+        """
+        Args:
+            `path: str | Path` - The database file, created if missing
+            `ttl: float | None` - Seconds a response stays valid (`None` never expires)
+            `max_entries: int | None` - Number of responses kept, the least recently used ones are evicted first
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+
+    def _load(self, key: str) -> BriaResponse | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT response, expires_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            response, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+            self._connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return BriaResponse.model_validate_json(response)
+
+    def _store(self, key: str, response: BriaResponse) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, response, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response.model_dump_json(), expires_at, now),
+            )
+            if self.max_entries is not None:
+                self._connection.execute(
+                    "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+
+
+def result_cache_key(endpoint: str, payload: dict[str, Any], identity: str | None = None) -> str:
+    """
+    A sha256 of the endpoint and the canonical form of the payload: key order does not matter and an `Image` value hashes
+    like its `as_bria_api_input` string (streamed, never built as one string).
+
+    Args:
+        `endpoint: str` - The normalized endpoint
+        `payload: dict[str, Any]` - The prepared payload (`None` values already dropped)
+        `identity: str | None` - Scopes the key to one caller (e.g. the digest of its api_token)
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([endpoint, identity]).encode("utf-8"))
+    hash_canonical(digest, payload)
+    return digest.hexdigest()
@@ -1,3 +1,5 @@
+import httpx
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,3 +8,33 @@ class BriaSettings(BaseSettings):
 
     api_token: str | None = None
     base_url: str = "https://engine.prod.bria-api.com"
+    # Multiplex API requests (e.g. thousands of status polls) over a few HTTP/2 connections, requires `bria-client[http2]`
+    http2: bool = False
+    # API connections kept when using HTTP/2, unless one of the pool settings below is set (those win)
+    http2_max_connections: int = 10
+    # API connection pool and timeouts (seconds)
+    request_timeout: float = 30
+    connect_timeout: float = 10
+    write_timeout: float = 30
+    pool_timeout: float = 30
+    # Pool settings: when one is set (by `BRIA_*`, `settings` or the client arguments) they apply over HTTP/2 too
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30
+    # Read timeout by endpoint prefix, e.g. BRIA_ENDPOINT_TIMEOUTS='{"status": 10, "video": 300}'
+    endpoint_timeouts: dict[str, float] = Field(default_factory=dict)
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(connect=self.connect_timeout, read=self.request_timeout, write=self.write_timeout, pool=self.pool_timeout)
+
+    @property
+    def limits_set(self) -> bool:
+        """Whether a pool setting was set explicitly"""
+        return bool({"max_connections", "max_keepalive_connections", "keepalive_expiry"} & self.model_fields_set)
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections, max_keepalive_connections=self.max_keepalive_connections, keepalive_expiry=self.keepalive_expiry
+        )
@@ -1,14 +1,26 @@
 import logging
+import os
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 from httpx_retries import Retry
 
 from bria_client.clients.base import BaseBriaClient
+from bria_client.clients.polling import PollingStrategy
+from bria_client.clients.settings import BriaSettings
+from bria_client.clients.upload import DEFAULT_MAX_BYTES_IN_FLIGHT, ByteBudget, ProgressFile, UploadProgressCallback
+from bria_client.clients.upload_cache import file_digest
 from bria_client.engines.base.sync_http_request import SyncHTTPRequest
 from bria_client.toolkit import BriaResponse
-from bria_client.toolkit.errors.exception import BriaException
+
+if TYPE_CHECKING:
+    from PIL import Image as PilImage
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +41,9 @@ class BriaSyncClient(BaseBriaClient):
         if isinstance(self.engine.client, SyncHTTPRequest):
             self.engine.client.close()
 
-    def _setup_http_client(self, retry: Retry | None) -> None:
+    def _setup_http_client(self, retry: Retry | None, settings: BriaSettings) -> None:
         """Setup synchronous HTTP client"""
-        self.engine.set_http_client(http_client=SyncHTTPRequest(retry=retry))
+        self.engine.set_http_client(http_client=SyncHTTPRequest(retry=retry, **self._http_request_options(settings)))
 
     def run(self, endpoint: str, payload: dict, headers: dict | None = None, raise_for_status: bool = False, **kwargs):
         """
@@ -49,7 +61,14 @@ class BriaSyncClient(BaseBriaClient):
         """
         self._validate_run_payload(payload)
         # Unpack payload and headers to avoid mutating the original input
-        bria_response = self.engine.post(endpoint=endpoint, payload={**payload, "sync": True}, headers={**(headers or {})}, **kwargs)
+        payload = {**payload, "sync": True}
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self._result_cache_key(endpoint, payload, kwargs)
+            if (cached_response := self.result_cache.get(cache_key)) is not None:
+                return cached_response
+        bria_response = self.engine.post(endpoint=endpoint, payload=payload, headers={**(headers or {})}, **kwargs)
+        self._cache_result(cache_key, bria_response)
         if raise_for_status:
             bria_response.raise_for_status()
         return bria_response
@@ -63,7 +82,8 @@ class BriaSyncClient(BaseBriaClient):
             payload: Request payload
             headers: Optional headers
             raise_for_status: Whether to raise exception on error status
-            webhook_url: Optional URL to receive a POST when the job reaches a terminal state.
+            webhook_url: Optional URL to receive a POST when the job reaches a terminal state
+                         (defaults to the URL of the client's ``webhook_receiver``).
                          Bria will sign the request with HMAC-SHA256; use
                          ``verify_webhook_signature`` from ``bria_client.toolkit`` to verify on receipt.
             **kwargs: Additional arguments (e.g., api_token)
@@ -73,9 +93,12 @@ class BriaSyncClient(BaseBriaClient):
         """
         self._validate_submit_payload(payload)
         merged_payload = {**payload, "sync": False}
+        webhook_url = self._resolve_webhook_url(payload, webhook_url)
         if webhook_url is not None:
             merged_payload["webhook_url"] = webhook_url
         bria_response = self.engine.post(endpoint=endpoint, payload=merged_payload, headers={**(headers or {})}, **kwargs)
+        self._record_submission(endpoint, bria_response)
+        self._expect_delivery(webhook_url, bria_response)
         if raise_for_status:
             bria_response.raise_for_status()
         return bria_response
@@ -100,7 +123,7 @@ class BriaSyncClient(BaseBriaClient):
             bria_response.raise_for_status()
         return bria_response
 
-    def upload(self, path: str | Path, media_type: str, headers: dict | None = None, **kwargs) -> str:
+    def upload(self, path: str | Path, media_type: str, headers: dict | None = None, *, progress: UploadProgressCallback | None = None, **kwargs) -> str:
         """
         Upload a local file to Bria's storage and return a URL ready for use in API calls.
 
@@ -112,6 +135,7 @@ class BriaSyncClient(BaseBriaClient):
                         which affects how web clients retrieve and render it.
                         Only "video/*" types are currently accepted.
             headers: Optional extra headers forwarded to the Bria API request.
+            progress: Optional callback called with ``(bytes_sent, total_bytes)`` while the file is sent.
             **kwargs: Additional arguments forwarded to the Bria API call (e.g., api_token).
 
         Returns:
@@ -122,8 +146,28 @@ class BriaSyncClient(BaseBriaClient):
             NotImplementedError: If media_type is not a video type.
             BriaException: If the Bria API request or the file upload fails.
         """
-        if not media_type.startswith("video/"):
-            raise NotImplementedError(f"Upload not yet supported for media type: {media_type!r}")
+        self._validate_upload_media_type(media_type)
+        return self._upload(path, media_type, headers, progress, kwargs)
+
+    def _upload(
+        self,
+        path: str | Path,
+        media_type: str,
+        headers: dict | None,
+        progress: UploadProgressCallback | None,
+        kwargs: dict,
+        transfer_slot: Callable[[], AbstractContextManager] = nullcontext,
+    ) -> str:
+        """Upload one file: reuse a cached upload, or request an upload target and send the file within `transfer_slot()`"""
+        # Imported on use, werkzeug is only needed to report failures
+        from bria_client.toolkit.errors.exception import BriaException
+
+        digest, identity = None, None
+        if self.upload_cache is not None:
+            digest, identity = file_digest(path), self._auth_identity(kwargs)
+            if (file_url := self.upload_cache.get(digest, media_type, identity)) is not None:
+                return file_url
+        issued_at = time.time()
         bria_response = self.engine.post(
             endpoint="video/upload",
             payload={"media_type": media_type},
@@ -134,18 +178,100 @@ class BriaSyncClient(BaseBriaClient):
         result = bria_response.result
         assert result is not None
         path = Path(path)
-        with path.open("rb") as f:
-            with httpx.Client() as client:
-                response = client.post(
-                    result.upload_url,
-                    data={**result.upload_fields, "Content-Type": media_type},
-                    files={"file": (path.name, f, media_type)},
-                    timeout=None,
-                )
+        progress = self._upload_progress(path, progress)
+        assert isinstance(self.engine.client, SyncHTTPRequest)
+        with transfer_slot():
+            with path.open("rb") as f:
+                try:
+                    response = self.engine.client.upload(
+                        result.upload_url,
+                        data={**result.upload_fields, "Content-Type": media_type},
+                        files={"file": (path.name, ProgressFile(f, progress) if progress is not None else f, media_type)},
+                    )
+                except httpx.TransportError as e:
+                    raise BriaException(status_code=503, message="Upload failed", details=str(e)) from e
         if response.status_code != 204:
             raise BriaException(status_code=response.status_code, message="Upload failed", details=response.text)
+        if self.upload_cache is not None and digest is not None:
+            self.upload_cache.set(digest, media_type, result.file_url, identity, issued_at=issued_at)
         return result.file_url
 
+    def fetch_image(self, url: str, headers: dict | None = None) -> "PilImage.Image":
+        """
+        Download an image (e.g. a result URL) and decode it, through the pooled storage connections of the client.
+
+        With a `download_cache`, an image already downloaded is only revalidated (`If-None-Match`) and reused when unchanged.
+
+        Args:
+            url: The image URL.
+            headers: Optional headers sent with the download (e.g. authorization of a private bucket).
+
+        Returns:
+            PIL.Image.Image: The decoded image.
+
+        Raises:
+            BriaException: If the download fails.
+        """
+        # Imported on use, werkzeug is only needed to report failures and Pillow to decode
+        from bria_client.toolkit.errors.exception import BriaException
+        from bria_client.toolkit.image import Image
+
+        cached = self._cached_download(url)
+        assert isinstance(self.engine.client, SyncHTTPRequest)
+        try:
+            download = self.engine.client.download(url, headers=headers, etag=cached[0] if cached is not None else None)
+        except httpx.HTTPStatusError as e:
+            raise BriaException(status_code=e.response.status_code, message="Download failed", details=url) from e
+        except httpx.TransportError as e:
+            raise BriaException(status_code=503, message="Download failed", details=str(e)) from e
+        return Image._bytes_2_pil(self._downloaded_body(url, cached, download))
+
+    def upload_many(
+        self,
+        paths: Iterable[str | Path],
+        media_type: str,
+        concurrency: int = 8,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> dict[str | Path, str | Exception]:
+        """
+        Upload many local files, overlapping the upload target requests of the next files with the transfers of the current ones.
+
+        Args:
+            paths: Local paths of the files.
+            media_type: MIME type of every file (e.g. "video/mp4"). Only "video/*" types are currently accepted.
+            concurrency: Maximum number of files transferred at the same time (as many upload targets are requested ahead).
+            max_bytes_in_flight: Maximum total size of the files transferred at the same time.
+            headers: Optional extra headers forwarded to the Bria API requests.
+            **kwargs: Additional arguments forwarded to the Bria API calls (e.g., api_token).
+
+        Returns:
+            dict[str | Path, str | Exception]: The file URL of each path, or the exception its upload failed with.
+
+        Raises:
+            NotImplementedError: If media_type is not a video type.
+        """
+        self._validate_upload_media_type(media_type)
+        paths = list(paths)
+        transfers = threading.Semaphore(concurrency)
+        budget = ByteBudget(max_bytes_in_flight)
+
+        @contextmanager
+        def transfer_slot(path: str | Path) -> Iterator[None]:
+            with budget.reserve(os.path.getsize(path)), transfers:
+                yield
+
+        def upload_one(path: str | Path) -> str | Exception:
+            try:
+                return self._upload(path, media_type, headers, None, kwargs, lambda: transfer_slot(path))
+            except Exception as e:
+                return e
+
+        # Twice as many workers as transfers: while `concurrency` files are sent, the others fetch their upload target
+        with ThreadPoolExecutor(max_workers=2 * concurrency) as pool:
+            return dict(zip(paths, pool.map(upload_one, paths), strict=True))
+
     def status(self, request_id: str, headers: dict | None = None, **kwargs):
         bria_response = self.engine.get(endpoint=f"status/{request_id}", headers=headers, **kwargs)
         return bria_response.status
@@ -154,12 +280,13 @@ class BriaSyncClient(BaseBriaClient):
         self,
         target: str | BriaResponse | None = None,
         headers: dict | None = None,
-        interval: int | float = 1,
+        interval: int | float | None = None,
         timeout: int = 60,
         raise_for_status: bool = True,
         *,
         response: BriaResponse | None = None,
         request_id: str | None = None,
+        strategy: PollingStrategy | None = None,
         **kwargs,
     ):
         request_id = request_id
@@ -169,19 +296,52 @@ class BriaSyncClient(BaseBriaClient):
             request_id = target.request_id if isinstance(target, BriaResponse) else target
 
         headers = {**(headers or {})}
+        polling_strategy = self._resolve_polling_strategy(interval, strategy)
+
+        pending = self._pending_delivery(request_id)
 
         def call_status_service():
             return self.engine.get(endpoint=f"status/{request_id}", headers=headers, **kwargs)
 
-        bria_response = call_status_service()
+        def wait_for_status(delay: float) -> BriaResponse:
+            # The webhook delivery of the job, when expected and received within the delay, replaces the status call
+            if pending is None:
+                time.sleep(delay)
+            elif (delivered := pending.wait(delay)) is not None:
+                return delivered
+            return call_status_service()
+
         start_time = time.time()
-        while bria_response.in_progress:
-            logger.debug(f"Polling request ID: {request_id}, current status: {bria_response.status}")
-            time.sleep(interval)
-            bria_response = call_status_service()
-            if time.time() - start_time >= timeout:
-                raise TimeoutError("Timeout reached while waiting for status request")
+        initial_delay = polling_strategy.initial_delay(request_id)
+        if pending is not None:
+            # The status is only polled once the delivery is late
+            initial_delay = max(initial_delay, pending.late_in())
+        try:
+            # Whether the last check was made at the deadline
+            at_deadline = initial_delay >= timeout
+            if (initial_delay := min(initial_delay, timeout)) > 0:
+                bria_response = wait_for_status(initial_delay)
+            else:
+                bria_response = call_status_service()
+            attempt, delay = 1, None
+            while bria_response.in_progress:
+                # No wait goes past the deadline, the job timed out only when it is still running at the check made there
+                if at_deadline:
+                    raise TimeoutError("Timeout reached while waiting for status request")
+                logger.debug(f"Polling request ID: {request_id}, current status: {bria_response.status}")
+                self._record_progress(bria_response)
+                delay = polling_strategy.next_delay(attempt, delay, bria_response)
+                self._emit_poll_tick(request_id, attempt, bria_response, delay)
+                remaining = max(0.0, timeout - (time.time() - start_time))
+                at_deadline = delay >= remaining
+                bria_response = wait_for_status(min(delay, remaining))
+                attempt += 1
+        finally:
+            if pending is not None:
+                self._forget_delivery(request_id)
 
+        self._emit_poll_tick(request_id, attempt, bria_response, None)
+        self._record_completion(bria_response)
         if raise_for_status:
             bria_response.raise_for_status()
         return bria_response
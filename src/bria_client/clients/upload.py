@@ -0,0 +1,90 @@
+import asyncio
+import os
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import BinaryIO, TypeAlias
+
+# Called with `(bytes_sent, total_bytes)` while a file is being uploaded
+UploadProgressCallback: TypeAlias = Callable[[int, int], None]
+
+# Default bound of the file bytes `upload_many()` sends at once
+DEFAULT_MAX_BYTES_IN_FLIGHT = 512 * 1024 * 1024
+
+
+class ProgressFile:
+    """
+    A binary file reporting how much of it was read, for uploads read by httpx chunk by chunk.
+    Rewinding it (e.g. when the upload is retried) restarts the count.
+    """
+
+    def __init__(self, file: BinaryIO, callback: UploadProgressCallback) -> None:
+        self._file = file
+        self._callback = callback
+        self.total = os.fstat(file.fileno()).st_size
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        if chunk:
+            self._callback(self._file.tell(), self.total)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+
+class ByteBudget:
+    """
+    Bounds the total size of the files being transferred at once, shared by threads.
+    A file larger than the whole budget is let through alone.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self.limit = limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def reserve(self, size: int) -> Iterator[None]:
+        size = min(size, self.limit)
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight + size <= self.limit)
+            self._in_flight += size
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= size
+                self._condition.notify_all()
+
+
+class AsyncByteBudget:
+    """`ByteBudget` for the tasks of one event loop"""
+
+    def __init__(self, limit: int) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self.limit = limit
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reserve(self, size: int) -> AsyncIterator[None]:
+        size = min(size, self.limit)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight + size <= self.limit)
+            self._in_flight += size
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= size
+                self._condition.notify_all()
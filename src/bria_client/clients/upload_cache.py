@@ -0,0 +1,80 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Documented validity of the `file_url` returned by `video/upload`
+UPLOAD_URL_VALIDITY = 24 * 60 * 60
+
+FILE_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: str | Path, chunk_size: int = FILE_DIGEST_CHUNK_SIZE) -> str:
+    """The sha256 of a file, read chunk by chunk into a single reused buffer (never the whole file in memory)"""
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with Path(path).open("rb", buffering=0) as f:
+        while read := f.readinto(buffer):
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """
+    Remembers the `file_url` of files already uploaded, by content digest and media type, while the URL is still valid.
+
+    An entry expires `min_remaining` seconds before the end of the URL validity, so a cached URL stays usable long enough
+    for the job it is passed to. Safe to share across threads and clients.
+    """
+
+    def __init__(self, validity: float = UPLOAD_URL_VALIDITY, min_remaining: float = 60 * 60, max_entries: int = 10_000) -> None:
+        """
+        Args:
+            `validity: float` - Seconds a `file_url` is valid after the upload was requested
+            `min_remaining: float` - Validity a cached `file_url` must still have to be reused
+            `max_entries: int` - Number of uploads remembered, the oldest one is forgotten first
+        """
+        self.validity = validity
+        self.min_remaining = min_remaining
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str | None], tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str, media_type: str, identity: str | None = None) -> str | None:
+        """The `file_url` of a previous upload of the same content, if it is still valid"""
+        key = (digest, media_type, identity)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, file_url = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return file_url
+
+    def set(self, digest: str, media_type: str, file_url: str, identity: str | None = None, issued_at: float | None = None) -> None:
+        """
+        Args:
+            `digest: str` - The `file_digest()` of the uploaded file
+            `media_type: str` - The media type the file was uploaded with
+            `file_url: str` - The URL returned for the upload
+            `identity: str | None` - Scopes the entry to one caller (e.g. the digest of its api_token)
+            `issued_at: float | None` - When the upload URL was requested (defaults to now)
+        """
+        issued_at = issued_at if issued_at is not None else time.time()
+        expires_at = issued_at + self.validity - self.min_remaining
+        with self._lock:
+            self._entries[(digest, media_type, identity)] = (expires_at, file_url)
+            self._entries.move_to_end((digest, media_type, identity))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,4 +1,52 @@
-from bria_client.engines.api_engine import ApiEngine
-from bria_client.engines.bria_engine import BriaEngine
+from typing import TYPE_CHECKING
 
-__all__ = ["ApiEngine", "BriaEngine"]
+from bria_client._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from bria_client.engines.api_engine import ApiEngine
+    from bria_client.engines.bria_engine import BriaEngine
+    from bria_client.engines.events import EventHooks, PollTick, RequestEnded, RequestRetried, RequestStarted, UploadProgress
+    from bria_client.engines.metrics import MetricsCollector, OpenTelemetryHooks, PrometheusCollector
+    from bria_client.engines.rate_limiter import BaseRateLimiter, RateLimiter
+    from bria_client.engines.shared_rate_limiter import SharedRateLimiter
+    from bria_client.engines.single_flight import SingleFlight
+
+__all__ = [
+    "ApiEngine",
+    "BriaEngine",
+    "BaseRateLimiter",
+    "RateLimiter",
+    "SharedRateLimiter",
+    "SingleFlight",
+    "EventHooks",
+    "RequestStarted",
+    "RequestEnded",
+    "RequestRetried",
+    "PollTick",
+    "UploadProgress",
+    "MetricsCollector",
+    "PrometheusCollector",
+    "OpenTelemetryHooks",
+]
+
+# The exports are imported on first access, importing the package alone stays cheap
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ApiEngine": "bria_client.engines.api_engine",
+        "BriaEngine": "bria_client.engines.bria_engine",
+        "EventHooks": "bria_client.engines.events",
+        "PollTick": "bria_client.engines.events",
+        "RequestEnded": "bria_client.engines.events",
+        "RequestRetried": "bria_client.engines.events",
+        "RequestStarted": "bria_client.engines.events",
+        "UploadProgress": "bria_client.engines.events",
+        "MetricsCollector": "bria_client.engines.metrics",
+        "OpenTelemetryHooks": "bria_client.engines.metrics",
+        "PrometheusCollector": "bria_client.engines.metrics",
+        "BaseRateLimiter": "bria_client.engines.rate_limiter",
+        "RateLimiter": "bria_client.engines.rate_limiter",
+        "SharedRateLimiter": "bria_client.engines.shared_rate_limiter",
+        "SingleFlight": "bria_client.engines.single_flight",
+    },
+)
@@ -1,11 +1,21 @@
+import asyncio
+import hashlib
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import Executor
+from functools import partial
 from typing import Literal
 
+from bria_client._lazy import if_imported
 from bria_client._version import __version__
 from bria_client.engines.base.async_http_request import AsyncHTTPRequest
 from bria_client.engines.base.base_http_request import BaseHTTPRequest
+from bria_client.engines.base.request_trace import RequestTrace
 from bria_client.engines.base.sync_http_request import SyncHTTPRequest
+from bria_client.engines.events import EventDispatcher, EventHooks, RequestEnded, RequestRetried, RequestStarted
+from bria_client.engines.rate_limiter import BaseRateLimiter, RateLimitSlot
+from bria_client.engines.single_flight import SingleFlight
 from bria_client.toolkit import BriaResponse
 
 AdditionalHeaders = dict[str, str | Callable[[], str]]
@@ -16,6 +26,12 @@ class ApiEngine(ABC):
         self.base_url = base_url
         self._default_headers = default_headers or {}
         self.client: BaseHTTPRequest | None = None
+        self.rate_limiter: BaseRateLimiter | None = None
+        self.events = EventDispatcher()
+        # Shares one exchange among identical requests in flight (status polls by default)
+        self.single_flight: SingleFlight | None = SingleFlight()
+        # Thread pool encoding the `Image` values of async requests (`None` for the event loop's default executor)
+        self.image_executor: Executor | None = None
 
     @property
     def default_headers(self) -> dict[str, str]:
@@ -40,6 +56,15 @@ class ApiEngine(ABC):
     def set_http_client(self, http_client: BaseHTTPRequest):
         self.client = http_client
 
+    def set_rate_limiter(self, rate_limiter: BaseRateLimiter | None):
+        self.rate_limiter = rate_limiter
+
+    def set_single_flight(self, single_flight: SingleFlight | None):
+        self.single_flight = single_flight
+
+    def add_event_hooks(self, hooks: EventHooks):
+        self.events.add(hooks)
+
     # region SyncClient related methods
     def post(self, endpoint: str, payload: dict, headers: dict | None = None, **kwargs) -> BriaResponse:
         auth_override = self._check_auth_override(kwargs=kwargs)
@@ -62,7 +87,31 @@ class ApiEngine(ABC):
         url = self._prepare_endpoint(endpoint)
         headers = self._prepare_headers(headers=headers, auth_override=auth_override)
         payload = self._prepare_payload(payload)
-        return self.client.request(url=url, method=method, payload=payload, headers=headers, **kwargs)
+        if self.single_flight is not None and self.single_flight.applies(method):
+            key = self.single_flight.key(method, url, payload, headers, kwargs)
+            return self.single_flight.do(key, lambda: self._sync_send(endpoint, method, url, payload, headers, auth_override, kwargs))
+        return self._sync_send(endpoint, method, url, payload, headers, auth_override, kwargs)
+
+    def _sync_send(
+        self, endpoint: str, method: str, url: str, payload: dict | None, headers: dict, auth_override: dict[str, str] | None, kwargs: dict
+    ) -> BriaResponse:
+        assert isinstance(self.client, SyncHTTPRequest)
+        if self.rate_limiter is None and not self.events:
+            return self.client.request(url=url, method=method, payload=payload, headers=headers, **kwargs)
+
+        slot = self._take_slot(endpoint, auth_override, kwargs)
+        if slot is not None:
+            slot.acquire()
+        trace = self._start_trace(endpoint, method, kwargs)
+        bria_response, error = None, None
+        try:
+            bria_response = self.client.request(url=url, method=method, payload=payload, headers=headers, **kwargs)
+            return bria_response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._end_request(endpoint, method, slot, trace, bria_response, error)
 
     # endregion
 
@@ -88,7 +137,40 @@ class ApiEngine(ABC):
         url = self._prepare_endpoint(endpoint)
         headers = self._prepare_headers(headers=headers, auth_override=auth_override)
         payload = self._prepare_payload(payload)
-        return await self.client.request(url=url, method=method, payload=payload, headers=headers, **kwargs)
+        # Payloads only hold `Image` values once its module was imported (it is not imported here, it loads numpy and Pillow)
+        if (resolve_images := if_imported("bria_client.toolkit.image", "resolve_images")) is not None:
+            await resolve_images(payload, executor=self.image_executor)
+        if self.single_flight is not None and self.single_flight.applies(method):
+            if payload is None:
+                key = self.single_flight.key(method, url, payload, headers, kwargs)
+            else:
+                # Hashing a payload hashes its images
+                key = await asyncio.get_running_loop().run_in_executor(
+                    self.image_executor, partial(self.single_flight.key, method, url, payload, headers, kwargs)
+                )
+            return await self.single_flight.do_async(key, lambda: self._async_send(endpoint, method, url, payload, headers, auth_override, kwargs))
+        return await self._async_send(endpoint, method, url, payload, headers, auth_override, kwargs)
+
+    async def _async_send(
+        self, endpoint: str, method: str, url: str, payload: dict | None, headers: dict, auth_override: dict[str, str] | None, kwargs: dict
+    ) -> BriaResponse:
+        assert isinstance(self.client, AsyncHTTPRequest)
+        if self.rate_limiter is None and not self.events:
+            return await self.client.request(url=url, method=method, payload=payload, headers=headers, **kwargs)
+
+        slot = self._take_slot(endpoint, auth_override, kwargs)
+        if slot is not None:
+            await slot.acquire_async()
+        trace = self._start_trace(endpoint, method, kwargs)
+        bria_response, error = None, None
+        try:
+            bria_response = await self.client.request(url=url, method=method, payload=payload, headers=headers, **kwargs)
+            return bria_response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._end_request(endpoint, method, slot, trace, bria_response, error)
 
     # endregion
 
@@ -103,6 +185,69 @@ class ApiEngine(ABC):
         auth = auth_override if auth_override is not None else self.auth_headers
         return {**self.user_agent_headers, **self.default_headers, **additional_headers, **auth}
 
+    def _auth_identity(self, auth_override: dict[str, str] | None = None) -> str:
+        """A stable digest of the auth headers used for a call, to scope per-caller state without keeping raw tokens around"""
+        auth = auth_override if auth_override is not None else self.auth_headers
+        return hashlib.sha256(repr(sorted(auth.items())).encode()).hexdigest()[:16]
+
+    def _take_slot(self, endpoint: str, auth_override: dict[str, str] | None, kwargs: dict) -> RateLimitSlot | None:
+        """The rate limiter slot of a request, also passed to the http client which takes it again for each retry"""
+        if self.rate_limiter is None:
+            return None
+        slot = RateLimitSlot(self.rate_limiter, endpoint, self._auth_identity(auth_override))
+        kwargs["rate_limit"] = slot
+        return slot
+
+    def _start_trace(self, endpoint: str, method: str, kwargs: dict) -> RequestTrace | None:
+        """Emit the start of a request and pass a trace of it to the http client (only when event hooks are set)"""
+        if not self.events:
+            return None
+        label = self._endpoint_label(endpoint)
+        self.events.emit("on_request_started", RequestStarted(endpoint=label, method=method))
+        trace = RequestTrace(on_retry=lambda retry: self.events.emit("on_request_retried", RequestRetried(endpoint=label, method=method, retry=retry)))
+        kwargs["trace"] = trace
+        return trace
+
+    def _end_request(
+        self,
+        endpoint: str,
+        method: str,
+        slot: RateLimitSlot | None,
+        trace: RequestTrace | None,
+        bria_response: BriaResponse | None,
+        error: BaseException | None,
+    ) -> None:
+        if slot is not None:
+            # Already released by the http client when the last attempt went through its retry transport
+            slot.release(self._status_code(bria_response) if bria_response is not None else None)
+        if trace is None:
+            return
+        duration = time.perf_counter() - trace.started_at
+        event = RequestEnded(
+            endpoint=self._endpoint_label(endpoint),
+            method=method,
+            status_code=trace.status_code,
+            started_at=time.time() - duration,
+            duration=duration,
+            bytes_sent=trace.bytes_sent,
+            bytes_received=trace.bytes_received,
+            retries=trace.retries,
+            pool_wait=trace.pool_wait,
+            error=error,
+        )
+        self.events.emit("on_request_ended", event)
+
+    @staticmethod
+    def _endpoint_label(endpoint: str) -> str:
+        """The endpoint of a request without its variable parts (status requests are all labeled `status`)"""
+        endpoint = endpoint.strip("/").removeprefix("v2").strip("/")
+        return "status" if endpoint.startswith("status/") else endpoint
+
+    @staticmethod
+    def _status_code(bria_response: BriaResponse) -> int:
+        """The HTTP-like status code of a response (the error code for failed responses)"""
+        return bria_response.error.code if bria_response.error is not None else 200
+
     def _prepare_endpoint(self, endpoint: str) -> str:
         endpoint = endpoint.strip("/").removeprefix("v2").strip("/")
         return f"{self.base_url}/v2/{endpoint}"
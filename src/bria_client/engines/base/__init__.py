@@ -1,4 +1,18 @@
-from bria_client.engines.base.async_http_request import AsyncHTTPRequest
-from bria_client.engines.base.sync_http_request import SyncHTTPRequest
+from typing import TYPE_CHECKING
+
+from bria_client._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from bria_client.engines.base.async_http_request import AsyncHTTPRequest
+    from bria_client.engines.base.sync_http_request import SyncHTTPRequest
 
 __all__ = ["AsyncHTTPRequest", "SyncHTTPRequest"]
+
+# The exports are imported on first access, importing the package alone stays cheap
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncHTTPRequest": "bria_client.engines.base.async_http_request",
+        "SyncHTTPRequest": "bria_client.engines.base.sync_http_request",
+    },
+)
@@ -1,6 +1,8 @@
 import asyncio
 import threading
+import time
 import weakref
+from collections.abc import Callable
 from typing import Any
 
 import httpx
@@ -8,40 +10,114 @@ from httpx import Response
 from httpx_retries import Retry, RetryTransport
 
 from bria_client.engines.base.base_http_request import BaseHTTPRequest
+from bria_client.engines.base.json_stream import AsyncJsonStream
+from bria_client.engines.base.rate_limited_transport import AsyncRateLimitedTransport
+from bria_client.engines.base.request_trace import RequestTrace
 from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.download import Download, aread_body, conditional_headers
 from bria_client.toolkit.errors.custom_errors import ServerConnectionError
 
 
 class AsyncHTTPRequest(BaseHTTPRequest):
     """Async-only HTTP request implementation"""
 
-    def __init__(self, request_timeout: int = 30, retry: Retry | None = None) -> None:
+    def __init__(
+        self,
+        request_timeout: float = 30,
+        retry: Retry | None = None,
+        storage_retry: Retry | None = None,
+        http2: bool = False,
+        http2_max_connections: int = 10,
+        timeout: httpx.Timeout | None = None,
+        limits: httpx.Limits | None = None,
+        endpoint_timeouts: dict[str, float] | None = None,
+    ) -> None:
         """
         Initialize the AsyncHTTPClient
 
         Args:
-            `request_timeout: int` - The default request timeout for reading response from the server (client side rejection)
+            `request_timeout: float` - The default request timeout for reading response from the server (client side rejection)
             `retry: Retry | None` - Retry configuration for requests
+            `storage_retry: Retry | None` - Retry configuration for file uploads to storage
+            `http2: bool` - Multiplex API requests over HTTP/2 connections
+            `http2_max_connections: int` - Connections kept to the API when using HTTP/2
+            `timeout: httpx.Timeout | None` - Connect / write / pool timeouts of API requests
+            `limits: httpx.Limits | None` - Connection pool limits of the API client
+            `endpoint_timeouts: dict[str, float] | None` - Read timeout by endpoint prefix
         """
-        super().__init__(request_timeout, retry)
+        super().__init__(request_timeout, retry, storage_retry, http2, http2_max_connections, timeout, limits, endpoint_timeouts)
 
         # Saves httpx.AsyncClient instances for each event loop, Using weakrefDictionary to avoid memory leaks when event loops are garbage collected.
         self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
         self._async_clients_lock = threading.Lock()  # Lock to prevent race conditions when writing the `_async_clients` dictionary.
+        # Same for the storage clients of uploads / downloads, created on first use
+        self._storage_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
 
     async def close(self) -> None:
         """Close all async clients"""
         with self._async_clients_lock:
-            for client in list(self._async_clients.values()):
-                await client.aclose()
+            clients = [*self._async_clients.values(), *self._storage_clients.values()]
             self._async_clients.clear()
+            self._storage_clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    async def upload(self, url: str, data: dict[str, Any], files: dict[str, Any]) -> Response:
+        """
+        Post a multipart form to a presigned storage URL through the pooled storage client of the running event loop
+
+        Args:
+            `url: str` - The presigned upload URL
+            `data: dict[str, Any]` - The form fields
+            `files: dict[str, Any]` - The form files, as accepted by `httpx`
+
+        Returns:
+            `Response` - The storage response
+        """
+        return await self._get_storage_client().post(url, data=data, files=files)
+
+    async def download(self, url: str, headers: dict[str, str] | None = None, etag: str | None = None) -> Download:
+        """
+        Download a URL (e.g. an image) through the pooled storage client of the running event loop, into a buffer preallocated
+        from its `Content-Length`
+
+        Args:
+            `url: str` - The URL to download
+            `headers: dict[str, str] | None` - The headers to send with the request
+            `etag: str | None` - The `ETag` of a body already downloaded, not downloaded again while it is current
+
+        Returns:
+            `Download` - The body (`None` when the `etag` is current) and its `ETag`
+
+        Raises:
+            `httpx.HTTPStatusError` - When the server answers with an error status
+        """
+        async with self._get_storage_client().stream("GET", url, headers=conditional_headers(headers, etag), follow_redirects=True) as response:
+            if etag is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+                return Download(body=None, etag=etag)
+            response.raise_for_status()
+            return Download(body=await aread_body(response), etag=response.headers.get("ETag"))
+
+    def _get_storage_client(self) -> httpx.AsyncClient:
+        return self._get_loop_client(
+            self._storage_clients,
+            lambda: httpx.AsyncClient(
+                transport=RetryTransport(transport=self._async_storage_transport(), retry=self.storage_retry), timeout=self._storage_timeout
+            ),
+        )
 
     async def request(self, url: str, method: str, payload: dict[str, Any] | None = None, headers: dict[str, str] | None = None, **kwargs: Any) -> BriaResponse:
+        trace = kwargs["trace"] = kwargs.get("trace") or RequestTrace()
         try:
             response = await self._request(url, method, payload=payload, headers=headers, **kwargs)
         except httpx.ConnectError:
-            return BriaResponse.from_error(ServerConnectionError(url=url))
-        return BriaResponse.from_http_response(response)
+            bria_response = BriaResponse.from_error(ServerConnectionError(url=url))
+            bria_response.timing = trace.timing()
+            return bria_response
+        parse_started_at = time.perf_counter()
+        bria_response = BriaResponse.from_http_response(response)
+        bria_response.timing = trace.timing(parse=time.perf_counter() - parse_started_at)
+        return bria_response
 
     async def _request(self, url: str, method: str, payload: dict[str, Any] | None = None, headers: dict[str, str] | None = None, **kwargs: Any) -> Response:
         """
@@ -52,7 +128,10 @@ class AsyncHTTPRequest(BaseHTTPRequest):
             `method: str` - The method to use for the request
             `payload: dict | None` - The payload to send with the request
             `headers: dict | None` - The headers to send with the request
-            `**kwargs` - Additional `httpx.request` compatible keyword arguments to pass to the request
+            `**kwargs` - Additional `httpx.request` compatible keyword arguments to pass to the request,
+                `request_timeout` (seconds to read the response, or an `httpx.Timeout`) to override the default timeout
+                `trace` (a `RequestTrace`) to record what happened while sending the request
+                and `rate_limit` (a `RateLimitSlot`) to go through the rate limiter again for each retry
 
         Returns:
             `RT` - The response from the request
@@ -61,7 +140,19 @@ class AsyncHTTPRequest(BaseHTTPRequest):
             `EngineAPIException` - When the request fails
         """
         client: httpx.AsyncClient = self._get_async_client()
-        response = await client.request(method, url, headers=headers, json=payload, timeout=self.request_timeout, **kwargs)
+        timeout = self._request_timeout(url, kwargs.pop("request_timeout", None))
+        trace: RequestTrace | None = kwargs.pop("trace", None)
+        if trace is not None:
+            kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": trace.trace_async}
+        if (rate_limit := kwargs.pop("rate_limit", None)) is not None:
+            kwargs["extensions"] = {**kwargs.get("extensions", {}), "rate_limit": rate_limit}
+        stream, headers = self._prepare_stream(payload, headers)
+        if stream is not None:
+            response = await client.request(method, url, headers=headers, content=AsyncJsonStream(stream), timeout=timeout, **kwargs)
+        else:
+            response = await client.request(method, url, headers=headers, json=payload, timeout=timeout, **kwargs)
+        if trace is not None:
+            trace.record_response(response)
         return response
 
     def _get_async_client(self) -> httpx.AsyncClient:
@@ -71,26 +162,37 @@ class AsyncHTTPRequest(BaseHTTPRequest):
         Returns:
             `httpx.AsyncClient` - The async client for the current event loop
         """
+        return self._get_loop_client(
+            self._async_clients,
+            self._create_api_client,
+        )
+
+    def _create_api_client(self) -> httpx.AsyncClient:
+        transport = self._async_api_transport()
+        return httpx.AsyncClient(
+            transport=RetryTransport(transport=AsyncRateLimitedTransport(transport), retry=self._retry) if self._retry is not None else transport,
+            timeout=self._timeout,
+        )
+
+    def _get_loop_client(
+        self, clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient], create: Callable[[], httpx.AsyncClient]
+    ) -> httpx.AsyncClient:
         loop = asyncio.get_running_loop()
 
         # Loop key exists → return existing client
-        client = self._async_clients.get(loop)
+        client = clients.get(loop)
         if client is not None:
             return client
 
         with self._async_clients_lock:
-            client = self._async_clients.get(loop)
+            client = clients.get(loop)
 
             # Dual-check to prevent race conditions, the client might have been created by another thread.
             if client is not None:
                 return client
 
             # Otherwise create a new AsyncClient bound to this loop
-            client = httpx.AsyncClient(
-                transport=RetryTransport(retry=self._retry) if self._retry is not None else None,
-                timeout=self._timeout,
-                limits=self._limits,
-            )
-            self._async_clients[loop] = client
+            client = create()
+            clients[loop] = client
 
         return client
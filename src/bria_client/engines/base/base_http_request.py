@@ -1,21 +1,122 @@
+import importlib.util
+import warnings
 from abc import ABC
+from typing import Any
 
 import httpx
 from httpx_retries import Retry
 
+from bria_client.engines.base.json_stream import JsonStream
+
+
+def default_storage_retry() -> Retry:
+    """
+    Retry transient failures of presigned upload POSTs and media downloads (GETs).
+    The POST stores the file under a key fixed by the presigned policy, so sending it again is safe (unlike API POSTs).
+    """
+    return Retry(total=5, backoff_factor=0.5, allowed_methods=["POST", "GET"])
+
 
 class BaseHTTPRequest(ABC):
     """Abstract base class defining the common interface for HTTP requests"""
 
-    def __init__(self, request_timeout: int = 30, retry: Retry | None = None) -> None:
+    def __init__(
+        self,
+        request_timeout: float = 30,
+        retry: Retry | None = None,
+        storage_retry: Retry | None = None,
+        http2: bool = False,
+        http2_max_connections: int = 10,
+        timeout: httpx.Timeout | None = None,
+        limits: httpx.Limits | None = None,
+        endpoint_timeouts: dict[str, float] | None = None,
+    ) -> None:
         """
         Initialize the HTTP Client
 
         Args:
-            `request_timeout: int` - The default request timeout for reading response from the server (client side rejection)
+            `request_timeout: float` - The default request timeout for reading response from the server (client side rejection)
             `retry: Retry | None` - Retry configuration for requests
+            `storage_retry: Retry | None` - Retry configuration for file uploads to storage (defaults to `default_storage_retry()`)
+            `http2: bool` - Multiplex API requests over HTTP/2 connections (requires the `h2` package, falls back to HTTP/1.1)
+            `http2_max_connections: int` - Connections kept to the API when using HTTP/2, each one carries many concurrent requests
+                (ignored when `limits` is given)
+            `timeout: httpx.Timeout | None` - Connect / write / pool timeouts of API requests (the read timeout is `request_timeout`)
+            `limits: httpx.Limits | None` - Connection pool limits of the API client, over HTTP/1.1 and HTTP/2 alike
+            `endpoint_timeouts: dict[str, float] | None` - Read timeout by endpoint prefix (e.g. `{"status": 10, "video": 300}`)
         """
         self.request_timeout = request_timeout
         self._retry = retry
-        self._timeout = httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=5.0)
-        self._limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+        self._timeout = timeout or httpx.Timeout(connect=10.0, read=request_timeout, write=30.0, pool=30.0)
+        self.endpoint_timeouts = {self._normalize_endpoint(prefix): value for prefix, value in (endpoint_timeouts or {}).items()}
+        self.http2 = http2 and self._h2_available()
+        if limits is not None:
+            # Explicit limits win over `http2_max_connections`
+            self._limits = limits
+        elif self.http2:
+            self._limits = httpx.Limits(max_keepalive_connections=http2_max_connections, max_connections=http2_max_connections, keepalive_expiry=30.0)
+        else:
+            self._limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+        # Uploads and downloads go to other hosts (presigned storage URLs, image URLs) through their own pool: a large file must
+        # not hold an API connection, and no timeout bounds a whole transfer, only each network operation (a write may wait on a slow uplink)
+        self.storage_retry = storage_retry or default_storage_retry()
+        self._storage_timeout = httpx.Timeout(connect=10.0, read=60.0, write=60.0, pool=None)
+        self._storage_limits = httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0)
+
+    def _request_timeout(self, url: str, override: float | httpx.Timeout | None = None) -> httpx.Timeout:
+        """
+        The timeout of one API request: an explicit `override` (the `request_timeout=` of a call), else the read timeout of
+        the longest matching `endpoint_timeouts` prefix, else `request_timeout`
+        """
+        if isinstance(override, httpx.Timeout):
+            return override
+        read = override
+        if read is None:
+            endpoint = self._normalize_endpoint(httpx.URL(url).path.split("/v2/", 1)[-1])
+            matches = [prefix for prefix in self.endpoint_timeouts if endpoint == prefix or endpoint.startswith(f"{prefix}/")]
+            read = self.endpoint_timeouts[max(matches, key=len)] if matches else self.request_timeout
+        return httpx.Timeout(connect=self._timeout.connect, read=read, write=self._timeout.write, pool=self._timeout.pool)
+
+    @staticmethod
+    def _normalize_endpoint(endpoint: str) -> str:
+        return endpoint.strip("/").removeprefix("v2").strip("/")
+
+    @staticmethod
+    def _h2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            warnings.warn("HTTP/2 requires the `h2` package (pip install 'bria-client[http2]'), falling back to HTTP/1.1", stacklevel=3)
+            return False
+        return True
+
+    def _api_transport(self) -> httpx.HTTPTransport:
+        """
+        The transport of the sync API client.
+        Built explicitly since httpx ignores the client `limits` (and `http2`) once a transport is given, as done for the retry transport.
+        When the server does not negotiate h2 (ALPN), connections fall back to HTTP/1.1.
+        """
+        return httpx.HTTPTransport(http2=self.http2, limits=self._limits)
+
+    def _async_api_transport(self) -> httpx.AsyncHTTPTransport:
+        """The transport of the async API clients, see `_api_transport()`"""
+        return httpx.AsyncHTTPTransport(http2=self.http2, limits=self._limits)
+
+    def _storage_transport(self) -> httpx.HTTPTransport:
+        """The transport of the sync storage client (uploads / downloads), see `_api_transport()`"""
+        return httpx.HTTPTransport(limits=self._storage_limits)
+
+    def _async_storage_transport(self) -> httpx.AsyncHTTPTransport:
+        """The transport of the async storage clients, see `_api_transport()`"""
+        return httpx.AsyncHTTPTransport(limits=self._storage_limits)
+
+    @staticmethod
+    def _prepare_stream(payload: dict[str, Any] | None, headers: dict[str, str] | None) -> tuple[JsonStream | None, dict[str, str] | None]:
+        """
+        Payloads holding `Image` values are sent as a streamed JSON body, so the images base64 encoding is never built in memory as a whole.
+
+        Returns:
+            `tuple[JsonStream | None, dict[str, str] | None]` - The stream (`None` when the payload can be sent as regular json) and the request headers
+        """
+        if payload is None or not JsonStream.contains_image(payload):
+            return None, headers
+        stream = JsonStream(payload)
+        return stream, {**(headers or {}), **stream.headers}
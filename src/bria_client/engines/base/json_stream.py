@@ -0,0 +1,88 @@
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from bria_client._lazy import if_imported
+
+IMAGE_MODULE = "bria_client.toolkit.image"
+
+
+class JsonStream:
+    """
+    JSON request body that streams the base64 encoding of `Image` values while the request is being sent.
+
+    Everything but the images is serialized up front (it is small), images are encoded chunk by chunk on iteration,
+    so the peak memory of a request stays close to the encoded image size instead of several copies of its base64 string.
+    The stream can be iterated more than once (e.g. when a request is retried).
+    """
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        from bria_client.toolkit.image import Image
+
+        self._image_type = Image
+        self._parts: list[bytes | Image] = []
+        self._buffer: list[str] = []
+        self._collect(payload)
+        self._flush()
+        self.content_length = sum(len(part) if isinstance(part, bytes) else part.base64_length + 2 for part in self._parts)
+
+    @staticmethod
+    def contains_image(value: Any) -> bool:
+        """Whether `value` holds an `Image` anywhere in its (nested) dicts / lists"""
+        # No `Image` exists before its module is imported: no need to import it (with numpy and Pillow) to know there is none
+        iter_images = if_imported(IMAGE_MODULE, "iter_images")
+        return iter_images is not None and next(iter_images(value), None) is not None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Content-Type": "application/json", "Content-Length": str(self.content_length)}
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield b'"'
+                yield from part.iter_base64()
+                yield b'"'
+
+    def _collect(self, value: Any) -> None:
+        if isinstance(value, self._image_type):
+            self._flush()
+            self._parts.append(value)
+        elif isinstance(value, dict):
+            self._buffer.append("{")
+            for index, (key, item) in enumerate(value.items()):
+                self._buffer.append(f"{',' if index else ''}{self._dumps(str(key))}:")
+                self._collect(item)
+            self._buffer.append("}")
+        elif isinstance(value, list | tuple):
+            self._buffer.append("[")
+            for index, item in enumerate(value):
+                if index:
+                    self._buffer.append(",")
+                self._collect(item)
+            self._buffer.append("]")
+        else:
+            self._buffer.append(self._dumps(value))
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._parts.append("".join(self._buffer).encode("utf-8"))
+            self._buffer.clear()
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        # Same settings httpx uses for `json=` bodies
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+class AsyncJsonStream:
+    """Async iterable view of a `JsonStream`, as required by `httpx.AsyncClient` for streamed bodies"""
+
+    def __init__(self, stream: JsonStream) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._stream:
+            yield chunk
@@ -0,0 +1,56 @@
+import httpx
+
+from bria_client.engines.rate_limiter import RateLimitSlot
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    Takes the `RateLimitSlot` of a request (its `rate_limit` extension) for each attempt, placed behind the retry transport.
+
+    The retry transport sends the same request again, so every retried attempt waits for the limiter and every attempt's
+    status (e.g. a 429 that is retried) reaches the adaptive rate. Requests without the extension are sent as is.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        slot: RateLimitSlot | None = request.extensions.get("rate_limit")
+        if slot is None:
+            return self._transport.handle_request(request)
+        if not slot.held:
+            slot.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        slot.release(response.status_code)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """The async version of `RateLimitedTransport`"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot: RateLimitSlot | None = request.extensions.get("rate_limit")
+        if slot is None:
+            return await self._transport.handle_async_request(request)
+        if not slot.held:
+            await slot.acquire_async()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        slot.release(response.status_code)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
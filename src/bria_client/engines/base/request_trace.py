@@ -0,0 +1,113 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from bria_client.toolkit.models import RequestTiming
+
+
+class RequestTrace:
+    """
+    What happened while one API request was sent, fed by the httpx `trace` request extension.
+
+    httpx calls the trace when every step of an attempt starts and completes (e.g. `connection.connect_tcp.started`,
+    `http11.receive_response_headers.complete`). The retry transport sends the same request again, so a new
+    `send_request_headers` step means the request is being retried, and the steps of the previous attempt are forgotten.
+    """
+
+    def __init__(self, on_retry: Callable[[int], None] | None = None) -> None:
+        """
+        Args:
+            `on_retry: Callable[[int], None] | None` - Called with the retry number when the request is sent again
+        """
+        self.started_at = time.perf_counter()
+        self.first_event_at: float | None = None
+        self.attempts = 0
+        self.status_code: int | None = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._retries_made = 0
+        self._on_retry = on_retry
+        # When each step of the current attempt started / completed, by step name without the protocol (e.g. `send_request_body`)
+        self._steps: dict[str, list[float | None]] = {}
+        self._attempt_over = False
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if self.first_event_at is None:
+            self.first_event_at = now
+        if self._attempt_over:
+            self._steps.clear()
+            self._attempt_over = False
+
+        step, _, stage = event_name.rpartition(".")
+        step = step.rpartition(".")[2]
+        times = self._steps.setdefault(step, [None, None])
+        if stage == "started":
+            times[0] = now
+            if step == "send_request_headers":
+                self.attempts += 1
+                if self.attempts > 1 and self._on_retry is not None:
+                    self._on_retry(self.attempts - 1)
+        elif stage == "complete":
+            times[1] = now
+            if step == "response_closed":
+                self._attempt_over = True
+        elif stage == "failed":
+            self._attempt_over = True
+
+    async def trace_async(self, event_name: str, info: dict[str, Any]) -> None:
+        """The trace callback of async clients (httpcore awaits it)"""
+        self(event_name, info)
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, self._retries_made)
+
+    @property
+    def pool_wait(self) -> float | None:
+        """Seconds from the request start until httpx started working on a connection (waiting for a free one included)"""
+        if self.first_event_at is None:
+            return None
+        return self.first_event_at - self.started_at
+
+    def record_response(self, response: httpx.Response) -> None:
+        self.status_code = response.status_code
+        self.bytes_sent = int(response.request.headers.get("Content-Length", 0))
+        self.bytes_received = response.num_bytes_downloaded
+        retry = response.extensions.get("retry")
+        if retry is not None:
+            # Counts the attempts that failed before sending anything (e.g. connection errors)
+            self._retries_made = retry.attempts_made
+
+    def timing(self, parse: float | None = None) -> RequestTiming:
+        """
+        The phases of the request so far
+
+        Args:
+            `parse: float | None` - Seconds spent parsing the response, measured by the caller
+        """
+        written_at = self._completed("send_request_body") or self._completed("send_request_headers")
+        headers_at = self._completed("receive_response_headers")
+        return RequestTiming(
+            pool=self.pool_wait,
+            connect=self._duration("connect_tcp"),
+            tls=self._duration("start_tls"),
+            write=self._span("send_request_headers", written_at),
+            ttfb=headers_at - written_at if headers_at is not None and written_at is not None else None,
+            read=self._duration("receive_response_body"),
+            parse=parse,
+            retries=self.retries,
+            total=time.perf_counter() - self.started_at,
+        )
+
+    def _completed(self, step: str) -> float | None:
+        return self._steps.get(step, [None, None])[1]
+
+    def _duration(self, step: str) -> float | None:
+        return self._span(step, self._completed(step))
+
+    def _span(self, step: str, until: float | None) -> float | None:
+        started = self._steps.get(step, [None, None])[0]
+        return until - started if started is not None and until is not None else None
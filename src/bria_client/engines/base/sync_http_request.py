@@ -1,3 +1,5 @@
+import threading
+import time
 from typing import Any
 
 import httpx
@@ -5,39 +7,115 @@ from httpx import Response
 from httpx_retries import Retry, RetryTransport
 
 from bria_client.engines.base.base_http_request import BaseHTTPRequest
+from bria_client.engines.base.rate_limited_transport import RateLimitedTransport
+from bria_client.engines.base.request_trace import RequestTrace
 from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.download import Download, conditional_headers, read_body
 from bria_client.toolkit.errors.custom_errors import ServerConnectionError
 
 
 class SyncHTTPRequest(BaseHTTPRequest):
     """Sync-only HTTP request implementation"""
 
-    def __init__(self, request_timeout: int = 30, retry: Retry | None = None) -> None:
+    def __init__(
+        self,
+        request_timeout: float = 30,
+        retry: Retry | None = None,
+        storage_retry: Retry | None = None,
+        http2: bool = False,
+        http2_max_connections: int = 10,
+        timeout: httpx.Timeout | None = None,
+        limits: httpx.Limits | None = None,
+        endpoint_timeouts: dict[str, float] | None = None,
+    ) -> None:
         """
         Initialize the SyncHTTPClient
 
         Args:
-            `request_timeout: int` - The default request timeout for reading response from the server (client side rejection)
+            `request_timeout: float` - The default request timeout for reading response from the server (client side rejection)
             `retry: Retry | None` - Retry configuration for requests
+            `storage_retry: Retry | None` - Retry configuration for file uploads to storage
+            `http2: bool` - Multiplex API requests over HTTP/2 connections
+            `http2_max_connections: int` - Connections kept to the API when using HTTP/2
+            `timeout: httpx.Timeout | None` - Connect / write / pool timeouts of API requests
+            `limits: httpx.Limits | None` - Connection pool limits of the API client
+            `endpoint_timeouts: dict[str, float] | None` - Read timeout by endpoint prefix
         """
-        super().__init__(request_timeout, retry)
+        super().__init__(request_timeout, retry, storage_retry, http2, http2_max_connections, timeout, limits, endpoint_timeouts)
 
         # One sync client for this process:
+        transport = self._api_transport()
         self._client = httpx.Client(
-            transport=RetryTransport(retry=self._retry) if self._retry is not None else None,
+            transport=RetryTransport(transport=RateLimitedTransport(transport), retry=self._retry) if self._retry is not None else transport,
             timeout=self._timeout,
-            limits=self._limits,
         )
+        # Created on first upload / download
+        self._storage_client: httpx.Client | None = None
+        self._storage_client_lock = threading.Lock()
 
     def close(self) -> None:
         self._client.close()
+        with self._storage_client_lock:
+            if self._storage_client is not None:
+                self._storage_client.close()
+                self._storage_client = None
+
+    def upload(self, url: str, data: dict[str, Any], files: dict[str, Any]) -> Response:
+        """
+        Post a multipart form to a presigned storage URL through the pooled storage client
+
+        Args:
+            `url: str` - The presigned upload URL
+            `data: dict[str, Any]` - The form fields
+            `files: dict[str, Any]` - The form files, as accepted by `httpx`
+
+        Returns:
+            `Response` - The storage response
+        """
+        return self._get_storage_client().post(url, data=data, files=files)
+
+    def download(self, url: str, headers: dict[str, str] | None = None, etag: str | None = None) -> Download:
+        """
+        Download a URL (e.g. an image) through the pooled storage client, into a buffer preallocated from its `Content-Length`
+
+        Args:
+            `url: str` - The URL to download
+            `headers: dict[str, str] | None` - The headers to send with the request
+            `etag: str | None` - The `ETag` of a body already downloaded, not downloaded again while it is current
+
+        Returns:
+            `Download` - The body (`None` when the `etag` is current) and its `ETag`
+
+        Raises:
+            `httpx.HTTPStatusError` - When the server answers with an error status
+        """
+        with self._get_storage_client().stream("GET", url, headers=conditional_headers(headers, etag), follow_redirects=True) as response:
+            if etag is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+                return Download(body=None, etag=etag)
+            response.raise_for_status()
+            return Download(body=read_body(response), etag=response.headers.get("ETag"))
+
+    def _get_storage_client(self) -> httpx.Client:
+        with self._storage_client_lock:
+            if self._storage_client is None:
+                self._storage_client = httpx.Client(
+                    transport=RetryTransport(transport=self._storage_transport(), retry=self.storage_retry),
+                    timeout=self._storage_timeout,
+                )
+            return self._storage_client
 
     def request(self, url: str, method: str, payload: dict[str, Any] | None = None, headers: dict[str, str] | None = None, **kwargs: Any) -> BriaResponse:
+        trace = kwargs["trace"] = kwargs.get("trace") or RequestTrace()
         try:
             response = self._request(url, method, payload=payload, headers=headers, **kwargs)
         except httpx.ConnectError:
-            return BriaResponse.from_error(ServerConnectionError(url=url))
-        return BriaResponse.from_http_response(response)
+            bria_response = BriaResponse.from_error(ServerConnectionError(url=url))
+            bria_response.timing = trace.timing()
+            return bria_response
+        parse_started_at = time.perf_counter()
+        bria_response = BriaResponse.from_http_response(response)
+        bria_response.timing = trace.timing(parse=time.perf_counter() - parse_started_at)
+        return bria_response
 
     def _request(self, url: str, method: str, payload: dict[str, Any] | None = None, headers: dict[str, str] | None = None, **kwargs: Any) -> Response:
         """
@@ -48,7 +126,10 @@ class SyncHTTPRequest(BaseHTTPRequest):
             `method: str` - The method to use for the request
             `payload: dict | None` - The payload to send with the request
             `headers: dict | None` - The headers to send with the request
-            `**kwargs` - Additional `httpx.request` compatible keyword arguments to pass to the request
+            `**kwargs` - Additional `httpx.request` compatible keyword arguments to pass to the request,
+                `request_timeout` (seconds to read the response, or an `httpx.Timeout`) to override the default timeout
+                `trace` (a `RequestTrace`) to record what happened while sending the request
+                and `rate_limit` (a `RateLimitSlot`) to go through the rate limiter again for each retry
 
         Returns:
             `RT` - The response from the request
@@ -56,5 +137,17 @@ class SyncHTTPRequest(BaseHTTPRequest):
         Raises:
             `EngineAPIException` - When the request fails
         """
-        response = self._client.request(method, url, headers=headers, json=payload, timeout=self.request_timeout, **kwargs)
+        timeout = self._request_timeout(url, kwargs.pop("request_timeout", None))
+        trace: RequestTrace | None = kwargs.pop("trace", None)
+        if trace is not None:
+            kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": trace}
+        if (rate_limit := kwargs.pop("rate_limit", None)) is not None:
+            kwargs["extensions"] = {**kwargs.get("extensions", {}), "rate_limit": rate_limit}
+        stream, headers = self._prepare_stream(payload, headers)
+        if stream is not None:
+            response = self._client.request(method, url, headers=headers, content=stream, timeout=timeout, **kwargs)
+        else:
+            response = self._client.request(method, url, headers=headers, json=payload, timeout=timeout, **kwargs)
+        if trace is not None:
+            trace.record_response(response)
         return response
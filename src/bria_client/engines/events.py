@@ -0,0 +1,98 @@
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RequestStarted:
+    endpoint: str
+    method: str
+
+
+@dataclass(frozen=True)
+class RequestEnded:
+    endpoint: str
+    method: str
+    # `None` when no HTTP response was received (e.g. the connection failed)
+    status_code: int | None
+    started_at: float
+    duration: float
+    bytes_sent: int
+    bytes_received: int
+    retries: int
+    # Seconds spent before httpx started working on a connection, `None` when unknown
+    pool_wait: float | None
+    error: BaseException | None = None
+
+
+@dataclass(frozen=True)
+class RequestRetried:
+    endpoint: str
+    method: str
+    retry: int
+
+
+@dataclass(frozen=True)
+class PollTick:
+    request_id: str
+    attempt: int
+    status: str
+    # Seconds until the next status request, `None` once the request is done
+    next_delay: float | None
+
+
+@dataclass(frozen=True)
+class UploadProgress:
+    path: str
+    bytes_sent: int
+    total_bytes: int
+
+
+class EventHooks:
+    """
+    Receives the events of a client: every method is a no-op, override the ones of interest.
+
+    Hooks are called synchronously from the thread (or event loop) making the request, so they must be quick.
+    An exception raised by a hook is logged and never fails the request.
+    """
+
+    def on_request_started(self, event: RequestStarted) -> None:
+        pass
+
+    def on_request_ended(self, event: RequestEnded) -> None:
+        pass
+
+    def on_request_retried(self, event: RequestRetried) -> None:
+        pass
+
+    def on_poll_tick(self, event: PollTick) -> None:
+        pass
+
+    def on_upload_progress(self, event: UploadProgress) -> None:
+        pass
+
+
+class EventDispatcher:
+    """Fans events out to a set of `EventHooks`"""
+
+    def __init__(self, hooks: Iterable[EventHooks] = ()) -> None:
+        self.hooks: list[EventHooks] = list(hooks)
+
+    def __bool__(self) -> bool:
+        return bool(self.hooks)
+
+    def add(self, hooks: EventHooks) -> None:
+        self.hooks.append(hooks)
+
+    def remove(self, hooks: EventHooks) -> None:
+        self.hooks.remove(hooks)
+
+    def emit(self, name: str, event: object) -> None:
+        """Call the `name` method of every hook with `event`"""
+        for hooks in self.hooks:
+            try:
+                getattr(hooks, name)(event)
+            except Exception:
+                logger.exception(f"Event hook {type(hooks).__name__}.{name} failed")
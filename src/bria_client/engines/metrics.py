@@ -0,0 +1,216 @@
+import bisect
+import threading
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from bria_client.engines.events import EventHooks, PollTick, RequestEnded, UploadProgress
+
+# Upper bounds (seconds) of the latency buckets, spanning quick status checks to long synchronous generations
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class Histogram:
+    """Counts of observed values by bucket (each count is for its bucket only, the last one is for values above every bound)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """The upper bound of the bucket holding the `q` quantile (`inf` above the last bound, `None` when empty)"""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts, strict=True):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def cumulative(self) -> Iterator[tuple[float, int]]:
+        """`(upper bound, count of values <= bound)` pairs, ending with `inf`"""
+        seen = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts, strict=True):
+            seen += count
+            yield bound, seen
+
+    def copy(self) -> "Histogram":
+        histogram = Histogram(self.buckets)
+        histogram.counts, histogram.count, histogram.sum = list(self.counts), self.count, self.sum
+        return histogram
+
+
+@dataclass
+class EndpointMetrics:
+    latency: Histogram
+    pool_wait: Histogram
+    # By status code, "error" for requests that got no response
+    status_codes: Counter[str] = field(default_factory=Counter)
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.latency.count
+
+    def copy(self) -> "EndpointMetrics":
+        return EndpointMetrics(
+            latency=self.latency.copy(),
+            pool_wait=self.pool_wait.copy(),
+            status_codes=Counter(self.status_codes),
+            retries=self.retries,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+        )
+
+
+class MetricsCollector(EventHooks):
+    """
+    Built-in `EventHooks` aggregating request metrics by endpoint, in memory. Safe to share across threads and clients.
+
+    Usage:
+    >>> metrics = MetricsCollector()
+    >>> client = BriaSyncClient(event_hooks=[metrics])
+    >>> metrics.endpoints["image/edit/remove_background"].latency.quantile(0.95)
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Args:
+            `buckets: Sequence[float]` - Upper bounds (seconds) of the latency and pool wait histograms
+        """
+        self.buckets = tuple(buckets)
+        self.poll_ticks = 0
+        self.uploads = 0
+        self.upload_bytes = 0
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def endpoints(self) -> dict[str, EndpointMetrics]:
+        """A snapshot of the metrics by endpoint"""
+        with self._lock:
+            return {endpoint: metrics.copy() for endpoint, metrics in self._endpoints.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self.poll_ticks = self.uploads = self.upload_bytes = 0
+
+    def on_request_ended(self, event: RequestEnded) -> None:
+        with self._lock:
+            metrics = self._endpoints.get(event.endpoint)
+            if metrics is None:
+                metrics = self._endpoints[event.endpoint] = EndpointMetrics(latency=Histogram(self.buckets), pool_wait=Histogram(self.buckets))
+            metrics.latency.observe(event.duration)
+            if event.pool_wait is not None:
+                metrics.pool_wait.observe(event.pool_wait)
+            metrics.status_codes[str(event.status_code) if event.status_code is not None else "error"] += 1
+            metrics.retries += event.retries
+            metrics.bytes_sent += event.bytes_sent
+            metrics.bytes_received += event.bytes_received
+
+    def on_poll_tick(self, event: PollTick) -> None:
+        with self._lock:
+            self.poll_ticks += 1
+
+    def on_upload_progress(self, event: UploadProgress) -> None:
+        if event.bytes_sent < event.total_bytes:
+            return
+        with self._lock:
+            self.uploads += 1
+            self.upload_bytes += event.total_bytes
+
+
+class PrometheusCollector:
+    """
+    Exposes a `MetricsCollector` to Prometheus (requires the `prometheus-client` package).
+
+    Usage:
+    >>> from prometheus_client import REGISTRY
+    >>> REGISTRY.register(PrometheusCollector(metrics))
+    """
+
+    def __init__(self, metrics: MetricsCollector, namespace: str = "bria_client") -> None:
+        try:
+            from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+        except ImportError as e:
+            raise ImportError("PrometheusCollector requires the `prometheus-client` package (pip install 'bria-client[prometheus]')") from e
+        self._counter = CounterMetricFamily
+        self._histogram = HistogramMetricFamily
+        self.metrics = metrics
+        self.namespace = namespace
+
+    def collect(self) -> Iterator[Any]:
+        endpoints = self.metrics.endpoints
+        latency = self._histogram(f"{self.namespace}_request_duration_seconds", "API request latency", labels=["endpoint"])
+        pool_wait = self._histogram(f"{self.namespace}_pool_wait_seconds", "Time waiting for a pooled connection", labels=["endpoint"])
+        requests = self._counter(f"{self.namespace}_requests", "API requests by status code", labels=["endpoint", "status_code"])
+        retries = self._counter(f"{self.namespace}_retries", "API request retries", labels=["endpoint"])
+        bytes_sent = self._counter(f"{self.namespace}_sent_bytes", "API request body bytes", labels=["endpoint"])
+        bytes_received = self._counter(f"{self.namespace}_received_bytes", "API response body bytes", labels=["endpoint"])
+        for endpoint, metrics in endpoints.items():
+            for family, histogram in ((latency, metrics.latency), (pool_wait, metrics.pool_wait)):
+                buckets = [("+Inf" if bound == float("inf") else str(bound), count) for bound, count in histogram.cumulative()]
+                family.add_metric([endpoint], buckets, histogram.sum)
+            for status_code, count in metrics.status_codes.items():
+                requests.add_metric([endpoint, status_code], count)
+            retries.add_metric([endpoint], metrics.retries)
+            bytes_sent.add_metric([endpoint], metrics.bytes_sent)
+            bytes_received.add_metric([endpoint], metrics.bytes_received)
+        yield from (latency, pool_wait, requests, retries, bytes_sent, bytes_received)
+
+
+class OpenTelemetryHooks(EventHooks):
+    """
+    Records every API request as an OpenTelemetry client span and metrics (requires the `opentelemetry-api` package).
+    Without a configured SDK the OpenTelemetry API is a no-op.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None) -> None:
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetryHooks requires the `opentelemetry-api` package (pip install 'bria-client[opentelemetry]')") from e
+        self._trace = trace
+        self._tracer = trace.get_tracer("bria_client", tracer_provider=tracer_provider)
+        meter = metrics.get_meter("bria_client", meter_provider=meter_provider)
+        self._duration = meter.create_histogram("bria_client.request.duration", unit="s", description="API request latency")
+        self._pool_wait = meter.create_histogram("bria_client.request.pool_wait", unit="s", description="Time waiting for a pooled connection")
+        self._retries = meter.create_counter("bria_client.request.retries", description="API request retries")
+        self._bytes_sent = meter.create_counter("bria_client.request.sent", unit="By", description="API request body bytes")
+        self._bytes_received = meter.create_counter("bria_client.request.received", unit="By", description="API response body bytes")
+
+    def on_request_ended(self, event: RequestEnded) -> None:
+        attributes: dict[str, Any] = {"bria.endpoint": event.endpoint, "http.request.method": event.method}
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        self._duration.record(event.duration, attributes)
+        if event.pool_wait is not None:
+            self._pool_wait.record(event.pool_wait, attributes)
+        self._retries.add(event.retries, attributes)
+        self._bytes_sent.add(event.bytes_sent, attributes)
+        self._bytes_received.add(event.bytes_received, attributes)
+
+        # The span is recorded once the request is over, with its actual start and end times
+        span = self._tracer.start_span(
+            f"{event.method} {event.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={**attributes, "bria.retries": event.retries},
+            start_time=int(event.started_at * 1e9),
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+        if event.error is not None or (event.status_code is not None and event.status_code >= 400):
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=int((event.started_at + event.duration) * 1e9))
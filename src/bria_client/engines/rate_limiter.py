@@ -0,0 +1,312 @@
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at `rate` tokens per second, holding at most `burst` tokens.
+
+    Acquiring reserves a token even when the bucket is empty (the balance goes negative) and returns how long the caller
+    has to wait for it, so waiters are served in arrival order without spinning.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returns the seconds to wait before using it"""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class ConcurrencyLimit:
+    """
+    Caps the number of requests in flight, shared by threads and event loops alike.
+
+    Released slots are handed directly to the oldest waiter: a `threading.Event` for sync callers or a future
+    (woken thread-safely on its own loop) for async ones.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self.limit = limit
+        self._in_flight = 0
+        self._waiters: deque[threading.Event | asyncio.Future] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            future = loop.create_future()
+            self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if future in self._waiters:
+                    # Never got a slot
+                    self._waiters.remove(future)
+                    raise
+            if future.done() and not future.cancelled():
+                # Got a slot but was cancelled before using it, pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._in_flight -= 1
+                return
+            waiter = self._waiters.popleft()
+        # The slot is handed over as is, `_in_flight` does not change
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+
+    def _wake(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class AdaptiveRate:
+    """AIMD controller: multiply the rate by `decrease_factor` when throttled, add `increase` after each success"""
+
+    def __init__(self, bucket: TokenBucket, min_rate: float, max_rate: float, increase: float, decrease_factor: float, cooldown: float) -> None:
+        self.bucket = bucket
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    def on_response(self, status_code: int | None) -> None:
+        with self._lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                now = time.monotonic()
+                # A burst of throttled responses to requests sent at the same rate should shrink it only once
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self.bucket.set_rate(max(self.min_rate, self.bucket.rate * self.decrease_factor))
+            elif status_code is not None and status_code < 400:
+                self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.increase))
+
+
+class BaseRateLimiter(ABC):
+    """Interface used by `ApiEngine` to throttle requests: acquire before sending, release with the outcome once done"""
+
+    @abstractmethod
+    def acquire(self, endpoint: str, identity: str | None = None) -> None:
+        """Block until a request to `endpoint` may be sent"""
+        pass
+
+    @abstractmethod
+    async def acquire_async(self, endpoint: str, identity: str | None = None) -> None:
+        """Wait (without blocking the event loop) until a request to `endpoint` may be sent"""
+        pass
+
+    @abstractmethod
+    def release(self, endpoint: str, identity: str | None = None, status_code: int | None = None) -> None:
+        """Mark a request acquired with `acquire()` as done, `status_code` feeds the adaptive rate"""
+        pass
+
+
+class RateLimiter(BaseRateLimiter):
+    """
+    Client-side request rate limiter and concurrency governor.
+
+    Requests are throttled by token buckets keyed by endpoint and (optionally) by the caller's auth identity (api_token),
+    so a single instance can be shared by several `BriaSyncClient` / `BriaAsyncClient` instances and threads of one process.
+    With `adaptive=True` each bucket follows AIMD: its rate shrinks on 429/503 responses and grows back on successes.
+
+    Example:
+        ```python
+        limiter = RateLimiter(rate=20, endpoint_rates={"status": 50}, max_concurrency=64, adaptive=True)
+        client = BriaAsyncClient(rate_limiter=limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        endpoint_rates: dict[str, float] | None = None,
+        per_api_token: bool = True,
+        max_concurrency: int | None = None,
+        adaptive: bool = False,
+        min_rate: float | None = None,
+        increase: float | None = None,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            `rate: float` - Requests per second allowed for endpoints without a specific rate
+            `burst: float | None` - Bucket capacity, how many requests may be sent at once after being idle (defaults to `rate`)
+            `endpoint_rates: dict[str, float] | None` - Requests per second by endpoint prefix (e.g. `{"status": 50, "video": 2}`)
+            `per_api_token: bool` - Keep separate buckets for each auth identity instead of one for the whole process
+            `max_concurrency: int | None` - Maximum requests in flight per auth identity
+            `adaptive: bool` - Shrink the rate on 429/503 responses and grow it back on success (AIMD)
+            `min_rate: float | None` - Lower bound of the adaptive rate (defaults to 5% of the configured rate)
+            `increase: float | None` - Rate added after each successful response (defaults to 1% of the configured rate)
+            `decrease_factor: float` - Factor applied to the rate on a throttled response
+            `cooldown: float` - Minimum seconds between two consecutive rate decreases
+        """
+        self.rate = rate
+        self.burst = burst
+        self.endpoint_rates = {self._normalize(prefix): endpoint_rate for prefix, endpoint_rate in (endpoint_rates or {}).items()}
+        self.per_api_token = per_api_token
+        self.max_concurrency = max_concurrency
+        self.adaptive = adaptive
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._controllers: dict[tuple[str, str], AdaptiveRate] = {}
+        self._concurrency: dict[str, ConcurrencyLimit] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, endpoint: str, identity: str | None = None) -> None:
+        bucket, concurrency = self._resolve(endpoint, identity)
+        if concurrency is not None:
+            concurrency.acquire()
+        if (delay := bucket.reserve()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: str, identity: str | None = None) -> None:
+        bucket, concurrency = self._resolve(endpoint, identity)
+        if concurrency is not None:
+            await concurrency.acquire_async()
+        if (delay := bucket.reserve()) > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                if concurrency is not None:
+                    concurrency.release()
+                raise
+
+    def release(self, endpoint: str, identity: str | None = None, status_code: int | None = None) -> None:
+        key = self._key(endpoint, identity)
+        with self._lock:
+            controller = self._controllers.get(key)
+            concurrency = self._concurrency.get(key[1])
+        if concurrency is not None:
+            concurrency.release()
+        if controller is not None:
+            controller.on_response(status_code)
+
+    def current_rate(self, endpoint: str, identity: str | None = None) -> float:
+        """The current rate of the bucket `endpoint` falls in"""
+        bucket, _ = self._resolve(endpoint, identity)
+        return bucket.rate
+
+    def _resolve(self, endpoint: str, identity: str | None) -> tuple[TokenBucket, ConcurrencyLimit | None]:
+        key = self._key(endpoint, identity)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate = self.endpoint_rates.get(key[0], self.rate)
+                bucket = self._buckets[key] = TokenBucket(rate=rate, burst=self.burst)
+                if self.adaptive:
+                    self._controllers[key] = AdaptiveRate(
+                        bucket,
+                        min_rate=self.min_rate if self.min_rate is not None else rate * 0.05,
+                        max_rate=rate,
+                        increase=self.increase if self.increase is not None else rate * 0.01,
+                        decrease_factor=self.decrease_factor,
+                        cooldown=self.cooldown,
+                    )
+            concurrency = None
+            if self.max_concurrency is not None:
+                concurrency = self._concurrency.get(key[1])
+                if concurrency is None:
+                    concurrency = self._concurrency[key[1]] = ConcurrencyLimit(self.max_concurrency)
+        return bucket, concurrency
+
+    def _key(self, endpoint: str, identity: str | None) -> tuple[str, str]:
+        """Bucket key: the longest configured endpoint prefix matching `endpoint` ("*" if none) and the auth scope"""
+        endpoint = self._normalize(endpoint)
+        matches = [prefix for prefix in self.endpoint_rates if endpoint == prefix or endpoint.startswith(f"{prefix}/")]
+        endpoint_key = max(matches, key=len) if matches else "*"
+        identity_key = identity if self.per_api_token and identity is not None else "*"
+        return endpoint_key, identity_key
+
+    @staticmethod
+    def _normalize(endpoint: str) -> str:
+        return endpoint.strip("/").removeprefix("v2").strip("/")
+
+
+class RateLimitSlot:
+    """
+    The limiter slot of one API request, taken again by every retry of the request.
+
+    `ApiEngine` takes the slot of the first attempt. When the http client retries, its transport hands the slot back after
+    each attempt (reporting the attempt's status to the adaptive rate) and takes a new one before the next attempt, so
+    retries draw from the budget like any request. Whatever is still held once the request is over is released by the engine.
+    """
+
+    def __init__(self, limiter: BaseRateLimiter, endpoint: str, identity: str | None = None) -> None:
+        self.limiter = limiter
+        self.endpoint = endpoint
+        self.identity = identity
+        self.held = False
+
+    def acquire(self) -> None:
+        self.limiter.acquire(self.endpoint, self.identity)
+        self.held = True
+
+    async def acquire_async(self) -> None:
+        await self.limiter.acquire_async(self.endpoint, self.identity)
+        self.held = True
+
+    def release(self, status_code: int | None = None) -> None:
+        """Hand the slot back, does nothing when it is not held"""
+        if not self.held:
+            return
+        self.held = False
+        self.limiter.release(self.endpoint, self.identity, status_code)
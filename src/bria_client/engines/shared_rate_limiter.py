@@ -0,0 +1,134 @@
+import asyncio
+import multiprocessing
+import time
+from multiprocessing.context import BaseContext
+
+from bria_client.engines.rate_limiter import THROTTLE_STATUS_CODES, BaseRateLimiter
+
+# Layout of the shared state array
+_RATE, _TOKENS, _UPDATED_AT, _LAST_DECREASE = range(4)
+
+
+class SharedRateLimiter(BaseRateLimiter):
+    """
+    Rate limiter and in-flight cap shared by every worker process of one machine.
+
+    The token bucket lives in shared memory (guarded by a process-shared lock) and the in-flight cap is a process-shared
+    semaphore, so N worker processes each running their own client draw from a single request budget.
+    Unlike `RateLimiter` there is one budget for all endpoints and api_tokens, matching a per-account quota.
+
+    Create it in the parent process and hand it to the workers when they are started, e.g. through a pool initializer:
+        ```python
+        limiter = SharedRateLimiter(rate=20, max_concurrency=64, adaptive=True)
+
+        def init_worker(limiter):
+            global client
+            client = BriaAsyncClient(rate_limiter=limiter)
+
+        with multiprocessing.Pool(processes=8, initializer=init_worker, initargs=(limiter,)) as pool:
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        max_concurrency: int | None = None,
+        adaptive: bool = False,
+        min_rate: float | None = None,
+        increase: float | None = None,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+        poll_interval: float = 0.005,
+        max_poll_interval: float = 0.25,
+        context: BaseContext | None = None,
+    ) -> None:
+        """
+        Args:
+            `rate: float` - Requests per second allowed across all processes
+            `burst: float | None` - Bucket capacity, how many requests may be sent at once after being idle (defaults to `rate`)
+            `max_concurrency: int | None` - Maximum requests in flight across all processes
+            `adaptive: bool` - Shrink the rate on 429/503 responses and grow it back on success (AIMD)
+            `min_rate: float | None` - Lower bound of the adaptive rate (defaults to 5% of `rate`)
+            `increase: float | None` - Rate added after each successful response (defaults to 1% of `rate`)
+            `decrease_factor: float` - Factor applied to the rate on a throttled response
+            `cooldown: float` - Minimum seconds between two consecutive rate decreases
+            `poll_interval: float` - Seconds before the second attempt of async callers waiting for an in-flight slot
+            `max_poll_interval: float` - Upper bound of the doubling delay between those attempts
+            `context: BaseContext | None` - The multiprocessing context the workers are started with
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        context = context or multiprocessing.get_context()
+        self.max_rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.adaptive = adaptive
+        self.min_rate = min_rate if min_rate is not None else rate * 0.05
+        self.increase = increase if increase is not None else rate * 0.01
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._lock = context.Lock()
+        self._state = context.RawArray("d", [rate, self.burst, time.monotonic(), float("-inf")])
+        self._slots = context.BoundedSemaphore(max_concurrency) if max_concurrency is not None else None
+
+    @property
+    def rate(self) -> float:
+        """The current shared rate"""
+        with self._lock:
+            return self._state[_RATE]
+
+    def acquire(self, endpoint: str, identity: str | None = None) -> None:
+        if self._slots is not None:
+            self._slots.acquire()
+        if (delay := self._reserve()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: str, identity: str | None = None) -> None:
+        if self._slots is not None:
+            # A process-shared semaphore cannot wake an event loop, poll it with a doubling delay instead of spinning
+            delay = self.poll_interval
+            while not self._slots.acquire(block=False):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_poll_interval)
+        if (delay := self._reserve()) > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                if self._slots is not None:
+                    self._slots.release()
+                raise
+
+    def release(self, endpoint: str, identity: str | None = None, status_code: int | None = None) -> None:
+        if self._slots is not None:
+            self._slots.release()
+        if self.adaptive:
+            self._on_response(status_code)
+
+    def _reserve(self) -> float:
+        with self._lock:
+            self._refill()
+            self._state[_TOKENS] -= 1
+            tokens = self._state[_TOKENS]
+            return 0.0 if tokens >= 0 else -tokens / self._state[_RATE]
+
+    def _refill(self) -> None:
+        # CLOCK_MONOTONIC is system-wide, so timestamps written by one process are meaningful to the others
+        now = time.monotonic()
+        elapsed = now - self._state[_UPDATED_AT]
+        self._state[_TOKENS] = min(self.burst, self._state[_TOKENS] + elapsed * self._state[_RATE])
+        self._state[_UPDATED_AT] = now
+
+    def _on_response(self, status_code: int | None) -> None:
+        with self._lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                now = time.monotonic()
+                if now - self._state[_LAST_DECREASE] >= self.cooldown:
+                    self._refill()
+                    self._state[_LAST_DECREASE] = now
+                    self._state[_RATE] = max(self.min_rate, self._state[_RATE] * self.decrease_factor)
+            elif status_code is not None and status_code < 400:
+                self._refill()
+                self._state[_RATE] = min(self.max_rate, self._state[_RATE] + self.increase)
@@ -0,0 +1,112 @@
+import asyncio
+import hashlib
+import json
+import threading
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from bria_client.toolkit.hashing import hash_canonical
+
+T = TypeVar("T")
+
+
+class _LeaderAbandoned(Exception):
+    """The call sharing its result was cancelled, its waiters send the request themselves"""
+
+
+class SingleFlight:
+    """
+    Shares one HTTP exchange among identical requests in flight at the same time: the first caller sends the request,
+    the others wait for its response and get the same `BriaResponse` object.
+
+    Calls are shared across threads and event loops alike (through a `concurrent.futures.Future`). A request is never
+    coalesced with one that already completed, so nothing is cached.
+
+    Only `GET` requests (e.g. status polls) are coalesced by default: identical `POST` payloads are separate jobs,
+    add `POST` to `methods` only when identical concurrent jobs may share one result.
+    """
+
+    def __init__(self, methods: Iterable[str] = ("GET",)) -> None:
+        """
+        Args:
+            `methods: Iterable[str]` - The HTTP methods of the requests to coalesce
+        """
+        self.methods = frozenset(method.upper() for method in methods)
+        # Number of calls that got the response of another call instead of sending their own request
+        self.coalesced = 0
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of distinct requests in flight"""
+        return len(self._calls)
+
+    def applies(self, method: str) -> bool:
+        return method.upper() in self.methods
+
+    @staticmethod
+    def key(method: str, url: str, payload: dict | None, headers: dict[str, str], kwargs: dict[str, Any]) -> str:
+        """
+        Identifies identical requests: the method, URL, headers (auth included), other request options and the canonical payload.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps([method.upper(), url, sorted(headers.items())]).encode("utf-8"))
+        hash_canonical(digest, kwargs)
+        hash_canonical(digest, payload)
+        return digest.hexdigest()
+
+    def do(self, key: str, send: Callable[[], T]) -> T:
+        """Return the result of the call in flight for `key`, or `send()` and share its result with the callers arriving meanwhile"""
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                try:
+                    result = send()
+                except BaseException as e:
+                    self._finish(key, call, error=e)
+                    raise
+                self._finish(key, call, result=result)
+                return result
+            try:
+                return call.result()
+            except _LeaderAbandoned:
+                continue
+
+    async def do_async(self, key: str, send: Callable[[], Awaitable[T]]) -> T:
+        """`do()` for coroutines"""
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                try:
+                    result = await send()
+                except BaseException as e:
+                    self._finish(key, call, error=e)
+                    raise
+                self._finish(key, call, result=result)
+                return result
+            try:
+                # Shielded: a waiter being cancelled must not cancel the shared call
+                return await asyncio.shield(asyncio.wrap_future(call))
+            except _LeaderAbandoned:
+                continue
+
+    def _join(self, key: str) -> tuple[Future, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                return call, False
+            call = self._calls[key] = Future()
+            return call, True
+
+    def _finish(self, key: str, call: Future, result: Any = None, error: BaseException | None = None) -> None:
+        with self._lock:
+            del self._calls[key]
+        if error is None:
+            call.set_result(result)
+        elif isinstance(error, Exception):
+            call.set_exception(error)
+        else:
+            # Cancelled / interrupted: the waiters should not inherit it
+            call.set_exception(_LeaderAbandoned())
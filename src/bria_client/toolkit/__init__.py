@@ -1,7 +1,43 @@
-from bria_client.toolkit.errors import BriaException
-from bria_client.toolkit.image import Image
-from bria_client.toolkit.models import BriaError, BriaResult, Status
-from bria_client.toolkit.response import BriaResponse
-from bria_client.toolkit.webhook_verification import verify_webhook_signature
+from typing import TYPE_CHECKING
 
-__all__ = ["Image", "BriaResponse", "Status", "BriaResult", "BriaError", "BriaException", "verify_webhook_signature"]
+from bria_client._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from bria_client.toolkit.errors import BriaException
+    from bria_client.toolkit.image import EncodeProfile, Image
+    from bria_client.toolkit.models import BriaError, BriaResult, Status
+    from bria_client.toolkit.response import BriaResponse
+    from bria_client.toolkit.webhook_receiver import PendingDelivery, WebhookReceiver
+    from bria_client.toolkit.webhook_verification import WebhookVerifier, verify_webhook_signature
+
+__all__ = [
+    "Image",
+    "EncodeProfile",
+    "BriaResponse",
+    "Status",
+    "BriaResult",
+    "BriaError",
+    "BriaException",
+    "verify_webhook_signature",
+    "WebhookVerifier",
+    "WebhookReceiver",
+    "PendingDelivery",
+]
+
+# The exports are imported on first access, importing the package alone stays cheap
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BriaException": "bria_client.toolkit.errors",
+        "EncodeProfile": "bria_client.toolkit.image",
+        "Image": "bria_client.toolkit.image",
+        "BriaError": "bria_client.toolkit.models",
+        "BriaResult": "bria_client.toolkit.models",
+        "Status": "bria_client.toolkit.models",
+        "BriaResponse": "bria_client.toolkit.response",
+        "PendingDelivery": "bria_client.toolkit.webhook_receiver",
+        "WebhookReceiver": "bria_client.toolkit.webhook_receiver",
+        "WebhookVerifier": "bria_client.toolkit.webhook_verification",
+        "verify_webhook_signature": "bria_client.toolkit.webhook_verification",
+    },
+)
@@ -0,0 +1,69 @@
+from typing import NamedTuple
+
+import httpx
+
+# Initial buffer size of the bodies sent without `Content-Length`
+UNKNOWN_LENGTH_BUFFER_SIZE = 256 * 1024
+# Larger announced lengths are not trusted up front, the buffer grows as the body is actually received
+MAX_PREALLOCATED_SIZE = 64 * 1024 * 1024
+
+
+class Download(NamedTuple):
+    """The outcome of downloading a URL"""
+
+    # `None` when the server answered `304 Not Modified` (the `etag` sent is still current)
+    body: memoryview | None
+    etag: str | None
+
+
+def conditional_headers(headers: dict[str, str] | None, etag: str | None) -> dict[str, str] | None:
+    """The headers of a download revalidating the body last received with `etag`"""
+    return {**(headers or {}), "If-None-Match": etag} if etag is not None else headers
+
+
+class BodyBuffer:
+    """
+    A response body written chunk by chunk into one buffer, preallocated from its `Content-Length` (so the body is never
+    held twice, as a list of chunks and their concatenation). Grown geometrically when the length is unknown or wrong.
+    """
+
+    def __init__(self, content_length: int | None = None) -> None:
+        self._buffer = bytearray(content_length if content_length is not None else UNKNOWN_LENGTH_BUFFER_SIZE)
+        self._size = 0
+
+    def write(self, chunk: bytes) -> None:
+        end = self._size + len(chunk)
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(end, 2 * len(self._buffer)) - len(self._buffer)))
+        self._buffer[self._size : end] = chunk
+        self._size = end
+
+    def getbuffer(self) -> memoryview:
+        """The body written so far, a view of the buffer (no copy)"""
+        return memoryview(self._buffer)[: self._size]
+
+
+def read_body(response: httpx.Response) -> memoryview:
+    """Read the body of a streamed response into a preallocated buffer"""
+    body = BodyBuffer(_content_length(response))
+    for chunk in response.iter_bytes():
+        body.write(chunk)
+    return body.getbuffer()
+
+
+async def aread_body(response: httpx.Response) -> memoryview:
+    """`read_body()` for async responses"""
+    body = BodyBuffer(_content_length(response))
+    async for chunk in response.aiter_bytes():
+        body.write(chunk)
+    return body.getbuffer()
+
+
+def _content_length(response: httpx.Response) -> int | None:
+    # A compressed body is decoded, its decoded length is unknown
+    if "Content-Encoding" in response.headers:
+        return None
+    try:
+        return min(max(0, int(response.headers["Content-Length"])), MAX_PREALLOCATED_SIZE)
+    except (KeyError, ValueError):
+        return None
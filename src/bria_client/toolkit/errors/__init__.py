@@ -1,4 +1,18 @@
-from bria_client.toolkit.errors.custom_errors import ServerConnectionError
-from bria_client.toolkit.errors.exception import BriaException
+from typing import TYPE_CHECKING
+
+from bria_client._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from bria_client.toolkit.errors.custom_errors import ServerConnectionError
+    from bria_client.toolkit.errors.exception import BriaException
 
 __all__ = ["BriaException", "ServerConnectionError"]
+
+# The exports are imported on first access, importing the package alone stays cheap
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ServerConnectionError": "bria_client.toolkit.errors.custom_errors",
+        "BriaException": "bria_client.toolkit.errors.exception",
+    },
+)
@@ -0,0 +1,33 @@
+import hashlib
+import json
+from typing import Any
+
+from bria_client._lazy import if_imported
+
+
+def hash_canonical(digest: "hashlib._Hash", value: Any) -> None:
+    """
+    Feed the canonical form of `value` to `digest`: dict key order does not matter and an `Image` value hashes like its
+    `as_bria_api_input` string (streamed, never built as one string).
+    """
+    # Every value is prefixed with a type tag (and containers with their size), so distinct payloads never share a byte stream
+    image_type = if_imported("bria_client.toolkit.image", "Image")
+    if image_type is not None and isinstance(value, image_type):
+        # Same bytes as the JSON string of `as_bria_api_input` (base64 needs no escaping)
+        digest.update(b'v%d:"' % (value.base64_length + 2))
+        for chunk in value.iter_base64():
+            digest.update(chunk)
+        digest.update(b'"')
+    elif isinstance(value, dict):
+        digest.update(b"d%d:" % len(value))
+        for key in sorted(value, key=str):
+            hash_canonical(digest, str(key))
+            hash_canonical(digest, value[key])
+    elif isinstance(value, list | tuple):
+        digest.update(b"l%d:" % len(value))
+        for item in value:
+            hash_canonical(digest, item)
+    else:
+        encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        digest.update(b"v%d:" % len(encoded))
+        digest.update(encoded)
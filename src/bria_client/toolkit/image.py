@@ -7,37 +7,216 @@ if sys.version_info < (3, 11):
 else:
     from enum import StrEnum
 
+import asyncio
 import base64
 import binascii
 import io
-from typing import TypeAlias
+import math
+import mmap
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeAlias
 
 import numpy as np
-import requests
 from PIL import Image as PilImage
 from PIL import UnidentifiedImageError
-from pydantic import AnyHttpUrl
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field
 from pydantic_core import core_schema
 
+if TYPE_CHECKING:
+    from bria_client.engines.base.sync_http_request import SyncHTTPRequest
+
 
 class ImageOutputType(StrEnum):
     PNG = "png"
     JPEG = "jpeg"
+    WEBP = "webp"
+
+
+class EncodeProfile(BaseModel):
+    """
+    How in-memory images (PIL images, numpy arrays, and local files when set explicitly) are encoded before being sent.
+    Trades CPU time for bytes on the wire: e.g. a low PNG `compress_level` is fast but large, lossy WebP is small.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    format: ImageOutputType = ImageOutputType.PNG
+    compress_level: int | None = Field(default=None, ge=0, le=9, description="PNG zlib level (0 fastest, 9 smallest)")
+    quality: int | None = Field(default=None, ge=1, le=100, description="JPEG / lossy WebP quality")
+    lossless: bool = Field(default=False, description="Lossless WebP")
+
+    @classmethod
+    def preset(cls, name: str) -> "EncodeProfile":
+        try:
+            return ENCODE_PRESETS[name]
+        except KeyError:
+            raise ValueError(f"Unknown encode preset {name!r}, expected one of {sorted(ENCODE_PRESETS)}") from None
+
+    @property
+    def save_params(self) -> dict[str, Any]:
+        """Keyword arguments for `PIL.Image.save`"""
+        params: dict[str, Any] = {"format": self.format.upper()}
+        if self.format == ImageOutputType.PNG and self.compress_level is not None:
+            params["compress_level"] = self.compress_level
+        if self.format in (ImageOutputType.JPEG, ImageOutputType.WEBP) and self.quality is not None:
+            params["quality"] = self.quality
+        if self.format == ImageOutputType.WEBP and self.lossless:
+            params["lossless"] = True
+        return params
+
 
+ENCODE_PRESETS: dict[str, EncodeProfile] = {
+    # CPU bound: barely compress
+    "fast": EncodeProfile(format=ImageOutputType.PNG, compress_level=1),
+    # Bandwidth bound: lossy but much smaller payloads
+    "small": EncodeProfile(format=ImageOutputType.WEBP, quality=80),
+    # Pixel exact and smaller than PNG, at a higher CPU cost
+    "lossless": EncodeProfile(format=ImageOutputType.WEBP, lossless=True),
+}
 
 Base64String: TypeAlias = str
 LocalPath: TypeAlias = str | Path
 
 ImageSource: TypeAlias = PilImage.Image | AnyHttpUrl | np.ndarray | Base64String | LocalPath
 
+# Image bytes base64 encoded per chunk when streaming a request body (a multiple of 3)
+STREAM_CHUNK_SIZE = 48 * 1024
+
+_SUPPORTED_SOURCES = (PilImage.Image, AnyHttpUrl, np.ndarray, str, Path)
+
+# PIL modes of (H, W) / (H, W, C) uint8 arrays by channel count
+_ARRAY_MODES = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}
+
+# Local files sent as is are read into memory up to this size, larger ones are mapped while they are sent
+MAP_THRESHOLD = 8 * 1024 * 1024
+
+# Leading bytes of the encoded formats local files are sent in without re-encoding (WEBP also has "WEBP" at offset 8)
+_PASSTHROUGH_SIGNATURES = {
+    ImageOutputType.PNG: b"\x89PNG\r\n\x1a\n",
+    ImageOutputType.JPEG: b"\xff\xd8\xff",
+    ImageOutputType.WEBP: b"RIFF",
+}
+
 
 class Image:
-    def __init__(self, image: ImageSource) -> None:
-        self._base64_or_url: str = self._safely_process_image(image)
+    """
+    An image input for the Bria API.
+
+    The source is only stored on creation, decoding / encoding happens on first use (`as_bria_api_input`, streaming,
+    or `resolve()`), which lets `BriaAsyncClient` encode the pending images of a payload off the event loop.
+
+    Local PNG/JPEG/WebP files are recognized by their leading bytes and sent without being decoded, so a corrupt file
+    is rejected by the API instead of here. Files larger than `MAP_THRESHOLD` are mapped until they were sent and mapped again
+    on the next use, a file rewritten in place meanwhile sends its new content.
+    """
+
+    def __init__(self, image: ImageSource, encoding: EncodeProfile | str | None = None) -> None:
+        """
+        Args:
+            `image: ImageSource` - URL, base64 string, local path, PIL image or numpy array
+            `encoding: EncodeProfile | str | None` - Encode profile or preset name (`fast`, `small`, `lossless`).
+                By default in-memory images keep their format (PNG when unknown) and local PNG/JPEG/WebP files are sent as is.
+        """
+        if not isinstance(image, _SUPPORTED_SOURCES):
+            raise ValueError(f"Failed to process image: {image!r}") from TypeError(f"Unsupported ImageSource: {type(image)!r}")
+        self.encoding = EncodeProfile.preset(encoding) if isinstance(encoding, str) else encoding
+        self._source: ImageSource | None = image
+        self._resolved = False
+        self._lock = threading.Lock()
+        # Either a string the API accepts as is (URL / base64) or the encoded image bytes, base64 encoded only when needed
+        self._base64_or_url: str | None = None
+        self._encoded: memoryview | None = None
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the source was already processed"""
+        return self._resolved
+
+    def resolve(self) -> "Image":
+        """Process the source now (idempotent and thread-safe), instead of on first use"""
+        if self._resolved:
+            return self
+        with self._lock:
+            if not self._resolved:
+                processed = self._safely_process_image(self._source)
+                if isinstance(processed, str):
+                    self._base64_or_url = processed
+                else:
+                    self._encoded = processed
+                if not self._is_mapped(processed):
+                    # Drop the reference to the source (e.g. a large array) now that it is encoded, mapped files keep their path
+                    self._source = None
+                self._resolved = True
+        return self
 
     @property
     def as_bria_api_input(self) -> str:
-        return self._base64_or_url
+        self.resolve()
+        if self._base64_or_url is not None:
+            return self._base64_or_url
+        with self._view() as view:
+            api_input = base64.b64encode(view).decode("utf-8")
+        self._release_mapping()
+        return api_input
+
+    @property
+    def base64_length(self) -> int:
+        """Length of `as_bria_api_input`, without building it"""
+        self.resolve()
+        if self._base64_or_url is not None:
+            return len(self._base64_or_url)
+        with self._view() as view:
+            return 4 * math.ceil(view.nbytes / 3)
+
+    def iter_base64(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield `as_bria_api_input` as ascii bytes, chunk by chunk.
+        Only one chunk of the base64 encoding exists in memory at a time.
+
+        Args:
+            `chunk_size: int` - Number of image bytes encoded per chunk (rounded down to a multiple of 3)
+        """
+        self.resolve()
+        if self._base64_or_url is not None:
+            for start in range(0, len(self._base64_or_url), chunk_size):
+                yield self._base64_or_url[start : start + chunk_size].encode("utf-8")
+            return
+        # A multiple of 3 bytes encodes to base64 without padding, so the chunks concatenate to the full encoding
+        chunk_size = max(3, chunk_size - chunk_size % 3)
+        with self._view() as view:
+            for start in range(0, view.nbytes, chunk_size):
+                yield base64.b64encode(view[start : start + chunk_size])
+        self._release_mapping()
+
+    def _view(self) -> memoryview:
+        """The encoded bytes for one use, through a view of its own since another use may release the mapping of a large file"""
+        while True:
+            self.resolve()
+            with self._lock:
+                if self._encoded is not None:
+                    return memoryview(self._encoded)
+
+    @staticmethod
+    def _is_mapped(processed: Base64String | str | memoryview) -> bool:
+        return isinstance(processed, memoryview) and isinstance(processed.obj, mmap.mmap)
+
+    def _release_mapping(self) -> None:
+        """Unmap a large local file once it was sent, so no handle on it is kept between uses (the next use maps it again)"""
+        with self._lock:
+            if self._encoded is None or not self._is_mapped(self._encoded):
+                return
+            mapping = self._encoded.obj
+            self._encoded.release()
+            self._encoded = None
+            self._resolved = False
+        try:
+            mapping.close()
+        except BufferError:
+            # Still being sent by another request, unmapped once that one drops it
+            pass
 
     # noinspection PyUnusedLocal
     @classmethod
@@ -50,13 +229,20 @@ class Image:
             ),
         )
 
-    def _safely_process_image(self, image: ImageSource) -> Base64String | str:
+    def _safely_process_image(self, image: ImageSource) -> Base64String | str | memoryview:
         try:
             return self._process_image(image)
         except Exception as e:
-            raise ValueError(f"Failed to process image: {image!r}") from e
+            raise ValueError(f"Failed to process image: {self._describe(image)}") from e
+
+    @staticmethod
+    def _describe(image: ImageSource) -> str:
+        """The source of an image for error messages (arrays by shape and dtype, their repr holds the pixels)"""
+        if isinstance(image, np.ndarray):
+            return f"array of shape {image.shape} and dtype {image.dtype}"
+        return repr(image)
 
-    def _process_image(self, image: ImageSource) -> Base64String | str:
+    def _process_image(self, image: ImageSource) -> Base64String | str | memoryview:
         if isinstance(image, AnyHttpUrl):
             return str(image)
         if isinstance(image, str):
@@ -67,16 +253,13 @@ class Image:
             if Image.is_base64(image):
                 return image
             # infer it is a local path
-            pil_image = PilImage.open(image)
-            return self._pil_2_b64(pil_image)
+            return self._file_2_bytes(Path(image), self.encoding)
         if isinstance(image, Path):
-            pil_image = PilImage.open(str(image))
-            return self._pil_2_b64(pil_image)
+            return self._file_2_bytes(image, self.encoding)
         if isinstance(image, PilImage.Image):
-            return self._pil_2_b64(image)
+            return self._pil_2_bytes(image, self.encoding)
         if isinstance(image, np.ndarray):
-            pil_image = PilImage.fromarray(image)
-            return self._pil_2_b64(pil_image)
+            return self._array_2_bytes(image, self.encoding)
 
         raise TypeError(f"Unsupported ImageSource: {type(image)!r}")
 
@@ -89,17 +272,129 @@ class Image:
             return False
 
     @staticmethod
-    def _pil_2_b64(image: PilImage.Image) -> Base64String:
+    def sniff_format(header: bytes) -> ImageOutputType | None:
+        """The format of an encoded image the API accepts as is, from its first bytes (`None` when not one of them)"""
+        for fmt, magic in _PASSTHROUGH_SIGNATURES.items():
+            if header.startswith(magic) and (fmt != ImageOutputType.WEBP or header[8:12] == b"WEBP"):
+                return fmt
+        return None
+
+    @classmethod
+    def _file_2_bytes(cls, path: Path, encoding: EncodeProfile | None = None) -> memoryview:
+        with path.open("rb") as f:
+            header = f.read(12)
+            if encoding is None and cls.sniff_format(header) is not None:
+                # Already encoded in a format the API accepts: sent as is, no decode / re-encode
+                if os.fstat(f.fileno()).st_size <= MAP_THRESHOLD:
+                    f.seek(0)
+                    return memoryview(f.read())
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return cls._pil_2_bytes(PilImage.open(path), encoding)
+
+    @staticmethod
+    def _pil_2_bytes(image: PilImage.Image, encoding: EncodeProfile | None = None) -> memoryview:
         buffer = io.BytesIO()
-        image.save(buffer, format=image.format or "PNG")
-        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+        if encoding is None:
+            image.save(buffer, format=image.format or "PNG")
+        else:
+            if encoding.format == ImageOutputType.JPEG and image.mode not in ("RGB", "L", "CMYK"):
+                # JPEG has no alpha channel / palette
+                image = image.convert("RGB")
+            image.save(buffer, **encoding.save_params)
+        # A view over the buffer's memory, unlike `getvalue()` which copies it
+        return buffer.getbuffer()
+
+    @classmethod
+    def _array_2_bytes(cls, array: np.ndarray, encoding: EncodeProfile | None = None) -> memoryview:
+        # Arrays have no format of their own: default to the fast PNG preset, which is lossless too
+        return cls._pil_2_bytes(cls._array_2_pil(array), encoding or ENCODE_PRESETS["fast"])
 
     @staticmethod
-    def _url_2_pil(image_url: str) -> PilImage.Image:
-        with requests.get(image_url, stream=True, timeout=10) as response:
-            response.raise_for_status()
-            chunks = [chunk for chunk in response.iter_content(chunk_size=8192) if chunk]
-            img_bytes = b"".join(chunks)
-        pil_image = PilImage.open(io.BytesIO(img_bytes))
+    def _array_2_pil(array: np.ndarray) -> PilImage.Image:
+        if array.dtype != np.uint8:
+            # e.g. float / uint16 arrays, PIL picks (and converts to) a matching mode
+            return PilImage.fromarray(array)
+        if array.ndim == 3 and array.shape[2] == 1:
+            array = array[:, :, 0]
+        channels = 1 if array.ndim == 2 else array.shape[2] if array.ndim == 3 else None
+        if channels not in _ARRAY_MODES:
+            raise ValueError(f"Expected a (H, W) or (H, W, 1|2|3|4) uint8 array, got shape {array.shape}")
+        # Only non C-contiguous arrays (e.g. slices or transposes) are copied, PIL reads the array buffer as is
+        array = np.ascontiguousarray(array)
+        mode = _ARRAY_MODES[channels]
+        height, width = array.shape[:2]
+        return PilImage.frombuffer(mode, (width, height), array, "raw", mode, 0, 1)
+
+    @classmethod
+    def from_batch(
+        cls,
+        batch: np.ndarray,
+        encoding: EncodeProfile | str | None = None,
+        executor: Executor | None = None,
+        resolve: bool = True,
+    ) -> list["Image"]:
+        """
+        Split a batch of frames into one `Image` per frame, encoded in parallel.
+
+        The frames are views of `batch` (no copy), and PIL releases the GIL while encoding, so a thread pool uses every core.
+
+        Args:
+            `batch: np.ndarray` - A `(N, H, W, C)` (or `(N, H, W)`) uint8 array
+            `encoding: EncodeProfile | str | None` - Encode profile or preset name of every frame (the fast PNG preset by default)
+            `executor: Executor | None` - The pool to encode in (defaults to a thread pool sized to the CPU count)
+            `resolve: bool` - Encode now, or keep the images lazy (e.g. to let `BriaAsyncClient` encode them off the event loop)
+
+        Returns:
+            `list[Image]` - One image per frame, in batch order
+        """
+        if not isinstance(batch, np.ndarray) or batch.ndim not in (3, 4):
+            raise ValueError(f"Expected a (N, H, W) or (N, H, W, C) array, got {getattr(batch, 'shape', type(batch))}")
+        images = [cls(frame, encoding=encoding) for frame in batch]
+        if not resolve or not images:
+            return images
+        if executor is not None:
+            list(executor.map(Image.resolve, images))
+        else:
+            with ThreadPoolExecutor() as pool:
+                list(pool.map(Image.resolve, images))
+        return images
+
+    @staticmethod
+    def _url_2_pil(image_url: str, http_request: "SyncHTTPRequest") -> PilImage.Image:
+        """Download and decode an image through the pooled storage client of `http_request`"""
+        download = http_request.download(image_url)
+        assert download.body is not None
+        return Image._bytes_2_pil(download.body)
+
+    @staticmethod
+    def _bytes_2_pil(data: bytes | memoryview) -> PilImage.Image:
+        pil_image = PilImage.open(io.BytesIO(data))
         pil_image.load()
         return pil_image
+
+
+def iter_images(value: Any) -> Iterator[Image]:
+    """Yield every `Image` found in `value` and its nested dicts / lists"""
+    if isinstance(value, Image):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_images(item)
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from iter_images(item)
+
+
+async def resolve_images(value: Any, executor: Executor | None = None) -> None:
+    """
+    Process the pending `Image` values of a payload in a thread pool, so decoding / encoding them does not block the event loop.
+
+    Args:
+        `value: Any` - A payload (or any nested dicts / lists) possibly holding `Image` values
+        `executor: Executor | None` - The thread pool to use (defaults to the event loop's default executor)
+    """
+    pending = [image for image in iter_images(value) if not image.is_resolved]
+    if not pending:
+        return
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(executor, image.resolve) for image in pending))
@@ -11,8 +11,6 @@ from typing import TYPE_CHECKING, Any, NoReturn
 
 from pydantic import BaseModel, ConfigDict
 
-from bria_client.toolkit.errors.exception import BriaException
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +28,9 @@ class BriaError(BaseModel):
     details: str
 
     def throw(self) -> NoReturn:
+        # Imported when raising, werkzeug is not needed by the responses that are not raised
+        from bria_client.toolkit.errors.exception import BriaException
+
         raise BriaException.from_error(code=self.code, message=self.message, details=self.details)
 
 
@@ -38,3 +39,26 @@ class Status(StrEnum):
     FAILED = "ERROR"
     COMPLETED = "COMPLETED"
     RUNNING = "IN_PROGRESS"
+
+
+class RequestTiming(BaseModel):
+    """
+    Where the time of one API request went, in seconds (`None` for the phases that did not happen, e.g. `connect` on a reused connection).
+    The phases are those of the last attempt when the request was retried, `pool` and `total` span every attempt.
+    """
+
+    # Before httpx started working on a connection (waiting for a free pooled connection included)
+    pool: float | None = None
+    # TCP connection, DNS resolution included
+    connect: float | None = None
+    tls: float | None = None
+    # Sending the request headers and body
+    write: float | None = None
+    # From the request sent to the response headers received (server processing and network latency)
+    ttfb: float | None = None
+    # Receiving the response body
+    read: float | None = None
+    # Decoding and validating the response JSON
+    parse: float | None = None
+    retries: int = 0
+    total: float | None = None
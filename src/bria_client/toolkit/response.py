@@ -5,7 +5,7 @@ from httpx import Response
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_serializer, model_validator
 from pydantic_core.core_schema import SerializationInfo, SerializerFunctionWrapHandler
 
-from bria_client.toolkit.models import BriaError, BriaResult, Status
+from bria_client.toolkit.models import BriaError, BriaResult, RequestTiming, Status
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,8 @@ class BriaResponse(BaseModel):
     result: BriaResult | None = Field(default=None)
     status_url: str | None = Field(default=None)
     headers: dict[str, str] = Field(default_factory=dict, exclude=True)
+    # Set on responses received from the API (not on cached ones)
+    timing: RequestTiming | None = Field(default=None, exclude=True)
 
     @model_validator(mode="before")
     @classmethod
@@ -0,0 +1,278 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_futures
+from http import HTTPStatus
+from typing import Any
+
+from pydantic import ValidationError
+
+from bria_client.toolkit.models import Status
+from bria_client.toolkit.response import BriaResponse
+from bria_client.toolkit.webhook_verification import WebhookVerifier
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_ID_HEADER = "bria-webhook-id"
+WEBHOOK_TIMESTAMP_HEADER = "bria-webhook-timestamp"
+WEBHOOK_SIGNATURE_HEADER = "bria-webhook-signature"
+
+
+class PendingDelivery:
+    """
+    The webhook delivery expected for one submitted job.
+
+    Resolved from whichever thread or event loop receives the delivery (it is backed by a `concurrent.futures.Future`).
+    """
+
+    def __init__(self, request_id: str, late_at: float) -> None:
+        """
+        Args:
+            `request_id: str` - The job the delivery is expected for
+            `late_at: float` - Monotonic time after which the delivery is late and the job status should be polled
+        """
+        self.request_id = request_id
+        self.late_at = late_at
+        self.future: Future[BriaResponse] = Future()
+
+    def late_in(self) -> float:
+        """Seconds until the delivery is late (0 once it is)"""
+        return max(0.0, self.late_at - time.monotonic())
+
+    def wait(self, timeout: float) -> BriaResponse | None:
+        """Block until the delivery is received or `timeout` seconds passed, `None` when it was not received"""
+        done, _ = wait_futures([self.future], timeout=timeout)
+        return self.future.result() if done else None
+
+    async def wait_async(self, timeout: float) -> BriaResponse | None:
+        """`wait()` for coroutines"""
+        try:
+            # Shielded: giving up waiting must not cancel the delivery of the other waiters
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self.future)), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class WebhookReceiver:
+    """
+    Receives the webhook deliveries of submitted jobs and resolves their pending handles, so jobs submitted with the receiver's
+    `url` complete without polling their status (the status is only polled when a delivery is later than `late_after`).
+
+    Mount the receiver as an ASGI app (the receiver itself) or a WSGI app (`receiver.wsgi`), or feed it from any web framework
+    through `receive()`. Every delivery is verified (signature, timestamp and replay, see `WebhookVerifier`), and redeliveries
+    (same `Bria-Webhook-Id`) are acknowledged without being processed again. Safe to share across threads and event loops.
+
+    Usage:
+    >>> receiver = WebhookReceiver(url="https://your-server.example.com/webhook", api_token=api_token)
+    >>> client = BriaAsyncClient(webhook_receiver=receiver)
+    >>> response = await client.submit(endpoint="video/edit/remove_background", payload=payload)
+    >>> result = await client.poll(response)  # resolved by the delivery
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_token: str | None = None,
+        late_after: float = 30,
+        max_pending: int = 10_000,
+        max_body_size: int = 1024 * 1024,
+        on_delivery: Callable[[BriaResponse], None] | None = None,
+        *,
+        verifier: WebhookVerifier | None = None,
+    ) -> None:
+        """
+        Args:
+            `url: str` - The public URL the receiver is reachable at, sent as the `webhook_url` of the submitted jobs
+            `api_token: str | None` - The API token the deliveries are signed with
+            `late_after: float` - Seconds after a submission without delivery before its status is polled
+            `max_pending: int` - Maximum number of pending jobs, remembered deliveries and webhook ids (oldest forgotten first)
+            `max_body_size: int` - Deliveries with a larger body are rejected (413)
+            `on_delivery: Callable[[BriaResponse], None] | None` - Called with every verified new delivery, expected or not
+            `verifier: WebhookVerifier | None` - Verifies the deliveries instead of a verifier of `api_token` (e.g. to accept several tokens)
+        """
+        if verifier is None and api_token is None:
+            raise ValueError("api_token or verifier is required to verify the webhook deliveries")
+        self.url = url
+        self.late_after = late_after
+        self.max_body_size = max_body_size
+        self.on_delivery = on_delivery
+        self.verifier = verifier or WebhookVerifier(api_token)
+        self._max_pending = max_pending
+        self._pending: OrderedDict[str, PendingDelivery] = OrderedDict()
+        # Deliveries received before their job was expected (the webhook can win the race with the submit response)
+        self._unclaimed: OrderedDict[str, BriaResponse] = OrderedDict()
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of jobs waiting for their delivery"""
+        return len(self._pending)
+
+    def expect(self, request_id: str) -> PendingDelivery:
+        """Start waiting for the delivery of a submitted job (resolved right away when it was already received)"""
+        with self._lock:
+            pending = self._pending.get(request_id)
+            if pending is not None:
+                return pending
+            pending = PendingDelivery(request_id, late_at=time.monotonic() + self.late_after)
+            delivered = self._unclaimed.pop(request_id, None)
+            if delivered is None:
+                self._pending[request_id] = pending
+                _trim(self._pending, self._max_pending)
+        if delivered is not None:
+            pending.future.set_result(delivered)
+        return pending
+
+    def pending(self, request_id: str) -> PendingDelivery | None:
+        """The pending handle of `request_id`, `None` when its delivery is not expected"""
+        with self._lock:
+            return self._pending.get(request_id)
+
+    def forget(self, request_id: str) -> None:
+        """Stop waiting for the delivery of `request_id` (e.g. its result was polled)"""
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+    def receive(self, payload: bytes, headers: Mapping[str, str]) -> int:
+        """
+        Process one delivery
+
+        Args:
+            `payload: bytes` - The raw request body
+            `headers: Mapping[str, str]` - The request headers
+
+        Returns:
+            `int` - The HTTP status to answer with
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        webhook_id = headers.get(WEBHOOK_ID_HEADER)
+        timestamp = headers.get(WEBHOOK_TIMESTAMP_HEADER)
+        signature = headers.get(WEBHOOK_SIGNATURE_HEADER)
+        if webhook_id is None or timestamp is None or signature is None:
+            return HTTPStatus.BAD_REQUEST
+        if len(payload) > self.max_body_size:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        with self._lock:
+            redelivery = webhook_id in self._seen
+        if redelivery:
+            # Acknowledged when authentic so that it is not delivered again, but not processed twice
+            return HTTPStatus.OK if self.verifier.verify_signature(payload, webhook_id, timestamp, signature) else HTTPStatus.UNAUTHORIZED
+        if not self.verifier.verify(payload, webhook_id, timestamp, signature):
+            return HTTPStatus.UNAUTHORIZED
+        bria_response = _parse_delivery(payload)
+        if bria_response is None:
+            return HTTPStatus.BAD_REQUEST
+        if bria_response.request_id == "unknown":
+            bria_response.request_id = webhook_id
+
+        with self._lock:
+            if webhook_id in self._seen:
+                return HTTPStatus.OK
+            pending = None
+            if not (bria_response.in_progress or bria_response.status == Status.UNKNOWN):
+                # Only a terminal delivery is final: the webhook id is the job's request_id, shared by its progress deliveries
+                self._seen[webhook_id] = None
+                _trim(self._seen, self._max_pending)
+                pending = self._pending.pop(bria_response.request_id, None)
+                if pending is None:
+                    self._unclaimed[bria_response.request_id] = bria_response
+                    _trim(self._unclaimed, self._max_pending)
+        if pending is not None and not pending.future.done():
+            pending.future.set_result(bria_response)
+        if self.on_delivery is not None:
+            try:
+                self.on_delivery(bria_response)
+            except Exception:
+                logger.exception(f"Webhook delivery callback failed for request ID: {bria_response.request_id}")
+        return HTTPStatus.OK
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        """The ASGI app"""
+        if scope["type"] == "lifespan":
+            return await _lifespan(receive, send)
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST":
+            return await _send_asgi(send, HTTPStatus.METHOD_NOT_ALLOWED)
+        body = bytearray()
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if len(body) > self.max_body_size:
+                return await _send_asgi(send, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            if not message.get("more_body", False):
+                break
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        await _send_asgi(send, self.receive(bytes(body), headers))
+
+    def wsgi(self, environ: dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        """The WSGI app"""
+        if environ["REQUEST_METHOD"] != "POST":
+            return _send_wsgi(start_response, HTTPStatus.METHOD_NOT_ALLOWED)
+        if environ.get("CONTENT_LENGTH"):
+            length = int(environ["CONTENT_LENGTH"])
+            if length > self.max_body_size:
+                return _send_wsgi(start_response, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            body = environ["wsgi.input"].read(length)
+        else:
+            # Chunked request body (no `Content-Length`), read to the end but never more than the limit
+            body = environ["wsgi.input"].read(self.max_body_size + 1)
+            if len(body) > self.max_body_size:
+                return _send_wsgi(start_response, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        headers = {name[5:].replace("_", "-"): value for name, value in environ.items() if name.startswith("HTTP_")}
+        return _send_wsgi(start_response, self.receive(body, headers))
+
+
+def _parse_delivery(payload: bytes) -> BriaResponse | None:
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    try:
+        return BriaResponse(**data)
+    except ValidationError:
+        pass
+    try:
+        # An unknown status value, fall back to the status inferred from the error / result
+        return BriaResponse(**{key: value for key, value in data.items() if key != "status"})
+    except ValidationError:
+        return None
+
+
+def _trim(entries: OrderedDict, max_entries: int) -> None:
+    while len(entries) > max_entries:
+        entries.popitem(last=False)
+
+
+def _response_body(status: int) -> bytes:
+    return json.dumps({"ok": status == HTTPStatus.OK}).encode()
+
+
+async def _send_asgi(send: Callable, status: int) -> None:
+    body = _response_body(status)
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    await send({"type": "http.response.start", "status": int(status), "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _send_wsgi(start_response: Callable, status: int) -> list[bytes]:
+    body = _response_body(status)
+    start_response(f"{int(status)} {HTTPStatus(status).phrase}", [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+    return [body]
+
+
+async def _lifespan(receive: Callable, send: Callable) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
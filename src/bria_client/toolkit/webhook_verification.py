@@ -1,9 +1,15 @@
 import base64
 import hashlib
 import hmac
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 
 WEBHOOK_SIGNING_SALT = b"bria-webhook-signing-v1"
 
+Payload = bytes | bytearray | memoryview
+
 
 def verify_webhook_signature(
     payload: bytes,
@@ -25,20 +31,130 @@ def verify_webhook_signature(
 
     Returns:
         ``True`` if at least one token in the signature header is valid, ``False`` otherwise.
+
+    See ``WebhookVerifier`` for receivers handling many deliveries (timestamp tolerance, replay protection, token rotation).
+    """
+    expected = _signature(_derive_signing_key(api_token), webhook_id, timestamp, payload)
+    return _matches(signature_header, [expected])
+
+
+class WebhookVerifier:
     """
-    signing_key = _derive_signing_key(api_token)
-    message = f"{webhook_id}.{timestamp}.{payload.decode()}".encode()
-    expected = base64.b64encode(hmac.new(signing_key, message, hashlib.sha256).digest()).decode()
+    Verifies inbound Bria webhooks at a high rate.
+
+    The signing key of every API token is derived once, and the signed message is fed to the HMAC piece by piece (the payload
+    bytes as is, never decoded or copied). On top of the signature, deliveries must be timestamped within `tolerance` seconds
+    of now, and a delivery already verified (same id, timestamp and payload) is rejected as a replay.
+
+    Several tokens may be active at the same time, e.g. while rotating the API token. Safe to share across threads.
+    """
+
+    def __init__(self, api_tokens: str | Iterable[str], tolerance: float | None = 300, max_replays: int = 100_000) -> None:
+        """
+        Args:
+            `api_tokens: str | Iterable[str]` - The API tokens the deliveries may be signed with
+            `tolerance: float | None` - Maximum age (and clock skew) of a delivery timestamp in seconds, `None` to accept any
+            `max_replays: int` - Maximum number of verified deliveries remembered to detect replays (oldest forgotten first)
+        """
+        self.tolerance = tolerance
+        self._max_replays = max_replays
+        # HMAC state keyed with the signing key of each token, copied for every delivery instead of keying a new HMAC.
+        # Replaced as a whole when the tokens change, so verifying never takes a lock for it. Indexed by a digest of the
+        # token, the raw tokens are not kept
+        self._macs: dict[str, hmac.HMAC] = {}
+        self._verified: OrderedDict[tuple[str, str, bytes], float] = OrderedDict()
+        self._lock = threading.Lock()
+        for api_token in [api_tokens] if isinstance(api_tokens, str) else api_tokens:
+            self.add_token(api_token)
+
+    def add_token(self, api_token: str) -> None:
+        """Accept the deliveries signed with `api_token`"""
+        self._macs = {**self._macs, _token_id(api_token): hmac.new(_derive_signing_key(api_token), digestmod=hashlib.sha256)}
+
+    def remove_token(self, api_token: str) -> None:
+        """Stop accepting the deliveries signed with `api_token`"""
+        token_id = _token_id(api_token)
+        self._macs = {token: mac for token, mac in self._macs.items() if token != token_id}
 
+    def verify(self, payload: Payload, webhook_id: str, timestamp: str, signature_header: str) -> bool:
+        """
+        Verify one delivery: its timestamp, its signature with any of the active tokens, and that it is not a replay
+
+        Args:
+            `payload: bytes | bytearray | memoryview` - The raw request body
+            `webhook_id: str` - Value of the `Bria-Webhook-Id` header
+            `timestamp: str` - Value of the `Bria-Webhook-Timestamp` header (Unix epoch string)
+            `signature_header: str` - Value of the `Bria-Webhook-Signature` header
+
+        Returns:
+            `bool` - Whether the delivery is authentic and new
+        """
+        now = time.time()
+        if not self._timestamp_valid(timestamp, now):
+            return False
+        if not self.verify_signature(payload, webhook_id, timestamp, signature_header):
+            return False
+        return self._record(webhook_id, timestamp, payload, now)
+
+    def verify_signature(self, payload: Payload, webhook_id: str, timestamp: str, signature_header: str) -> bool:
+        """Verify the signature only (no timestamp tolerance nor replay check), e.g. to acknowledge a redelivery"""
+        if not signature_header:
+            return False
+        message_prefix = f"{webhook_id}.{timestamp}.".encode()
+        expected = []
+        for keyed in self._macs.values():
+            mac = keyed.copy()
+            mac.update(message_prefix)
+            mac.update(payload)
+            expected.append(base64.b64encode(mac.digest()).decode())
+        return _matches(signature_header, expected)
+
+    def _timestamp_valid(self, timestamp: str, now: float) -> bool:
+        if self.tolerance is None:
+            return True
+        try:
+            return abs(now - int(timestamp)) <= self.tolerance
+        except ValueError:
+            return False
+
+    def _record(self, webhook_id: str, timestamp: str, payload: Payload, now: float) -> bool:
+        """Remember a verified delivery, `False` when it was already verified"""
+        # Keyed by what is signed, not by the signature header: its formatting (spaces, extra signatures) is up to the sender
+        key = (webhook_id, timestamp, hashlib.sha256(payload).digest())
+        with self._lock:
+            if key in self._verified:
+                return False
+            self._verified[key] = now
+            while len(self._verified) > self._max_replays:
+                self._verified.popitem(last=False)
+            # Deliveries out of the tolerance window fail the timestamp check anyway, no need to remember them
+            while self.tolerance is not None and now - next(iter(self._verified.values())) > 2 * self.tolerance:
+                self._verified.popitem(last=False)
+        return True
+
+
+def _signature(signing_key: bytes, webhook_id: str, timestamp: str, payload: Payload) -> str:
+    mac = hmac.new(signing_key, f"{webhook_id}.{timestamp}.".encode(), hashlib.sha256)
+    mac.update(payload)
+    return base64.b64encode(mac.digest()).decode()
+
+
+def _matches(signature_header: str, expected: list[str]) -> bool:
     for token in signature_header.split(","):
         token = token.strip()
         if token.startswith("v1="):
             candidate = token[3:]
-            if hmac.compare_digest(candidate, expected):
+            # Every expected signature is compared, so the time taken does not reveal which token matched
+            matches = [hmac.compare_digest(candidate, signature) for signature in expected]
+            if any(matches):
                 return True
     return False
 
 
+def _token_id(api_token: str) -> str:
+    return hashlib.sha256(api_token.encode()).hexdigest()
+
+
 def _derive_signing_key(api_token: str) -> bytes:
     return hmac.new(
         api_token.encode(),
@@ -0,0 +1,140 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from bria_client.clients.async_client import BriaAsyncClient
+from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.models import BriaResult, Status
+
+
+def _submitted(request_id: str) -> BriaResponse:
+    return BriaResponse(status=Status.RUNNING, request_id=request_id, status_url=f"https://test.example.com/v2/status/{request_id}")
+
+
+def _completed(request_id: str) -> BriaResponse:
+    return BriaResponse(status=Status.COMPLETED, request_id=request_id, result=BriaResult.model_validate({"image_url": request_id}))
+
+
+class _FakeServer:
+    """Completes every job after `polls_until_done` status calls"""
+
+    def __init__(self, polls_until_done: int = 2):
+        self.polls_until_done = polls_until_done
+        self.submitted = 0
+        self.status_calls: dict[str, int] = {}
+
+    async def request(self, url: str, method: str, payload=None, headers=None, **kwargs) -> BriaResponse:
+        if method == "POST":
+            self.submitted += 1
+            return _submitted(f"req-{payload['index']}")
+        request_id = url.rsplit("/", 1)[-1]
+        self.status_calls[request_id] = self.status_calls.get(request_id, 0) + 1
+        if self.status_calls[request_id] >= self.polls_until_done:
+            return _completed(request_id)
+        return _submitted(request_id)
+
+
+@pytest.mark.component
+class TestAsyncClientMap:
+    @pytest.mark.asyncio
+    async def test_map_should_return_final_responses_in_payload_order(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        server = _FakeServer(polls_until_done=2)
+        mocker.patch.object(client.engine.client, "request", side_effect=server.request)
+        # Act
+        results = await client.map("image/edit/remove_background", [{"index": i} for i in range(20)], interval=0.01)
+        # Assert
+        assert [r.request_id for r in results] == [f"req-{i}" for i in range(20)]
+        assert all(r.status == Status.COMPLETED.value for r in results)
+        assert all(calls == 2 for calls in server.status_calls.values())
+
+    @pytest.mark.asyncio
+    async def test_map_should_reuse_one_poller_per_event_loop(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        server = _FakeServer(polls_until_done=1)
+        mocker.patch.object(client.engine.client, "request", side_effect=server.request)
+        # Act
+        await asyncio.gather(
+            client.map("image/edit/remove_background", [{"index": 0}], interval=0.01),
+            client.map("image/edit/remove_background", [{"index": 1}], interval=0.01),
+        )
+        # Assert
+        assert len(client._pollers) == 1
+
+    @pytest.mark.asyncio
+    async def test_map_should_bound_jobs_in_flight_by_concurrency(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        server = _FakeServer(polls_until_done=3)
+        mocker.patch.object(client.engine.client, "request", side_effect=server.request)
+        max_in_flight = 0
+        original_request = server.request
+
+        async def tracking_request(url, method, payload=None, headers=None, **kwargs):
+            nonlocal max_in_flight
+            response = await original_request(url, method, payload=payload, headers=headers, **kwargs)
+            in_flight = server.submitted - sum(1 for calls in server.status_calls.values() if calls >= server.polls_until_done)
+            max_in_flight = max(max_in_flight, in_flight)
+            return response
+
+        mocker.patch.object(client.engine.client, "request", side_effect=tracking_request)
+        # Act
+        await client.map("image/edit/remove_background", [{"index": i} for i in range(10)], concurrency=3, interval=0.01)
+        # Assert
+        assert max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_map_on_job_not_completing_should_raise_timeout(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        server = _FakeServer(polls_until_done=10_000)
+        mocker.patch.object(client.engine.client, "request", side_effect=server.request)
+        # Act / Assert
+        with pytest.raises(TimeoutError):
+            await client.map("image/edit/remove_background", [{"index": 0}], interval=0.01, timeout=0.05)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_map_should_not_wait_past_the_timeout_for_a_learned_first_check(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        server = _FakeServer(polls_until_done=10_000)
+        mocker.patch.object(client.engine.client, "request", side_effect=server.request)
+        client.completion_model.min_samples = 1
+        client.completion_model._durations["https://test.example.com/v2/image/edit/remove_background"] = deque([300.0])
+        # Act / Assert
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(client.map("image/edit/remove_background", [{"index": 0}], timeout=0.05), timeout=2)
+        assert server.status_calls == {"req-0": 1}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_map_should_learn_from_the_running_checks(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        server = _FakeServer(polls_until_done=3)
+        mocker.patch.object(client.engine.client, "request", side_effect=server.request)
+        record_progress = mocker.spy(client.completion_model, "record_progress")
+        # Act
+        await client.map("image/edit/remove_background", [{"index": 0}], interval=0.01)
+        # Assert
+        assert record_progress.call_count == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_map_should_not_submit_after_the_first_failure(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        server = _FakeServer(polls_until_done=10_000)
+        mocker.patch.object(client.engine.client, "request", side_effect=server.request)
+        # Act
+        with pytest.raises(TimeoutError):
+            await client.map("image/edit/remove_background", [{"index": i} for i in range(10)], concurrency=2, interval=0.01, timeout=0.05)
+        await asyncio.sleep(0.1)
+        # Assert
+        assert server.submitted == 2
+        assert len(client._get_status_poller()) == 0
+        await client.aclose()
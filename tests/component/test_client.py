@@ -1,3 +1,4 @@
+import httpx
 import pytest
 
 from bria_client.clients.async_client import BriaAsyncClient
@@ -116,3 +117,69 @@ class TestAsyncClientWebhook:
         # Assert
         assert "webhook_url" not in original_payload
         assert "sync" not in original_payload
+
+
+@pytest.mark.component
+class TestClientTransportSettings:
+    def test_http2_should_be_read_from_environment(self, monkeypatch):
+        # Arrange
+        pytest.importorskip("h2")
+        monkeypatch.setenv("BRIA_HTTP2", "true")
+        # Act
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        # Assert
+        assert client.engine.client.http2
+
+    def test_explicit_http2_should_override_environment(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("BRIA_HTTP2", "true")
+        # Act
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok", http2=False)
+        # Assert
+        assert not client.engine.client.http2
+
+    def test_pool_and_timeouts_should_be_read_from_environment(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("BRIA_MAX_KEEPALIVE_CONNECTIONS", "80")
+        monkeypatch.setenv("BRIA_REQUEST_TIMEOUT", "45")
+        monkeypatch.setenv("BRIA_ENDPOINT_TIMEOUTS", '{"status": 10}')
+        # Act
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        # Assert
+        assert client.engine.client._limits.max_keepalive_connections == 80
+        assert client.engine.client.request_timeout == 45
+        assert client.engine.client.endpoint_timeouts == {"status": 10}
+
+    def test_constructor_arguments_should_override_settings(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("BRIA_MAX_CONNECTIONS", "50")
+        # Act
+        client = BriaAsyncClient(
+            base_url="https://test.example.com", api_token="tok", max_connections=500, request_timeout=60, endpoint_timeouts={"video": 600}
+        )
+        # Assert
+        assert client.engine.client._limits.max_connections == 500
+        assert client.engine.client._request_timeout("https://test.example.com/v2/video/edit/remove_background").read == 600
+        assert client.engine.client._request_timeout("https://test.example.com/v2/image/edit/remove_background").read == 60
+
+    @pytest.mark.parametrize("max_connections,expected", [(None, 10), (500, 500)])
+    def test_http2_should_size_the_pool_by_http2_max_connections_unless_set(self, max_connections, expected):
+        # Arrange
+        pytest.importorskip("h2")
+        # Act
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", http2=True, max_connections=max_connections)
+        # Assert
+        assert client.engine.client._limits.max_connections == expected
+
+    def test_run_should_forward_per_call_request_timeout(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        send = mocker.patch.object(
+            client.engine.client._client,
+            "request",
+            return_value=httpx.Response(200, json={"result": {}}, request=httpx.Request("POST", "https://test.example.com")),
+        )
+        # Act
+        client.run(endpoint="image/edit/remove_background", payload={"prompt": "cat"}, request_timeout=120)
+        # Assert
+        assert send.call_args.kwargs["timeout"].read == 120
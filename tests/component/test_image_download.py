@@ -0,0 +1,89 @@
+import io
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from PIL import Image as PilImage
+
+from bria_client.clients.async_client import BriaAsyncClient
+from bria_client.clients.download_cache import DownloadCache
+from bria_client.clients.sync_client import BriaSyncClient
+from bria_client.engines.base import AsyncHTTPRequest, SyncHTTPRequest
+from bria_client.toolkit.download import Download
+from bria_client.toolkit.errors.exception import BriaException
+
+IMAGE_URL = "https://cdn.example.com/results/image.png"
+
+
+@pytest.fixture
+def png_bytes() -> bytes:
+    buffer = io.BytesIO()
+    PilImage.new("RGB", (4, 3), color=(255, 0, 0)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.component
+class TestSyncClientFetchImage:
+    def test_fetch_image_should_decode_the_downloaded_image(self, mocker, png_bytes):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        download = mocker.patch.object(SyncHTTPRequest, "download", return_value=Download(body=memoryview(png_bytes), etag=None))
+        # Act
+        image = client.fetch_image(IMAGE_URL)
+        # Assert
+        assert image.size == (4, 3)
+        download.assert_called_once_with(IMAGE_URL, headers=None, etag=None)
+
+    def test_fetch_image_should_reuse_the_cached_body_while_its_etag_is_current(self, mocker, png_bytes):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", download_cache=DownloadCache())
+        download = mocker.patch.object(
+            SyncHTTPRequest, "download", side_effect=[Download(body=memoryview(png_bytes), etag='"v1"'), Download(body=None, etag='"v1"')]
+        )
+        # Act
+        images = [client.fetch_image(IMAGE_URL) for _ in range(2)]
+        # Assert
+        assert [image.size for image in images] == [(4, 3), (4, 3)]
+        assert download.call_args_list[0].kwargs["etag"] is None
+        assert download.call_args_list[1].kwargs["etag"] == '"v1"'
+
+    def test_fetch_image_should_raise_bria_exception_on_error_status(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        request = httpx.Request("GET", IMAGE_URL)
+        error = httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+        mocker.patch.object(SyncHTTPRequest, "download", side_effect=error)
+        # Act / Assert
+        with pytest.raises(BriaException) as exc_info:
+            client.fetch_image(IMAGE_URL)
+        assert exc_info.value.code == 404
+
+
+@pytest.mark.component
+class TestAsyncClientFetchImage:
+    @pytest.mark.asyncio
+    async def test_fetch_image_should_reuse_the_cached_body_while_its_etag_is_current(self, mocker, tmp_path, png_bytes):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok", download_cache=DownloadCache(directory=tmp_path))
+        download = mocker.patch.object(
+            AsyncHTTPRequest,
+            "download",
+            new_callable=AsyncMock,
+            side_effect=[Download(body=memoryview(png_bytes), etag='"v1"'), Download(body=None, etag='"v1"')],
+        )
+        # Act
+        images = [await client.fetch_image(IMAGE_URL) for _ in range(2)]
+        # Assert
+        assert [image.size for image in images] == [(4, 3), (4, 3)]
+        assert download.call_args_list[1].kwargs["etag"] == '"v1"'
+        assert DownloadCache(directory=tmp_path).get(IMAGE_URL) == ('"v1"', png_bytes)
+
+    @pytest.mark.asyncio
+    async def test_fetch_image_should_raise_bria_exception_on_transport_error(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        mocker.patch.object(AsyncHTTPRequest, "download", new_callable=AsyncMock, side_effect=httpx.ConnectError("unreachable"))
+        # Act / Assert
+        with pytest.raises(BriaException) as exc_info:
+            await client.fetch_image(IMAGE_URL)
+        assert exc_info.value.code == 503
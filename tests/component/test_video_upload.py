@@ -1,9 +1,13 @@
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from bria_client.clients.async_client import BriaAsyncClient
 from bria_client.clients.sync_client import BriaSyncClient
+from bria_client.clients.upload_cache import UploadCache
+from bria_client.engines.base import AsyncHTTPRequest, SyncHTTPRequest
 from bria_client.toolkit import BriaResponse
 from bria_client.toolkit.errors.exception import BriaException
 from bria_client.toolkit.models import BriaResult, Status
@@ -19,20 +23,11 @@ def _make_upload_bria_response() -> BriaResponse:
 
 
 def _mock_sync_upload(mocker, status_code: int = 204, text: str = "") -> MagicMock:
-    mock_client = MagicMock()
-    mock_client.__enter__ = MagicMock(return_value=mock_client)
-    mock_client.__exit__ = MagicMock(return_value=False)
-    mock_client.post.return_value = MagicMock(status_code=status_code, text=text)
-    mocker.patch("bria_client.clients.sync_client.httpx.Client", return_value=mock_client)
-    return mock_client
+    return mocker.patch.object(SyncHTTPRequest, "upload", return_value=MagicMock(status_code=status_code, text=text))
 
 
 def _mock_async_upload(mocker, status_code: int = 204, text: str = "") -> AsyncMock:
-    mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.post.return_value = MagicMock(status_code=status_code, text=text)
-    mocker.patch("bria_client.clients.async_client.httpx.AsyncClient", return_value=mock_client)
-    return mock_client
+    return mocker.patch.object(AsyncHTTPRequest, "upload", new_callable=AsyncMock, return_value=MagicMock(status_code=status_code, text=text))
 
 
 @pytest.fixture
@@ -52,7 +47,7 @@ class TestSyncClientVideoUpload:
         file_url = client.upload(video_file, media_type="video/mp4")
 
         assert file_url == FILE_URL
-        call_kwargs = mock_upload.post.call_args
+        call_kwargs = mock_upload.call_args
         assert call_kwargs.args[0] == UPLOAD_URL
         assert "file" in call_kwargs.kwargs["files"]
 
@@ -71,6 +66,28 @@ class TestSyncClientVideoUpload:
             client.upload(video_file, media_type="video/mp4")
         assert exc_info.value.code == 403
 
+    def test_upload_with_cache_should_not_upload_same_content_twice(self, mocker, video_file, tmp_path):
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", upload_cache=UploadCache())
+        api_request = mocker.patch.object(client.engine.client, "request", return_value=_make_upload_bria_response())
+        mock_upload = _mock_sync_upload(mocker)
+        copy = tmp_path / "copy.mp4"
+        copy.write_bytes(video_file.read_bytes())
+
+        file_urls = [client.upload(video_file, media_type="video/mp4"), client.upload(copy, media_type="video/mp4")]
+
+        assert file_urls == [FILE_URL, FILE_URL]
+        assert api_request.call_count == 1
+        assert mock_upload.call_count == 1
+
+    def test_upload_with_cache_should_not_cache_failed_uploads(self, mocker, video_file):
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", upload_cache=UploadCache())
+        mocker.patch.object(client.engine.client, "request", return_value=_make_upload_bria_response())
+        _mock_sync_upload(mocker, status_code=403, text="Access Denied")
+
+        with pytest.raises(BriaException):
+            client.upload(video_file, media_type="video/mp4")
+        assert len(client.upload_cache) == 0
+
 
 @pytest.mark.component
 class TestAsyncClientVideoUpload:
@@ -83,6 +100,92 @@ class TestAsyncClientVideoUpload:
         file_url = await client.upload(video_file, media_type="video/mp4")
 
         assert file_url == FILE_URL
-        call_kwargs = mock_upload.post.call_args
+        call_kwargs = mock_upload.call_args
         assert call_kwargs.args[0] == UPLOAD_URL
         assert "file" in call_kwargs.kwargs["files"]
+
+    @pytest.mark.asyncio
+    async def test_upload_with_cache_should_not_upload_same_content_twice(self, mocker, video_file):
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok", upload_cache=UploadCache())
+        api_request = mocker.patch.object(client.engine.client, "request", return_value=_make_upload_bria_response())
+        mock_upload = _mock_async_upload(mocker)
+
+        await client.upload(video_file, media_type="video/mp4")
+        file_url = await client.upload(video_file, media_type="video/mp4")
+
+        assert file_url == FILE_URL
+        assert api_request.call_count == 1
+        assert mock_upload.call_count == 1
+
+
+@pytest.fixture
+def video_files(tmp_path):
+    paths = []
+    for index in range(5):
+        path = tmp_path / f"clip_{index}.mp4"
+        path.write_bytes(b"x" * (index + 1) * 100)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.component
+class TestUploadMany:
+    def test_sync_upload_many_should_map_each_path_to_its_file_url(self, mocker, video_files):
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        mocker.patch.object(client.engine.client, "request", return_value=_make_upload_bria_response())
+        mock_upload = _mock_sync_upload(mocker)
+
+        results = client.upload_many(video_files, media_type="video/mp4", concurrency=2)
+
+        assert results == dict.fromkeys(video_files, FILE_URL)
+        assert mock_upload.call_count == len(video_files)
+
+    def test_sync_upload_many_should_return_per_file_errors(self, mocker, video_files):
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        mocker.patch.object(client.engine.client, "request", return_value=_make_upload_bria_response())
+        mocker.patch.object(
+            SyncHTTPRequest, "upload", side_effect=lambda url, data, files: MagicMock(status_code=403 if files["file"][0] == "clip_1.mp4" else 204, text="")
+        )
+
+        results = client.upload_many(video_files, media_type="video/mp4")
+
+        assert isinstance(results[video_files[1]], BriaException)
+        assert [results[path] for path in video_files if path != video_files[1]] == [FILE_URL] * 4
+
+    def test_sync_upload_many_should_bound_bytes_in_flight(self, mocker, video_files):
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        mocker.patch.object(client.engine.client, "request", return_value=_make_upload_bria_response())
+        in_flight, peak = [], []
+        lock = threading.Lock()
+
+        def upload(url, data, files):
+            with lock:
+                in_flight.append(len(files["file"][1].read()))
+                peak.append(sum(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return MagicMock(status_code=204, text="")
+
+        mocker.patch.object(SyncHTTPRequest, "upload", side_effect=upload)
+
+        client.upload_many(video_files, media_type="video/mp4", concurrency=4, max_bytes_in_flight=600)
+
+        assert max(peak) <= 600
+
+    def test_upload_many_raises_not_implemented_for_non_video(self, video_files):
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+
+        with pytest.raises(NotImplementedError):
+            client.upload_many(video_files, media_type="image/png")
+
+    @pytest.mark.asyncio
+    async def test_async_upload_many_should_map_each_path_to_its_file_url(self, mocker, video_files):
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        api_request = mocker.patch.object(client.engine.client, "request", return_value=_make_upload_bria_response())
+        mock_upload = _mock_async_upload(mocker)
+
+        results = await client.upload_many(video_files, media_type="video/mp4", concurrency=2, max_bytes_in_flight=300)
+
+        assert results == dict.fromkeys(video_files, FILE_URL)
+        assert api_request.call_count == mock_upload.call_count == len(video_files)
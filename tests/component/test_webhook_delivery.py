@@ -0,0 +1,116 @@
+import asyncio
+import threading
+
+import pytest
+
+from bria_client.clients.async_client import BriaAsyncClient
+from bria_client.clients.sync_client import BriaSyncClient
+from bria_client.toolkit import BriaResponse, WebhookReceiver
+from bria_client.toolkit.models import BriaResult, Status
+
+API_TOKEN = "test-api-token"
+URL = "https://my-server.example.com/webhook"
+
+
+def _submitted(request_id: str) -> BriaResponse:
+    return BriaResponse(status=Status.RUNNING, request_id=request_id, status_url=f"https://test.example.com/v2/status/{request_id}")
+
+
+def _completed(request_id: str) -> BriaResponse:
+    return BriaResponse(status=Status.COMPLETED, request_id=request_id, result=BriaResult.model_validate({"image_url": request_id}))
+
+
+@pytest.mark.component
+class TestClientWebhookReceiver:
+    def test_submit_should_default_webhook_url_to_the_receiver(self, mocker):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        client = BriaSyncClient(base_url="https://test.example.com", api_token=API_TOKEN, webhook_receiver=receiver)
+        mock_request = mocker.patch.object(client.engine.client, "request", return_value=_submitted("req-1"))
+
+        # Act
+        client.submit(endpoint="image/edit/remove_background", payload={"image": "x"})
+
+        # Assert
+        assert mock_request.call_args.kwargs["payload"]["webhook_url"] == URL
+        assert receiver.pending("req-1") is not None
+
+    def test_submit_to_another_webhook_url_should_not_expect_awebhook_delivery(self, mocker, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        client = BriaSyncClient(base_url="https://test.example.com", api_token=API_TOKEN, webhook_receiver=receiver)
+        mocker.patch.object(client.engine.client, "request", return_value=_submitted("req-1"))
+
+        # Act
+        client.submit(endpoint="image/edit/remove_background", payload={"image": "x"}, webhook_url="https://elsewhere.example.com")
+
+        # Assert
+        assert receiver.pending("req-1") is None
+
+    def test_poll_should_return_the_delivery_without_status_calls(self, mocker, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN, late_after=5)
+        client = BriaSyncClient(base_url="https://test.example.com", api_token=API_TOKEN, webhook_receiver=receiver)
+        mock_request = mocker.patch.object(client.engine.client, "request", return_value=_submitted("req-1"))
+        response = client.submit(endpoint="image/edit/remove_background", payload={"image": "x"})
+        threading.Timer(0.05, receiver.receive, webhook_delivery("req-1")).start()
+
+        # Act
+        result = client.poll(response)
+
+        # Assert
+        assert result.status == Status.COMPLETED
+        assert mock_request.call_count == 1
+        assert len(receiver) == 0
+
+    def test_poll_should_fall_back_to_status_calls_when_the_delivery_is_late(self, mocker):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN, late_after=0.01)
+        client = BriaSyncClient(base_url="https://test.example.com", api_token=API_TOKEN, webhook_receiver=receiver)
+        mock_request = mocker.patch.object(client.engine.client, "request", side_effect=[_submitted("req-1"), _completed("req-1")])
+        response = client.submit(endpoint="image/edit/remove_background", payload={"image": "x"})
+
+        # Act
+        result = client.poll(response)
+
+        # Assert
+        assert result.status == Status.COMPLETED
+        assert mock_request.call_count == 2
+        assert len(receiver) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_poll_should_return_the_delivery_without_status_calls(self, mocker, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN, late_after=5)
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token=API_TOKEN, webhook_receiver=receiver)
+        mock_request = mocker.patch.object(client.engine.client, "request", return_value=_submitted("req-1"))
+        response = await client.submit(endpoint="image/edit/remove_background", payload={"image": "x"})
+        asyncio.get_running_loop().call_later(0.05, receiver.receive, *webhook_delivery("req-1"))
+
+        # Act
+        result = await client.poll(response)
+
+        # Assert
+        assert result.status == Status.COMPLETED
+        assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_map_should_resolve_late_deliveries_while_polling(self, mocker, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN, late_after=0.01)
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token=API_TOKEN, webhook_receiver=receiver)
+
+        async def request(url, method, payload=None, headers=None, **kwargs):
+            if method == "POST":
+                return _submitted(f"req-{payload['index']}")
+            return _submitted(url.rsplit("/", 1)[-1])
+
+        mocker.patch.object(client.engine.client, "request", side_effect=request)
+        asyncio.get_running_loop().call_later(0.1, lambda: [receiver.receive(*webhook_delivery(f"req-{i}")) for i in range(3)])
+
+        # Act
+        results = await client.map("image/edit/remove_background", [{"index": i} for i in range(3)], interval=0.02, timeout=5)
+
+        # Assert
+        assert [result.status for result in results] == [Status.COMPLETED] * 3
+        assert len(receiver) == 0
@@ -0,0 +1,25 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+from collections.abc import Callable
+
+import pytest
+
+from bria_client.toolkit.webhook_verification import WEBHOOK_SIGNING_SALT
+
+
+@pytest.fixture
+def webhook_delivery() -> Callable[..., tuple[bytes, dict[str, str]]]:
+    """Builds the signed body and headers of a webhook delivery: `webhook_delivery(request_id, body=None, api_token=..., timestamp=now)`"""
+
+    def build(request_id: str, body: dict | None = None, api_token: str = "test-api-token", timestamp: str | None = None) -> tuple[bytes, dict[str, str]]:
+        timestamp = timestamp or str(int(time.time()))
+        payload = json.dumps(body or {"request_id": request_id, "status": "COMPLETED", "result": {"image_url": "https://cdn.bria.ai/final.png"}}).encode()
+        signing_key = hmac.new(api_token.encode(), WEBHOOK_SIGNING_SALT, hashlib.sha256).digest()
+        message = f"{request_id}.{timestamp}.".encode() + payload
+        signature = base64.b64encode(hmac.new(signing_key, message, hashlib.sha256).digest()).decode()
+        return payload, {"Bria-Webhook-Id": request_id, "Bria-Webhook-Timestamp": timestamp, "Bria-Webhook-Signature": f"v1={signature}"}
+
+    return build
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from bria_client.clients.download_cache import DownloadCache
+
+URL = "https://cdn.example.com/results/image.png"
+
+
+@pytest.mark.unit
+class TestDownloadCache:
+    def test_get_should_return_the_etag_and_body_of_the_url(self):
+        # Arrange
+        cache = DownloadCache()
+        # Act
+        cache.set(URL, '"v1"', memoryview(b"body"))
+        # Assert
+        assert cache.get(URL) == ('"v1"', b"body")
+        assert cache.get("https://cdn.example.com/other.png") is None
+
+    def test_least_recently_used_entries_should_be_evicted_over_max_bytes(self):
+        # Arrange
+        cache = DownloadCache(max_bytes=10)
+        cache.set("a", "1", b"aaaa")
+        cache.set("b", "2", b"bbbb")
+        cache.get("a")
+        # Act
+        cache.set("c", "3", b"cccc")
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") == ("1", b"aaaa")
+        assert cache.get("c") == ("3", b"cccc")
+
+    def test_body_larger_than_max_bytes_should_not_be_kept_in_memory(self):
+        # Arrange
+        cache = DownloadCache(max_bytes=3)
+        # Act
+        cache.set(URL, "1", b"body")
+        # Assert
+        assert len(cache) == 0
+
+    def test_entries_on_disk_should_outlive_the_cache(self, tmp_path):
+        # Arrange
+        DownloadCache(directory=tmp_path).set(URL, '"v1"', b"\nbody\n")
+        # Act
+        entry = DownloadCache(directory=tmp_path).get(URL)
+        # Assert
+        assert entry == ('"v1"', b"\nbody\n")
+
+    def test_disk_entries_should_be_trimmed_to_max_disk_bytes(self, tmp_path):
+        # Arrange
+        cache = DownloadCache(max_bytes=0, directory=tmp_path, max_disk_bytes=15)
+        cache.set("a", "1", b"aaaa")
+        cache.set("b", "2", b"bbbb")
+        # Act
+        cache.set("c", "3", b"cccc")
+        # Assert
+        assert len(list(tmp_path.glob("*.body"))) == 2
+        assert cache.get("a") is None
+        assert cache.get("b") == ("2", b"bbbb")
+        assert cache.get("c") == ("3", b"cccc")
+
+    def test_files_of_a_previous_cache_should_be_trimmed_oldest_first(self, tmp_path):
+        # Arrange
+        previous = DownloadCache(max_bytes=0, directory=tmp_path)
+        for mtime, url in enumerate(("a", "b")):
+            previous.set(url, "1", b"body")
+            os.utime(previous._path(url), (mtime, mtime))
+        cache = DownloadCache(max_bytes=0, directory=tmp_path, max_disk_bytes=14)
+        # Act
+        cache.set("c", "1", b"body")
+        # Assert
+        assert cache.get("a") is None
+        assert cache.get("b") == ("1", b"body")
+        assert cache.get("c") == ("1", b"body")
+
+    def test_files_removed_by_another_process_should_be_skipped(self, tmp_path):
+        # Arrange
+        cache = DownloadCache(max_bytes=0, directory=tmp_path, max_disk_bytes=15)
+        cache.set("a", "1", b"aaaa")
+        cache._path("a").unlink()
+        # Act
+        cache.set("b", "2", b"bbbb")
+        cache.set("c", "3", b"cccc")
+        # Assert
+        assert cache.get("c") == ("3", b"cccc")
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_clear_should_forget_every_entry(self, tmp_path):
+        # Arrange
+        cache = DownloadCache(directory=tmp_path)
+        cache.set(URL, "1", b"body")
+        # Act
+        cache.clear()
+        # Assert
+        assert cache.get(URL) is None
+        assert not list(tmp_path.glob("*.body"))
@@ -0,0 +1,207 @@
+from collections import deque
+
+import pytest
+
+from bria_client.clients.async_client import BriaAsyncClient
+from bria_client.clients.polling import (
+    CompletionTimeModel,
+    DecorrelatedJitter,
+    ExponentialBackoff,
+    FixedInterval,
+    LearnedSchedule,
+    ServerHinted,
+    default_polling_strategy,
+    resolve_polling_strategy,
+)
+from bria_client.clients.sync_client import BriaSyncClient
+from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.models import BriaResult, Status
+
+
+def _running(headers: dict[str, str] | None = None) -> BriaResponse:
+    return BriaResponse(status=Status.RUNNING, request_id="req-1", status_url="https://example.com/status/req-1", headers=headers or {})
+
+
+@pytest.mark.unit
+class TestPollingStrategies:
+    def test_fixed_interval_should_always_return_interval(self):
+        strategy = FixedInterval(2)
+        assert [strategy.next_delay(attempt, None, _running()) for attempt in range(1, 4)] == [2, 2, 2]
+
+    def test_exponential_backoff_should_grow_until_cap(self):
+        strategy = ExponentialBackoff(initial=1, factor=2, max_delay=5)
+        assert [strategy.next_delay(attempt, None, _running()) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_decorrelated_jitter_should_stay_within_bounds(self):
+        strategy = DecorrelatedJitter(base=0.5, max_delay=3)
+        delay = None
+        for attempt in range(1, 50):
+            delay = strategy.next_delay(attempt, delay, _running())
+            assert 0.5 <= delay <= 3
+
+    @pytest.mark.parametrize("headers", [{"retry-after": "7"}, {"Retry-After": "7"}])
+    def test_server_hinted_should_honor_retry_after_seconds(self, headers):
+        strategy = ServerHinted(fallback=FixedInterval(1))
+        assert strategy.next_delay(1, None, _running(headers)) == 7
+
+    def test_server_hinted_should_honor_retry_after_http_date(self):
+        strategy = ServerHinted(fallback=FixedInterval(1))
+        assert strategy.next_delay(1, None, _running({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+
+    @pytest.mark.parametrize("headers", [{}, {"retry-after": "soon"}])
+    def test_server_hinted_without_valid_hint_should_use_fallback(self, headers):
+        strategy = ServerHinted(fallback=FixedInterval(3))
+        assert strategy.next_delay(1, None, _running(headers)) == 3
+
+    def test_resolve_polling_strategy_should_keep_fixed_interval_when_interval_is_given(self):
+        assert isinstance(resolve_polling_strategy(interval=2), FixedInterval)
+
+    def test_resolve_polling_strategy_should_prefer_explicit_strategy(self):
+        strategy = ExponentialBackoff()
+        assert resolve_polling_strategy(interval=2, strategy=strategy) is strategy
+
+    def test_default_polling_strategy_should_start_fast_and_back_off(self):
+        strategy = default_polling_strategy()
+        delays = [strategy.next_delay(attempt, None, _running()) for attempt in range(1, 20)]
+        assert delays[0] < 1
+        assert delays == sorted(delays)
+        assert delays[-1] == 10
+
+
+@pytest.mark.unit
+class TestPollWithStrategy:
+    def test_poll_should_sleep_the_delays_returned_by_strategy(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        completed = BriaResponse(status=Status.COMPLETED, request_id="req-1", result=BriaResult())
+        mocker.patch.object(client.engine.client, "request", side_effect=[_running(), _running(), completed])
+        sleep = mocker.patch("bria_client.clients.sync_client.time.sleep")
+        # Act
+        client.poll("req-1", strategy=ExponentialBackoff(initial=0.5, factor=2, max_delay=10))
+        # Assert
+        assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+    def test_poll_should_return_a_job_completed_at_the_deadline_check(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        completed = BriaResponse(status=Status.COMPLETED, request_id="req-1", result=BriaResult())
+        request = mocker.patch.object(client.engine.client, "request", side_effect=[_running(), _running(), completed])
+        # Act
+        result = client.poll("req-1", timeout=0.1, strategy=ExponentialBackoff(initial=0.05, factor=10, max_delay=10))
+        # Assert
+        assert result.status == Status.COMPLETED.value
+        assert request.call_count == 3
+
+    def test_poll_should_time_out_when_the_deadline_check_is_still_running(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        request = mocker.patch.object(client.engine.client, "request", side_effect=[_running()] * 4)
+        # Act / Assert
+        with pytest.raises(TimeoutError):
+            client.poll("req-1", timeout=0.1, strategy=ExponentialBackoff(initial=0.05, factor=10, max_delay=10))
+        assert request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_async_poll_should_return_a_job_completed_at_the_deadline_check(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        completed = BriaResponse(status=Status.COMPLETED, request_id="req-1", result=BriaResult())
+        request = mocker.patch.object(client.engine.client, "request", side_effect=[_running(), _running(), completed])
+        # Act
+        result = await client.poll("req-1", timeout=0.1, strategy=ExponentialBackoff(initial=0.05, factor=10, max_delay=10))
+        # Assert
+        assert result.status == Status.COMPLETED.value
+        assert request.call_count == 3
+
+
+@pytest.mark.unit
+class TestCompletionTimeModel:
+    def test_expected_duration_should_be_none_until_min_samples(self):
+        model = CompletionTimeModel(min_samples=3)
+        model._durations["ep"] = deque([1.0, 2.0])
+        assert model.expected_duration("ep") is None
+
+    def test_expected_duration_should_return_requested_percentile(self):
+        model = CompletionTimeModel(min_samples=1)
+        model._durations["ep"] = deque([float(d) for d in range(1, 11)])
+        assert model.expected_duration("ep", percentile=0.5) == 5.0
+        assert model.expected_duration("ep", percentile=0.9) == 9.0
+
+    def test_record_completion_should_add_duration_between_last_running_check_and_completion(self, mocker):
+        model = CompletionTimeModel(min_samples=1)
+        mocker.patch("bria_client.clients.polling.time.monotonic", side_effect=[100.0, 102.0, 104.0])
+        model.record_submission("req-1", "ep")
+        model.record_progress("req-1")
+        model.record_completion("req-1")
+        assert model.expected_duration("ep") == 3.0
+        assert model.submission("req-1") is None
+
+    def test_completion_at_the_first_check_should_add_half_the_elapsed_time(self, mocker):
+        model = CompletionTimeModel(min_samples=1)
+        mocker.patch("bria_client.clients.polling.time.monotonic", side_effect=[100.0, 103.5])
+        model.record_submission("req-1", "ep")
+        model.record_completion("req-1")
+        assert model.expected_duration("ep") == 1.75
+
+    def test_estimate_should_go_down_once_jobs_get_faster(self, mocker):
+        # Arrange
+        model = CompletionTimeModel(window=5, min_samples=1)
+        schedule = LearnedSchedule(model)
+        monotonic = mocker.patch("bria_client.clients.polling.time.monotonic")
+        model._durations["ep"] = deque([10.0] * 5)
+        estimates = []
+        # Act
+        for index in range(10):
+            # Jobs now take 2s, each seen completed at its first check (scheduled at the current estimate)
+            monotonic.return_value = 1000.0 * index
+            model.record_submission(f"req-{index}", "ep")
+            delay = schedule.initial_delay(f"req-{index}")
+            monotonic.return_value += max(delay, 2.0)
+            model.record_completion(f"req-{index}")
+            estimates.append(model.expected_duration("ep"))
+        # Assert
+        assert estimates[-1] < 10.0
+        assert estimates == sorted(estimates, reverse=True)
+
+    def test_record_submission_should_forget_oldest_pending_requests(self):
+        model = CompletionTimeModel(max_pending=2)
+        for request_id in ("a", "b", "c"):
+            model.record_submission(request_id, "ep")
+        assert model.submission("a") is None
+        assert model.submission("c") is not None
+
+
+@pytest.mark.unit
+class TestLearnedSchedule:
+    def test_without_estimate_should_behave_like_fallback(self):
+        schedule = LearnedSchedule(CompletionTimeModel(), fallback=FixedInterval(2))
+        assert schedule.initial_delay("req-1") == 0
+        assert schedule.next_delay(1, None, _running()) == 2
+
+    def test_with_estimate_should_wait_for_expected_completion_then_poll_densely(self, mocker):
+        # Arrange
+        model = CompletionTimeModel(min_samples=1)
+        model._durations["ep"] = deque([10.0])
+        mocker.patch("bria_client.clients.polling.time.monotonic", return_value=100.0)
+        model.record_submission("req-1", "ep")
+        schedule = LearnedSchedule(model, dense_ratio=0.1, dense_attempts=2, fallback=FixedInterval(5))
+        # Act
+        delays = [schedule.next_delay(attempt, None, _running()) for attempt in range(1, 5)]
+        # Assert
+        assert schedule.initial_delay("req-1") == 10.0
+        assert delays == [1.0, 1.0, 5, 5]
+
+
+@pytest.mark.unit
+class TestClientCompletionLearning:
+    def test_submit_then_poll_should_feed_the_completion_model(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        completed = BriaResponse(status=Status.COMPLETED, request_id="req-1", result=BriaResult())
+        mocker.patch.object(client.engine.client, "request", side_effect=[_running(), completed])
+        client.completion_model.min_samples = 1
+        # Act
+        submitted = client.submit("image/edit/remove_background", payload={})
+        client.poll(submitted)
+        # Assert
+        assert client.completion_model.expected_duration("https://test.example.com/v2/image/edit/remove_background") is not None
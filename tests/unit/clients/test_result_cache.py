@@ -0,0 +1,169 @@
+import pytest
+
+from bria_client.clients import BriaAsyncClient, BriaSyncClient
+from bria_client.clients.result_cache import MemoryResultCache, SQLiteResultCache, result_cache_key
+from bria_client.toolkit import BriaResponse, Image
+from bria_client.toolkit.models import BriaError, BriaResult, RequestTiming, Status
+
+ENDPOINT = "image/edit/remove_background"
+
+
+def _completed(url: str = "https://example.com/result.png") -> BriaResponse:
+    return BriaResponse(status=Status.COMPLETED, request_id="req-1", result=BriaResult(image_url=url))
+
+
+@pytest.mark.unit
+class TestResultCacheKey:
+    def test_key_should_not_depend_on_key_order(self):
+        assert result_cache_key(ENDPOINT, {"a": 1, "b": [1, {"x": "y", "z": 2}]}) == result_cache_key(ENDPOINT, {"b": [1, {"z": 2, "x": "y"}], "a": 1})
+
+    @pytest.mark.parametrize(
+        "endpoint,payload,identity",
+        [("image/edit/blur", {"a": 1}, None), (ENDPOINT, {"a": 2}, None), (ENDPOINT, {"a": "1"}, None), (ENDPOINT, {"a": 1}, "other")],
+    )
+    def test_key_should_differ_by_endpoint_payload_and_identity(self, endpoint, payload, identity):
+        assert result_cache_key(ENDPOINT, {"a": 1}) != result_cache_key(endpoint, payload, identity)
+
+    def test_image_should_hash_like_its_api_input(self, pil_image):
+        # Arrange
+        image = Image(pil_image)
+        # Act
+        streamed = result_cache_key(ENDPOINT, {"image": image})
+        # Assert
+        assert streamed == result_cache_key(ENDPOINT, {"image": image.as_bria_api_input})
+
+
+@pytest.mark.unit
+class TestMemoryResultCache:
+    def test_get_should_count_hits_and_misses(self):
+        # Arrange
+        cache = MemoryResultCache()
+        # Act
+        missed = cache.get("key")
+        cache.set("key", _completed())
+        hit = cache.get("key")
+        # Assert
+        assert missed is None
+        assert hit is not None and hit.result.image_url == "https://example.com/result.png"
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.hit_rate) == (1, 1, 0.5)
+
+    def test_cached_response_should_not_carry_the_original_timing(self):
+        # Arrange
+        cache = MemoryResultCache()
+        response = _completed()
+        response.timing = RequestTiming(total=1.5)
+        # Act
+        cache.set("key", response)
+        # Assert
+        assert cache.get("key").timing is None
+
+    def test_should_evict_least_recently_used_entry(self):
+        # Arrange
+        cache = MemoryResultCache(max_entries=2)
+        cache.set("a", _completed())
+        cache.set("b", _completed())
+        # Act
+        cache.get("a")
+        cache.set("c", _completed())
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+    def test_entry_should_expire_after_ttl(self, mocker):
+        # Arrange
+        monotonic = mocker.patch("bria_client.clients.result_cache.time.monotonic", return_value=100.0)
+        cache = MemoryResultCache(ttl=10)
+        cache.set("key", _completed())
+        # Act
+        monotonic.return_value = 110.0
+        # Assert
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestSQLiteResultCache:
+    def test_entries_should_persist_across_instances(self, tmp_path):
+        # Arrange
+        SQLiteResultCache(tmp_path / "cache.db").set("key", _completed())
+        # Act
+        response = SQLiteResultCache(tmp_path / "cache.db").get("key")
+        # Assert
+        assert response is not None
+        assert response.status == Status.COMPLETED
+        assert response.result.image_url == "https://example.com/result.png"
+
+    def test_entry_should_expire_after_ttl(self, tmp_path, mocker):
+        # Arrange
+        now = mocker.patch("bria_client.clients.result_cache.time.time", return_value=1000.0)
+        cache = SQLiteResultCache(tmp_path / "cache.db", ttl=60)
+        cache.set("key", _completed())
+        # Act
+        now.return_value = 1060.0
+        # Assert
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_should_evict_least_recently_used_entries(self, tmp_path, mocker):
+        # Arrange
+        now = mocker.patch("bria_client.clients.result_cache.time.time", return_value=1.0)
+        cache = SQLiteResultCache(tmp_path / "cache.db", max_entries=2)
+        cache.set("a", _completed())
+        now.return_value = 2.0
+        cache.set("b", _completed())
+        now.return_value = 3.0
+        cache.get("a")
+        # Act
+        now.return_value = 4.0
+        cache.set("c", _completed())
+        # Assert
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+
+@pytest.mark.unit
+class TestClientResultCache:
+    def test_run_should_return_cached_response_without_calling_the_api(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", result_cache=MemoryResultCache())
+        request = mocker.patch.object(client.engine.client, "request", return_value=_completed())
+        # Act
+        first = client.run(ENDPOINT, payload={"image": "https://example.com/a.png", "bg_color": None})
+        second = client.run(ENDPOINT, payload={"image": "https://example.com/a.png"})
+        # Assert
+        assert request.call_count == 1
+        assert second.result == first.result
+        assert (client.result_cache.stats.hits, client.result_cache.stats.misses) == (1, 1)
+
+    def test_run_should_not_cache_failed_responses(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", result_cache=MemoryResultCache())
+        failed = BriaResponse.from_error(BriaError(code=500, message="boom", details=""))
+        request = mocker.patch.object(client.engine.client, "request", side_effect=[failed, _completed()])
+        # Act
+        client.run(ENDPOINT, payload={"prompt": "cat"})
+        client.run(ENDPOINT, payload={"prompt": "cat"})
+        # Assert
+        assert request.call_count == 2
+
+    def test_run_should_not_share_results_between_api_tokens(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", result_cache=MemoryResultCache())
+        request = mocker.patch.object(client.engine.client, "request", return_value=_completed())
+        # Act
+        client.run(ENDPOINT, payload={"prompt": "cat"})
+        client.run(ENDPOINT, payload={"prompt": "cat"}, api_token="other")
+        # Assert
+        assert request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_run_should_return_cached_response(self, pil_image, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok", result_cache=MemoryResultCache())
+        request = mocker.patch.object(client.engine.client, "request", return_value=_completed())
+        # Act
+        await client.run(ENDPOINT, payload={"image": Image(pil_image)})
+        cached = await client.run(ENDPOINT, payload={"image": Image(pil_image)})
+        # Assert
+        assert request.call_count == 1
+        assert cached.status == Status.COMPLETED
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from bria_client.clients.upload import AsyncByteBudget, ByteBudget, ProgressFile
+
+
+@pytest.mark.unit
+class TestProgressFile:
+    def test_multipart_upload_should_report_progress_up_to_file_size(self, tmp_path):
+        # Arrange
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(b"x" * 200_000)
+        reported = []
+        with path.open("rb") as f:
+            progress_file = ProgressFile(f, lambda *p: reported.append(p))
+            request = httpx.Request("POST", "https://storage.example.com", files={"file": ("clip.mp4", progress_file, "video/mp4")})
+            # Act
+            request.read()
+        # Assert
+        assert reported[-1] == (200_000, 200_000)
+        assert [sent for sent, _ in reported] == sorted(sent for sent, _ in reported)
+        assert b"x" * 200_000 in request.content
+
+    def test_rewinding_should_restart_progress(self, tmp_path):
+        # Arrange
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(b"x" * 10)
+        reported = []
+        with path.open("rb") as f:
+            progress_file = ProgressFile(f, lambda *p: reported.append(p))
+            # Act
+            progress_file.read(6)
+            progress_file.seek(0)
+            progress_file.read(4)
+        # Assert
+        assert reported == [(6, 10), (4, 10)]
+
+
+@pytest.mark.unit
+class TestByteBudget:
+    def test_reserve_should_wait_until_enough_bytes_are_released(self):
+        # Arrange
+        budget = ByteBudget(limit=100)
+        acquired = threading.Event()
+
+        def reserve_second():
+            with budget.reserve(60):
+                acquired.set()
+
+        # Act
+        with budget.reserve(60):
+            thread = threading.Thread(target=reserve_second)
+            thread.start()
+            blocked = not acquired.wait(0.05)
+        thread.join(1)
+        # Assert
+        assert blocked
+        assert acquired.is_set()
+
+    def test_file_larger_than_budget_should_go_through_alone(self):
+        budget = ByteBudget(limit=100)
+        with budget.reserve(1000):
+            assert budget._in_flight == 100
+
+    @pytest.mark.asyncio
+    async def test_async_reserve_should_wait_until_enough_bytes_are_released(self):
+        # Arrange
+        budget = AsyncByteBudget(limit=100)
+        order = []
+
+        async def transfer(name: str, size: int):
+            async with budget.reserve(size):
+                order.append(f"{name} start")
+                await asyncio.sleep(0.01)
+                order.append(f"{name} end")
+
+        # Act
+        await asyncio.gather(transfer("a", 60), transfer("b", 60))
+        # Assert
+        assert order == ["a start", "a end", "b start", "b end"]
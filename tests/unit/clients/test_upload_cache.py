@@ -0,0 +1,67 @@
+import hashlib
+
+import pytest
+
+from bria_client.clients.upload_cache import UploadCache, file_digest
+
+FILE_URL = "https://cdn.example.com/uploads/video.mp4"
+
+
+@pytest.mark.unit
+class TestFileDigest:
+    @pytest.mark.parametrize("size", [0, 1, 1000, 3 * 1024 + 7])
+    def test_file_digest_should_match_sha256_of_content(self, tmp_path, size):
+        # Arrange
+        path = tmp_path / "clip.mp4"
+        content = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        path.write_bytes(content)
+        # Act
+        digest = file_digest(path, chunk_size=1024)
+        # Assert
+        assert digest == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.unit
+class TestUploadCache:
+    def test_get_should_return_file_url_of_same_content_and_media_type(self):
+        # Arrange
+        cache = UploadCache()
+        # Act
+        cache.set("digest", "video/mp4", FILE_URL, identity="tok")
+        # Assert
+        assert cache.get("digest", "video/mp4", identity="tok") == FILE_URL
+        assert cache.get("digest", "video/quicktime", identity="tok") is None
+        assert cache.get("digest", "video/mp4", identity="other") is None
+
+    def test_entry_should_expire_before_the_url_validity_ends(self, mocker):
+        # Arrange
+        now = mocker.patch("bria_client.clients.upload_cache.time.time", return_value=1000.0)
+        cache = UploadCache(validity=100, min_remaining=10)
+        cache.set("digest", "video/mp4", FILE_URL)
+        # Act
+        now.return_value = 1089.0
+        still_valid = cache.get("digest", "video/mp4")
+        now.return_value = 1090.0
+        expired = cache.get("digest", "video/mp4")
+        # Assert
+        assert still_valid == FILE_URL
+        assert expired is None
+
+    def test_entry_should_expire_from_its_issue_time(self, mocker):
+        # Arrange
+        mocker.patch("bria_client.clients.upload_cache.time.time", return_value=1000.0)
+        cache = UploadCache(validity=100, min_remaining=10)
+        # Act
+        cache.set("digest", "video/mp4", FILE_URL, issued_at=900.0)
+        # Assert
+        assert cache.get("digest", "video/mp4") is None
+
+    def test_should_forget_oldest_entry_when_full(self):
+        # Arrange
+        cache = UploadCache(max_entries=2)
+        # Act
+        for digest in ("a", "b", "c"):
+            cache.set(digest, "video/mp4", FILE_URL)
+        # Assert
+        assert cache.get("a", "video/mp4") is None
+        assert len(cache) == 2
@@ -0,0 +1,85 @@
+import httpx
+import pytest
+
+from bria_client.engines.base.async_http_request import AsyncHTTPRequest
+
+
+@pytest.mark.unit
+class TestAsyncHTTPRequest:
+    @pytest.mark.asyncio
+    async def test_upload_should_reuse_one_storage_client_per_loop(self, mocker):
+        # Arrange
+        http_request = AsyncHTTPRequest()
+        handle_async_request = mocker.patch.object(httpx.AsyncHTTPTransport, "handle_async_request", return_value=httpx.Response(204))
+        # Act
+        for _ in range(2):
+            await http_request.upload("https://storage.example.com/bucket", data={"key": "a"}, files={"file": ("a.mp4", b"x")})
+        # Assert
+        assert handle_async_request.call_count == 2
+        assert len(http_request._storage_clients) == 1
+        assert len(http_request._async_clients) == 0
+
+    @pytest.mark.asyncio
+    async def test_storage_client_should_use_the_storage_pool_limits(self):
+        # Arrange
+        http_request = AsyncHTTPRequest()
+        # Act
+        pool = http_request._get_storage_client()._transport._async_transport._pool
+        # Assert
+        assert pool._max_connections == 20
+        assert pool._max_keepalive_connections == 10
+
+    @pytest.mark.asyncio
+    async def test_close_should_close_storage_clients(self, mocker):
+        # Arrange
+        http_request = AsyncHTTPRequest()
+        mocker.patch.object(httpx.AsyncHTTPTransport, "handle_async_request", return_value=httpx.Response(204))
+        await http_request.upload("https://storage.example.com/bucket", data={}, files={"file": ("a.mp4", b"x")})
+        storage_client = next(iter(http_request._storage_clients.values()))
+        # Act
+        await http_request.close()
+        # Assert
+        assert storage_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_download_should_share_the_storage_client_of_the_loop(self, mocker):
+        # Arrange
+        http_request = AsyncHTTPRequest()
+        responses = [httpx.Response(204), httpx.Response(200, content=b"image", headers={"ETag": '"v1"'}), httpx.Response(304)]
+        mocker.patch.object(httpx.AsyncHTTPTransport, "handle_async_request", side_effect=responses)
+        await http_request.upload("https://storage.example.com/bucket", data={}, files={"file": ("a.mp4", b"x")})
+        # Act
+        download = await http_request.download("https://cdn.example.com/image.png")
+        revalidated = await http_request.download("https://cdn.example.com/image.png", etag=download.etag)
+        # Assert
+        assert download.body == b"image"
+        assert revalidated.body is None
+        assert len(http_request._storage_clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_http2_should_be_negotiated_by_the_api_transport(self):
+        # Arrange
+        pytest.importorskip("h2")
+        http_request = AsyncHTTPRequest(http2=True)
+        # Act
+        client = http_request._get_async_client()
+        # Assert
+        assert client._transport._pool._http2
+
+    @pytest.mark.asyncio
+    async def test_request_should_pass_an_awaitable_trace_and_attach_the_timing(self, mocker):
+        # Arrange
+        http_request = AsyncHTTPRequest()
+
+        async def handle_async_request(request: httpx.Request) -> httpx.Response:
+            # httpcore awaits the trace callback of async requests
+            for event_name in ("send_request_headers.started", "send_request_headers.complete", "receive_response_headers.complete"):
+                await request.extensions["trace"](f"http11.{event_name}", {})
+            return httpx.Response(200, json={"result": {"image_url": "https://example.com/a.png"}})
+
+        mocker.patch.object(httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handle_async_request)
+        # Act
+        response = await http_request.request(url="https://api.example.com/v2/image/edit/blur", method="POST", payload={"prompt": "cat"})
+        # Assert
+        assert response.error is None
+        assert response.timing is not None and response.timing.ttfb is not None
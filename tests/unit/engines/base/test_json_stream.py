@@ -0,0 +1,80 @@
+import json
+
+import httpx
+import pytest
+
+from bria_client.engines.base.async_http_request import AsyncHTTPRequest
+from bria_client.engines.base.json_stream import JsonStream
+from bria_client.engines.base.sync_http_request import SyncHTTPRequest
+from bria_client.toolkit import Image
+
+
+def _echo_transport(received: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        received.append(request)
+        return httpx.Response(200, json={"request_id": "req-1", "result": {"ok": True}})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.unit
+class TestJsonStream:
+    def test_stream_should_produce_same_json_as_regular_encoding(self, pil_image):
+        # Arrange
+        image = Image(pil_image)
+        payload = {"image": image, "nested": {"masks": [image, "https://example.com/mask.png"]}, "seed": 42, "prompt": "çà"}
+        expected = {
+            "image": image.as_bria_api_input,
+            "nested": {"masks": [image.as_bria_api_input, "https://example.com/mask.png"]},
+            "seed": 42,
+            "prompt": "çà",
+        }
+        # Act
+        stream = JsonStream(payload)
+        body = b"".join(stream)
+        # Assert
+        assert json.loads(body) == expected
+        assert len(body) == stream.content_length
+
+    def test_stream_should_be_iterable_more_than_once(self, pil_image):
+        stream = JsonStream({"image": Image(pil_image)})
+        assert b"".join(stream) == b"".join(stream)
+
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [({"image": "abc"}, False), ({"a": {"b": [1, "x"]}}, False), ({"a": [{"b": "IMAGE"}]}, True)],
+    )
+    def test_contains_image_should_look_into_nested_values(self, payload, expected, pil_image):
+        payload = json.loads(json.dumps(payload))
+        if expected:
+            payload["a"][0]["b"] = Image(pil_image)
+        assert JsonStream.contains_image(payload) is expected
+
+
+@pytest.mark.unit
+class TestStreamedRequests:
+    def test_sync_request_with_image_should_send_streamed_body(self, pil_image):
+        # Arrange
+        received: list[httpx.Request] = []
+        http_request = SyncHTTPRequest()
+        http_request._client = httpx.Client(transport=_echo_transport(received))
+        image = Image(pil_image)
+        # Act
+        http_request.request(url="https://test.example.com/v2/image/edit", method="POST", payload={"image": image})
+        # Assert
+        assert json.loads(received[0].content) == {"image": image.as_bria_api_input}
+        assert received[0].headers["content-type"] == "application/json"
+        assert int(received[0].headers["content-length"]) == len(received[0].content)
+
+    @pytest.mark.asyncio
+    async def test_async_request_with_image_should_send_streamed_body(self, pil_image, mocker):
+        # Arrange
+        received: list[httpx.Request] = []
+        http_request = AsyncHTTPRequest()
+        mocker.patch.object(http_request, "_get_async_client", return_value=httpx.AsyncClient(transport=_echo_transport(received)))
+        image = Image(pil_image)
+        # Act
+        await http_request.request(url="https://test.example.com/v2/image/edit", method="POST", payload={"image": image, "sync": True})
+        # Assert
+        assert json.loads(received[0].content) == {"image": image.as_bria_api_input, "sync": True}
@@ -0,0 +1,76 @@
+import pytest
+
+from bria_client.engines.base.request_trace import RequestTrace
+
+HTTP11_ATTEMPT = [
+    "http11.send_request_headers.started",
+    "http11.send_request_headers.complete",
+    "http11.send_request_body.started",
+    "http11.send_request_body.complete",
+    "http11.receive_response_headers.started",
+    "http11.receive_response_headers.complete",
+    "http11.receive_response_body.started",
+    "http11.receive_response_body.complete",
+    "http11.response_closed.started",
+    "http11.response_closed.complete",
+]
+
+
+@pytest.mark.unit
+class TestRequestTrace:
+    def test_each_sent_attempt_after_the_first_should_be_a_retry(self):
+        # Arrange
+        retries: list[int] = []
+        trace = RequestTrace(on_retry=retries.append)
+        # Act
+        for _ in range(3):
+            trace("http11.send_request_headers.started", {})
+            trace("http11.receive_response_headers.started", {})
+        # Assert
+        assert trace.retries == 2
+        assert retries == [1, 2]
+        assert trace.pool_wait is not None and trace.pool_wait >= 0
+
+    def test_pool_wait_should_be_unknown_without_trace_events(self):
+        assert RequestTrace().pool_wait is None
+
+
+@pytest.mark.unit
+class TestRequestTraceTiming:
+    def test_timing_should_split_the_request_into_phases(self, mocker):
+        # Arrange
+        clock = iter([0.0, 1.0, 2.0, 3.0, 4.0, 4.0, 5.0, 5.0, 8.0, 8.0, 9.5, 9.5, 9.5, 10.0])
+        mocker.patch("bria_client.engines.base.request_trace.time.perf_counter", side_effect=lambda: next(clock))
+        trace = RequestTrace()
+        # Act
+        for event_name in ["connection.connect_tcp.started", "connection.connect_tcp.complete", *HTTP11_ATTEMPT]:
+            trace(event_name, {})
+        timing = trace.timing(parse=0.25)
+        # Assert
+        assert (timing.pool, timing.connect, timing.tls, timing.write, timing.ttfb, timing.read, timing.parse) == (1, 1, None, 2, 3, 1.5, 0.25)
+        assert (timing.retries, timing.total) == (0, 10)
+
+    def test_timing_of_retried_request_should_be_the_last_attempt_phases(self):
+        # Arrange
+        trace = RequestTrace()
+        trace("connection.connect_tcp.started", {})
+        trace("connection.connect_tcp.complete", {})
+        # Act
+        for event_name in [*HTTP11_ATTEMPT, *HTTP11_ATTEMPT]:
+            trace(event_name, {})
+        timing = trace.timing()
+        # Assert
+        assert timing.retries == 1
+        assert timing.connect is None
+        assert timing.ttfb is not None and timing.read is not None
+
+    def test_timing_without_response_should_only_have_pool_and_total(self):
+        # Arrange
+        trace = RequestTrace()
+        trace("connection.connect_tcp.started", {})
+        trace("connection.connect_tcp.failed", {})
+        # Act
+        timing = trace.timing()
+        # Assert
+        assert (timing.write, timing.ttfb, timing.read) == (None, None, None)
+        assert timing.pool is not None and timing.total is not None
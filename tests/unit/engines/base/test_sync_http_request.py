@@ -2,7 +2,9 @@ from unittest.mock import patch
 
 import httpx
 import pytest
+from httpx_retries import Retry
 
+from bria_client.engines.base.base_http_request import default_storage_retry
 from bria_client.engines.base.sync_http_request import SyncHTTPRequest
 from bria_client.toolkit.errors.custom_errors import ServerConnectionError
 from bria_client.toolkit.models import Status
@@ -19,3 +21,179 @@ class TestSyncHTTPRequest:
         # Assert
         assert result.status == Status.FAILED.value
         assert isinstance(result.error, ServerConnectionError)
+
+    def test_upload_should_reuse_one_storage_client_separate_from_the_api_client(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest()
+        handle_request = mocker.patch.object(httpx.HTTPTransport, "handle_request", return_value=httpx.Response(204))
+        # Act
+        responses = [http_request.upload("https://storage.example.com/bucket", data={"key": "a"}, files={"file": ("a.mp4", b"x")}) for _ in range(2)]
+        storage_client = http_request._get_storage_client()
+        # Assert
+        assert [response.status_code for response in responses] == [204, 204]
+        assert handle_request.call_count == 2
+        assert storage_client is not http_request._client
+        assert storage_client.timeout.write == 60.0
+
+    def test_storage_client_should_use_the_storage_pool_limits(self):
+        # Arrange
+        http_request = SyncHTTPRequest()
+        # Act
+        pool = http_request._get_storage_client()._transport._sync_transport._pool
+        # Assert
+        assert pool._max_connections == 20
+        assert pool._max_keepalive_connections == 10
+
+    def test_upload_should_retry_transient_storage_failures(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest(storage_retry=Retry(total=2, allowed_methods=["POST"]))
+        mocker.patch.object(httpx.HTTPTransport, "handle_request", side_effect=[httpx.Response(503), httpx.Response(204)])
+        # Act
+        response = http_request.upload("https://storage.example.com/bucket", data={"key": "a"}, files={"file": ("a.mp4", b"x")})
+        # Assert
+        assert response.status_code == 204
+
+    def test_close_should_close_the_storage_client(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest()
+        storage_client = http_request._get_storage_client()
+        # Act
+        http_request.close()
+        # Assert
+        assert storage_client.is_closed
+
+    def test_download_should_read_the_body_through_the_storage_client(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest()
+        handle_request = mocker.patch.object(
+            httpx.HTTPTransport, "handle_request", return_value=httpx.Response(200, content=b"image", headers={"ETag": '"v1"'})
+        )
+        # Act
+        download = http_request.download("https://cdn.example.com/image.png")
+        # Assert
+        assert download.body == b"image"
+        assert download.etag == '"v1"'
+        assert "If-None-Match" not in handle_request.call_args.args[0].headers
+
+    def test_download_of_a_current_etag_should_not_return_a_body(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest()
+        handle_request = mocker.patch.object(httpx.HTTPTransport, "handle_request", return_value=httpx.Response(304))
+        # Act
+        download = http_request.download("https://cdn.example.com/image.png", etag='"v1"')
+        # Assert
+        assert download.body is None
+        assert download.etag == '"v1"'
+        assert handle_request.call_args.args[0].headers["If-None-Match"] == '"v1"'
+
+    def test_download_should_raise_on_error_status(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest(storage_retry=Retry(total=0))
+        mocker.patch.object(httpx.HTTPTransport, "handle_request", return_value=httpx.Response(404))
+        # Act / Assert
+        with pytest.raises(httpx.HTTPStatusError):
+            http_request.download("https://cdn.example.com/image.png")
+
+    def test_default_storage_retry_should_retry_upload_posts(self):
+        retry = default_storage_retry()
+        assert retry.is_retryable_method("POST")
+        assert retry.is_retryable_method("GET")
+        assert retry.is_retryable_status_code(503)
+        assert not retry.is_retryable_status_code(403)
+
+    def test_http2_should_be_negotiated_by_the_api_transport(self):
+        # Arrange
+        pytest.importorskip("h2")
+        # Act
+        http_request = SyncHTTPRequest(http2=True, http2_max_connections=4)
+        pool = http_request._client._transport._pool
+        # Assert
+        assert http_request.http2
+        assert pool._http2 and pool._max_connections == 4
+
+    def test_explicit_limits_should_win_over_http2_max_connections(self):
+        # Arrange
+        pytest.importorskip("h2")
+        # Act
+        http_request = SyncHTTPRequest(http2=True, http2_max_connections=4, limits=httpx.Limits(max_connections=300, max_keepalive_connections=200))
+        pool = http_request._client._transport._pool
+        # Assert
+        assert (pool._max_connections, pool._max_keepalive_connections) == (300, 200)
+
+    def test_http2_without_h2_should_fall_back_to_http1(self, mocker):
+        # Arrange
+        mocker.patch("bria_client.engines.base.base_http_request.importlib.util.find_spec", return_value=None)
+        # Act
+        with pytest.warns(UserWarning, match="h2"):
+            http_request = SyncHTTPRequest(http2=True)
+        # Assert
+        assert not http_request.http2
+        assert not http_request._client._transport._pool._http2
+
+    def test_api_transport_should_apply_limits_behind_the_retry_transport(self):
+        # Act
+        http_request = SyncHTTPRequest(retry=Retry(total=1))
+        # Assert
+        assert http_request._client._transport._sync_transport._transport._pool._max_connections == 100
+
+    @pytest.mark.parametrize(
+        "url,override,expected_read",
+        [
+            ("https://api.example.com/v2/status/req-1", None, 5),
+            ("https://api.example.com/v2/video/edit/remove_background", None, 300),
+            ("https://api.example.com/v2/video/upload", None, 20),
+            ("https://api.example.com/v2/image/edit/remove_background", None, 30),
+            ("https://api.example.com/v2/status/req-1", 2, 2),
+        ],
+    )
+    def test_request_timeout_should_resolve_override_then_endpoint_table_then_default(self, url, override, expected_read):
+        # Arrange
+        http_request = SyncHTTPRequest(request_timeout=30, endpoint_timeouts={"status": 5, "/v2/video/": 300, "video/upload": 20})
+        # Act
+        timeout = http_request._request_timeout(url, override)
+        # Assert
+        assert timeout.read == expected_read
+        assert timeout.connect == 10
+
+    def test_request_should_send_the_resolved_timeout(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest(endpoint_timeouts={"status": 5})
+        send = mocker.patch.object(
+            http_request._client, "request", return_value=httpx.Response(200, json={"result": {}}, request=httpx.Request("GET", "https://api.example.com"))
+        )
+        explicit = httpx.Timeout(1)
+        # Act
+        http_request.request(url="https://api.example.com/v2/status/req-1", method="GET")
+        http_request.request(url="https://api.example.com/v2/status/req-1", method="GET", request_timeout=explicit)
+        # Assert
+        assert send.call_args_list[0].kwargs["timeout"].read == 5
+        assert send.call_args_list[1].kwargs["timeout"] is explicit
+        assert "request_timeout" not in send.call_args_list[1].kwargs
+
+    def test_limits_should_configure_the_api_pool(self):
+        # Act
+        http_request = SyncHTTPRequest(limits=httpx.Limits(max_connections=300, max_keepalive_connections=200))
+        pool = http_request._client._transport._pool
+        # Assert
+        assert (pool._max_connections, pool._max_keepalive_connections) == (300, 200)
+
+    def test_request_should_attach_the_timing_of_the_request(self, mocker):
+        # Arrange
+        http_request = SyncHTTPRequest()
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            trace = request.extensions["trace"]
+            trace("http11.send_request_headers.started", {})
+            trace("http11.send_request_headers.complete", {})
+            trace("http11.receive_response_headers.started", {})
+            trace("http11.receive_response_headers.complete", {})
+            return httpx.Response(200, json={"result": {"image_url": "https://example.com/a.png"}})
+
+        mocker.patch.object(httpx.HTTPTransport, "handle_request", side_effect=handle_request)
+        # Act
+        response = http_request.request(url="https://api.example.com/v2/image/edit/blur", method="POST", payload={"prompt": "cat"})
+        # Assert
+        assert response.timing is not None
+        assert response.timing.ttfb is not None and response.timing.parse is not None
+        assert response.timing.total >= response.timing.ttfb
+        assert "timing" not in response.model_dump()
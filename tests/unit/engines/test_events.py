@@ -0,0 +1,137 @@
+import httpx
+import pytest
+from httpx_retries import Retry
+
+from bria_client.clients.async_client import BriaAsyncClient
+from bria_client.clients.polling import FixedInterval
+from bria_client.clients.sync_client import BriaSyncClient
+from bria_client.engines.events import EventDispatcher, EventHooks, PollTick, RequestEnded, RequestRetried, RequestStarted
+from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.models import BriaResult, Status
+
+
+class _RecordingHooks(EventHooks):
+    def __init__(self) -> None:
+        self.events: list[object] = []
+
+    def on_request_started(self, event: RequestStarted) -> None:
+        self.events.append(event)
+
+    def on_request_ended(self, event: RequestEnded) -> None:
+        self.events.append(event)
+
+    def on_request_retried(self, event: RequestRetried) -> None:
+        self.events.append(event)
+
+    def on_poll_tick(self, event: PollTick) -> None:
+        self.events.append(event)
+
+
+def _send_through_trace(*responses: httpx.Response):
+    """A `handle_request` side effect feeding the request trace like httpcore does, one response per attempt"""
+    remaining = list(responses)
+
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        trace = request.extensions["trace"]
+        trace("connection.connect_tcp.started", {})
+        trace("http11.send_request_headers.started", {"request": request})
+        return remaining.pop(0)
+
+    return handle_request
+
+
+@pytest.mark.unit
+class TestEventDispatcher:
+    def test_failing_hook_should_not_stop_the_others(self, mocker):
+        # Arrange
+        class _FailingHooks(EventHooks):
+            def on_poll_tick(self, event: PollTick) -> None:
+                raise RuntimeError("boom")
+
+        recording = _RecordingHooks()
+        dispatcher = EventDispatcher([_FailingHooks(), recording])
+        log_exception = mocker.patch("bria_client.engines.events.logger.exception")
+        event = PollTick(request_id="req-1", attempt=1, status="RUNNING", next_delay=1.0)
+        # Act
+        dispatcher.emit("on_poll_tick", event)
+        # Assert
+        assert recording.events == [event]
+        log_exception.assert_called_once()
+
+
+@pytest.mark.unit
+class TestClientEvents:
+    def test_request_should_emit_start_retries_and_end(self, mocker):
+        # Arrange
+        hooks = _RecordingHooks()
+        client = BriaSyncClient(
+            base_url="https://test.example.com", api_token="tok", retry=Retry(total=2, backoff_factor=0, allowed_methods=["POST"]), event_hooks=[hooks]
+        )
+        body = b'{"result": {"image_url": "https://example.com/a.png"}}'
+        mocker.patch.object(
+            httpx.HTTPTransport, "handle_request", side_effect=_send_through_trace(httpx.Response(503), httpx.Response(200, stream=httpx.ByteStream(body)))
+        )
+        # Act
+        client.run("image/edit/remove_background", payload={"image": "https://example.com/a.png"})
+        # Assert
+        started, retried, ended = hooks.events
+        assert started == RequestStarted(endpoint="image/edit/remove_background", method="POST")
+        assert retried == RequestRetried(endpoint="image/edit/remove_background", method="POST", retry=1)
+        assert isinstance(ended, RequestEnded)
+        assert (ended.status_code, ended.retries, ended.bytes_received, ended.error) == (200, 1, len(body), None)
+        assert ended.bytes_sent > 0
+        assert ended.pool_wait is not None
+
+    @pytest.mark.asyncio
+    async def test_async_request_should_emit_start_retries_and_end(self, mocker):
+        # Arrange
+        hooks = _RecordingHooks()
+        client = BriaAsyncClient(
+            base_url="https://test.example.com", api_token="tok", retry=Retry(total=2, backoff_factor=0, allowed_methods=["POST"]), event_hooks=[hooks]
+        )
+        remaining = [httpx.Response(503), httpx.Response(200, json={"result": {"image_url": "https://example.com/a.png"}})]
+
+        async def handle_async_request(request: httpx.Request) -> httpx.Response:
+            # httpcore awaits the trace callback of async requests
+            await request.extensions["trace"]("http11.send_request_headers.started", {"request": request})
+            return remaining.pop(0)
+
+        mocker.patch.object(httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handle_async_request)
+        # Act
+        bria_response = await client.run("image/edit/remove_background", payload={"image": "https://example.com/a.png"})
+        # Assert
+        started, retried, ended = hooks.events
+        assert bria_response.error is None
+        assert started == RequestStarted(endpoint="image/edit/remove_background", method="POST")
+        assert retried == RequestRetried(endpoint="image/edit/remove_background", method="POST", retry=1)
+        assert isinstance(ended, RequestEnded)
+        assert (ended.status_code, ended.retries, ended.error) == (200, 1, None)
+
+    def test_connection_failure_should_end_without_status_code(self, mocker):
+        # Arrange
+        hooks = _RecordingHooks()
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", retry=Retry(total=0), event_hooks=[hooks])
+        mocker.patch.object(httpx.HTTPTransport, "handle_request", side_effect=httpx.ConnectError("unreachable"))
+        # Act
+        client.engine.get("status/req-1")
+        # Assert
+        ended = hooks.events[-1]
+        assert isinstance(ended, RequestEnded)
+        assert (ended.endpoint, ended.status_code) == ("status", None)
+
+    def test_poll_should_emit_a_tick_per_status_call(self, mocker):
+        # Arrange
+        hooks = _RecordingHooks()
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", event_hooks=[hooks])
+        running = BriaResponse(status=Status.RUNNING, request_id="req-1")
+        completed = BriaResponse(status=Status.COMPLETED, request_id="req-1", result=BriaResult())
+        mocker.patch.object(client.engine.client, "request", side_effect=[running, completed])
+        mocker.patch("bria_client.clients.sync_client.time.sleep")
+        # Act
+        client.poll("req-1", strategy=FixedInterval(2))
+        # Assert
+        ticks = [event for event in hooks.events if isinstance(event, PollTick)]
+        assert ticks == [
+            PollTick(request_id="req-1", attempt=1, status=Status.RUNNING.value, next_delay=2),
+            PollTick(request_id="req-1", attempt=2, status=Status.COMPLETED.value, next_delay=None),
+        ]
@@ -0,0 +1,86 @@
+import pytest
+
+from bria_client.engines.events import RequestEnded, UploadProgress
+from bria_client.engines.metrics import Histogram, MetricsCollector, PrometheusCollector
+
+
+def _ended(endpoint: str = "image/edit/blur", status_code: int | None = 200, duration: float = 0.2, retries: int = 0) -> RequestEnded:
+    return RequestEnded(
+        endpoint=endpoint,
+        method="POST",
+        status_code=status_code,
+        started_at=0.0,
+        duration=duration,
+        bytes_sent=100,
+        bytes_received=50,
+        retries=retries,
+        pool_wait=0.001,
+    )
+
+
+@pytest.mark.unit
+class TestHistogram:
+    def test_quantile_should_return_the_bucket_upper_bound(self):
+        # Arrange
+        histogram = Histogram(buckets=(0.1, 1, 10))
+        # Act
+        for value in (0.05, 0.5, 0.5, 5):
+            histogram.observe(value)
+        # Assert
+        assert (histogram.quantile(0.25), histogram.quantile(0.5), histogram.quantile(1)) == (0.1, 1, 10)
+        assert list(histogram.cumulative()) == [(0.1, 1), (1, 3), (10, 4), (float("inf"), 4)]
+        assert histogram.sum == pytest.approx(6.05)
+
+    def test_quantile_of_empty_histogram_should_be_none(self):
+        assert Histogram().quantile(0.5) is None
+
+
+@pytest.mark.unit
+class TestMetricsCollector:
+    def test_should_aggregate_requests_by_endpoint(self):
+        # Arrange
+        metrics = MetricsCollector()
+        # Act
+        metrics.on_request_ended(_ended(retries=2))
+        metrics.on_request_ended(_ended(status_code=429))
+        metrics.on_request_ended(_ended(endpoint="status", status_code=None))
+        # Assert
+        blur = metrics.endpoints["image/edit/blur"]
+        assert blur.requests == 2
+        assert blur.status_codes == {"200": 1, "429": 1}
+        assert (blur.retries, blur.bytes_sent, blur.bytes_received) == (2, 200, 100)
+        assert blur.pool_wait.count == 2
+        assert metrics.endpoints["status"].status_codes == {"error": 1}
+
+    def test_endpoints_should_be_a_snapshot(self):
+        # Arrange
+        metrics = MetricsCollector()
+        metrics.on_request_ended(_ended())
+        snapshot = metrics.endpoints
+        # Act
+        metrics.on_request_ended(_ended())
+        # Assert
+        assert snapshot["image/edit/blur"].requests == 1
+
+    def test_should_count_completed_uploads(self):
+        # Arrange
+        metrics = MetricsCollector()
+        # Act
+        metrics.on_upload_progress(UploadProgress(path="a.mp4", bytes_sent=10, total_bytes=20))
+        metrics.on_upload_progress(UploadProgress(path="a.mp4", bytes_sent=20, total_bytes=20))
+        # Assert
+        assert (metrics.uploads, metrics.upload_bytes) == (1, 20)
+
+
+@pytest.mark.unit
+class TestPrometheusCollector:
+    def test_collect_should_expose_the_collected_metrics(self):
+        pytest.importorskip("prometheus_client")
+        # Arrange
+        metrics = MetricsCollector()
+        metrics.on_request_ended(_ended())
+        # Act
+        families = {family.name: family for family in PrometheusCollector(metrics).collect()}
+        # Assert
+        assert families["bria_client_requests"].samples[0].value == 1
+        assert families["bria_client_request_duration_seconds"].samples[-1].value == pytest.approx(0.2)
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+from httpx_retries import Retry
+
+from bria_client.clients.async_client import BriaAsyncClient
+from bria_client.clients.sync_client import BriaSyncClient
+from bria_client.engines.rate_limiter import ConcurrencyLimit, RateLimiter, TokenBucket
+from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.models import BriaError, BriaResult, Status
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    def test_reserve_should_not_wait_within_burst(self):
+        bucket = TokenBucket(rate=1, burst=3)
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+    def test_reserve_beyond_burst_should_return_increasing_waits(self):
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.reserve()
+        first, second = bucket.reserve(), bucket.reserve()
+        assert first == pytest.approx(0.1, abs=0.01)
+        assert second == pytest.approx(0.2, abs=0.01)
+
+    def test_init_with_non_positive_rate_should_raise(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+@pytest.mark.unit
+class TestConcurrencyLimit:
+    def test_acquire_beyond_limit_should_block_until_release(self):
+        # Arrange
+        limit = ConcurrencyLimit(1)
+        limit.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limit.acquire(), acquired.set()))
+        # Act
+        thread.start()
+        blocked = not acquired.wait(0.05)
+        limit.release()
+        thread.join(1)
+        # Assert
+        assert blocked
+        assert acquired.is_set()
+        assert limit.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_should_hand_over_released_slots(self):
+        # Arrange
+        limit = ConcurrencyLimit(2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            await limit.acquire_async()
+            peak = max(peak, limit.in_flight)
+            await asyncio.sleep(0.01)
+            limit.release()
+
+        # Act
+        await asyncio.gather(*(work() for _ in range(10)))
+        # Assert
+        assert peak == 2
+        assert limit.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_should_not_leak_slot(self):
+        # Arrange
+        limit = ConcurrencyLimit(1)
+        await limit.acquire_async()
+        waiter = asyncio.create_task(limit.acquire_async())
+        await asyncio.sleep(0)
+        # Act
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        limit.release()
+        # Assert
+        assert limit.in_flight == 0
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    def test_endpoint_rates_should_match_longest_prefix(self):
+        limiter = RateLimiter(rate=5, endpoint_rates={"video": 1, "/v2/video/edit": 2, "status": 50})
+        assert limiter.current_rate("video/edit/remove_background") == 2
+        assert limiter.current_rate("video/segment") == 1
+        assert limiter.current_rate("status/req-1") == 50
+        assert limiter.current_rate("image/edit/remove_background") == 5
+
+    def test_buckets_should_be_separate_per_identity(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter.acquire("image/edit", identity="a")
+        bucket_b, _ = limiter._resolve("image/edit", "b")
+        assert bucket_b.reserve() == 0
+
+    def test_adaptive_should_decrease_on_throttle_and_recover_on_success(self):
+        # Arrange
+        limiter = RateLimiter(rate=10, adaptive=True, increase=1, cooldown=0)
+        limiter.acquire("image/edit")
+        # Act
+        limiter.release("image/edit", status_code=429)
+        throttled_rate = limiter.current_rate("image/edit")
+        for _ in range(20):
+            limiter.release("image/edit", status_code=200)
+        # Assert
+        assert throttled_rate == 5
+        assert limiter.current_rate("image/edit") == 10
+
+    def test_adaptive_should_decrease_once_per_cooldown(self):
+        limiter = RateLimiter(rate=10, adaptive=True, cooldown=60)
+        limiter.acquire("image/edit")
+        limiter.release("image/edit", status_code=429)
+        limiter.release("image/edit", status_code=503)
+        assert limiter.current_rate("image/edit") == 5
+
+
+@pytest.mark.unit
+class TestClientWithRateLimiter:
+    def test_requests_should_go_through_limiter_and_report_status(self, mocker):
+        # Arrange
+        limiter = RateLimiter(rate=100, max_concurrency=1, adaptive=True, cooldown=0)
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", rate_limiter=limiter)
+        throttled = BriaResponse.from_error(BriaError(code=429, message="Too Many Requests", details=""))
+        ok = BriaResponse(status=Status.COMPLETED, request_id="req-1", result=BriaResult())
+        mocker.patch.object(client.engine.client, "request", side_effect=[throttled, ok])
+        acquire = mocker.spy(limiter, "acquire")
+        # Act
+        client.run("image/edit/remove_background", payload={})
+        rate_after_throttle = limiter.current_rate("image/edit/remove_background", client.engine._auth_identity())
+        client.run("image/edit/remove_background", payload={})
+        # Assert
+        assert acquire.call_count == 2
+        assert rate_after_throttle == 50
+
+    def test_retried_throttled_attempts_should_each_go_through_limiter(self, mocker):
+        # Arrange
+        limiter = RateLimiter(rate=100, max_concurrency=1, adaptive=True, cooldown=0)
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", rate_limiter=limiter, retry=Retry(total=2, backoff_factor=0))
+        mocker.patch.object(httpx.HTTPTransport, "handle_request", side_effect=[httpx.Response(429), httpx.Response(429), httpx.Response(200, json={})])
+        acquire = mocker.spy(limiter, "acquire")
+        release = mocker.spy(limiter, "release")
+        # Act
+        client.engine.get("status/req-1")
+        # Assert
+        assert acquire.call_count == 3
+        assert [call.args[2] for call in release.call_args_list] == [429, 429, 200]
+        assert limiter.current_rate("status/req-1", client.engine._auth_identity()) == 26
+
+    @pytest.mark.asyncio
+    async def test_async_retried_throttled_attempts_should_each_go_through_limiter(self, mocker):
+        # Arrange
+        limiter = RateLimiter(rate=100, max_concurrency=1, adaptive=True, cooldown=0)
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok", rate_limiter=limiter, retry=Retry(total=1, backoff_factor=0))
+        mocker.patch.object(httpx.AsyncHTTPTransport, "handle_async_request", side_effect=[httpx.Response(503), httpx.Response(200, json={})])
+        acquire = mocker.spy(limiter, "acquire_async")
+        release = mocker.spy(limiter, "release")
+        # Act
+        await client.engine.get_async("status/req-1")
+        # Assert
+        assert acquire.call_count == 2
+        assert [call.args[2] for call in release.call_args_list] == [503, 200]
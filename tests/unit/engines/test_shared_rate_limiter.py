@@ -0,0 +1,67 @@
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from bria_client.engines.shared_rate_limiter import SharedRateLimiter
+
+
+def _acquire_many(limiter: SharedRateLimiter, count: int) -> None:
+    for _ in range(count):
+        limiter.acquire("image/edit/remove_background")
+        limiter.release("image/edit/remove_background", status_code=200)
+
+
+@pytest.mark.unit
+class TestSharedRateLimiter:
+    def test_budget_should_be_shared_across_processes(self):
+        # Arrange
+        limiter = SharedRateLimiter(rate=50, burst=1, max_concurrency=2)
+        processes = [multiprocessing.Process(target=_acquire_many, args=(limiter, 5)) for _ in range(3)]
+        # Act
+        started = time.monotonic()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(10)
+        elapsed = time.monotonic() - started
+        # Assert
+        assert all(process.exitcode == 0 for process in processes)
+        # 15 requests with a single token of burst at 50/s need at least 14 refills
+        assert elapsed >= 14 / 50
+
+    def test_adaptive_should_decrease_on_throttle_and_recover_on_success(self):
+        limiter = SharedRateLimiter(rate=10, adaptive=True, increase=5, cooldown=0)
+        limiter.acquire("status/req-1")
+        limiter.release("status/req-1", status_code=429)
+        throttled_rate = limiter.rate
+        limiter.release("status/req-1", status_code=200)
+        assert throttled_rate == 5
+        assert limiter.rate == 10
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_should_wait_for_a_free_slot(self):
+        # Arrange
+        limiter = SharedRateLimiter(rate=1000, max_concurrency=1, poll_interval=0.001)
+        await limiter.acquire_async("status/req-1")
+        waiter = asyncio.create_task(limiter.acquire_async("status/req-2"))
+        # Act
+        await asyncio.sleep(0.02)
+        blocked = not waiter.done()
+        limiter.release("status/req-1")
+        await asyncio.wait_for(waiter, 1)
+        # Assert
+        assert blocked
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_should_back_off_while_waiting_for_a_slot(self, mocker):
+        # Arrange
+        limiter = SharedRateLimiter(rate=1000, max_concurrency=1, poll_interval=0.001, max_poll_interval=0.004)
+        await limiter.acquire_async("status/req-1")
+        sleep = mocker.patch("bria_client.engines.shared_rate_limiter.asyncio.sleep", side_effect=[None] * 4 + [asyncio.CancelledError()])
+        # Act
+        with pytest.raises(asyncio.CancelledError):
+            await limiter.acquire_async("status/req-2")
+        # Assert
+        assert [call.args[0] for call in sleep.call_args_list] == [0.001, 0.002, 0.004, 0.004, 0.004]
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bria_client.clients import BriaAsyncClient, BriaSyncClient
+from bria_client.engines.single_flight import SingleFlight
+from bria_client.toolkit import BriaResponse
+from bria_client.toolkit.models import Status
+
+
+def _running() -> BriaResponse:
+    return BriaResponse(status=Status.RUNNING, request_id="req-1")
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    def test_concurrent_identical_calls_should_share_one_send(self):
+        # Arrange
+        single_flight = SingleFlight()
+        release = threading.Event()
+        sends = []
+
+        def send() -> object:
+            sends.append(1)
+            release.wait(1)
+            return object()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.do, "key", send) for _ in range(3)]
+            while single_flight.coalesced < 2:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+        # Assert
+        assert len(sends) == 1
+        assert results[0] is results[1] is results[2]
+        assert len(single_flight) == 0
+
+    def test_completed_call_should_not_be_reused(self):
+        # Arrange
+        single_flight = SingleFlight()
+        # Act
+        first, second = single_flight.do("key", object), single_flight.do("key", object)
+        # Assert
+        assert first is not second
+        assert single_flight.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_should_get_the_error_of_the_shared_call(self):
+        # Arrange
+        single_flight = SingleFlight()
+
+        async def send() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        # Act
+        results = await asyncio.gather(*(single_flight.do_async("key", send) for _ in range(3)), return_exceptions=True)
+        # Assert
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_should_let_a_waiter_send_the_request(self):
+        # Arrange
+        single_flight = SingleFlight()
+        sends = []
+
+        async def send() -> str:
+            sends.append(1)
+            await asyncio.sleep(0.05)
+            return "response"
+
+        leader = asyncio.create_task(single_flight.do_async("key", send))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(single_flight.do_async("key", send))
+        await asyncio.sleep(0)
+        # Act
+        leader.cancel()
+        result = await waiter
+        # Assert
+        assert result == "response"
+        assert len(sends) == 2
+
+    def test_key_should_differ_by_headers_and_payload(self):
+        key = SingleFlight.key("POST", "https://api/v2/a", {"a": 1}, {"api_token": "x"}, {})
+        assert key == SingleFlight.key("POST", "https://api/v2/a", {"a": 1}, {"api_token": "x"}, {})
+        assert key != SingleFlight.key("POST", "https://api/v2/a", {"a": 1}, {"api_token": "y"}, {})
+        assert key != SingleFlight.key("POST", "https://api/v2/a", {"a": 2}, {"api_token": "x"}, {})
+
+
+@pytest.mark.unit
+class TestEngineSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_polls_of_one_request_should_share_status_calls(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+
+        async def status(**kwargs) -> BriaResponse:
+            await asyncio.sleep(0.01)
+            return _running()
+
+        request = mocker.patch.object(client.engine.client, "request", side_effect=status)
+        # Act
+        responses = await asyncio.gather(*(client.status("req-1") for _ in range(5)))
+        # Assert
+        assert request.call_count == 1
+        assert all(response is responses[0] for response in responses)
+
+    @pytest.mark.asyncio
+    async def test_identical_posts_should_not_be_coalesced_by_default(self, mocker):
+        # Arrange
+        client = BriaAsyncClient(base_url="https://test.example.com", api_token="tok")
+        request = mocker.patch.object(client.engine.client, "request", return_value=_running())
+        # Act
+        await asyncio.gather(*(client.submit("image/edit/blur", payload={"image": "https://example.com/a.png"}) for _ in range(3)))
+        # Assert
+        assert request.call_count == 3
+
+    def test_status_calls_with_other_api_tokens_should_not_be_shared(self, mocker):
+        # Arrange
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok")
+        release = threading.Event()
+        request = mocker.patch.object(client.engine.client, "request", side_effect=lambda **kwargs: release.wait(1) and _running())
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(client.status, "req-1", api_token=token) for token in ("tok", "other")]
+            while request.call_count < 2:
+                time.sleep(0.001)
+            release.set()
+            [future.result() for future in futures]
+        # Assert
+        assert request.call_count == 2
+
+    def test_single_flight_false_should_turn_coalescing_off(self):
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", single_flight=False)
+        assert client.engine.single_flight is None
+
+    def test_custom_single_flight_should_replace_the_default(self):
+        single_flight = SingleFlight(methods=("GET", "POST"))
+        client = BriaSyncClient(base_url="https://test.example.com", api_token="tok", single_flight=single_flight)
+        assert client.engine.single_flight is single_flight
@@ -0,0 +1,49 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+LAZY_DEPENDENCIES = ("numpy", "PIL", "werkzeug", "requests", "sqlite3")
+PACKAGES = ("bria_client", "bria_client.clients", "bria_client.engines", "bria_client.engines.base", "bria_client.toolkit", "bria_client.toolkit.errors")
+
+
+def _loaded_after(statement: str) -> list[str]:
+    """The lazy dependencies loaded by `statement` in a fresh interpreter"""
+    check = f"import sys; print(','.join(name for name in {LAZY_DEPENDENCIES!r} if name in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", f"{statement}; {check}"], capture_output=True, text=True, check=True).stdout.strip()
+    return output.split(",") if output else []
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import bria_client",
+            "from bria_client import BriaSyncClient, BriaAsyncClient",
+            "from bria_client.toolkit import BriaResponse, WebhookReceiver",
+            "from bria_client import BriaSyncClient; BriaSyncClient(base_url='https://test.example.com', api_token='tok')",
+        ],
+    )
+    def test_client_imports_should_not_load_heavy_dependencies(self, statement):
+        assert _loaded_after(statement) == []
+
+    def test_image_should_load_its_dependencies_on_first_use(self):
+        assert set(_loaded_after("from bria_client.toolkit import Image")) >= {"numpy", "PIL"}
+
+    @pytest.mark.parametrize("package", PACKAGES)
+    def test_every_export_should_resolve(self, package):
+        # Arrange
+        module = importlib.import_module(package)
+
+        # Act / Assert
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+            assert name in dir(module)
+
+    def test_unknown_attribute_should_raise_attribute_error(self):
+        import bria_client
+
+        with pytest.raises(AttributeError):
+            bria_client.NotAnExport  # noqa: B018
@@ -0,0 +1,77 @@
+import httpx
+import pytest
+
+from bria_client.toolkit.download import UNKNOWN_LENGTH_BUFFER_SIZE, BodyBuffer, aread_body, conditional_headers, read_body
+
+BODY = bytes(range(256)) * 40
+
+
+def _streamed_response(headers: dict[str, str], chunks: list[bytes]) -> httpx.Response:
+    return httpx.Response(200, headers=headers, stream=_Chunks(chunks))
+
+
+class _Chunks(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    def __iter__(self):
+        yield from self.chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.mark.unit
+class TestBodyBuffer:
+    def test_body_of_announced_length_should_fill_the_preallocated_buffer(self):
+        # Arrange
+        body = BodyBuffer(content_length=len(BODY))
+        buffer = body._buffer
+        # Act
+        for start in range(0, len(BODY), 1000):
+            body.write(BODY[start : start + 1000])
+        # Assert
+        assert body.getbuffer() == BODY
+        assert body._buffer is buffer and len(buffer) == len(BODY)
+
+    @pytest.mark.parametrize("content_length", [None, 0, 10])
+    def test_body_longer_than_the_buffer_should_grow_it(self, content_length):
+        # Arrange
+        body = BodyBuffer(content_length=content_length)
+        # Act
+        body.write(BODY)
+        body.write(BODY)
+        # Assert
+        assert body.getbuffer() == BODY + BODY
+
+    def test_unknown_length_should_preallocate_the_default_size(self):
+        assert len(BodyBuffer()._buffer) == UNKNOWN_LENGTH_BUFFER_SIZE
+
+
+@pytest.mark.unit
+class TestReadBody:
+    @pytest.mark.parametrize(
+        "headers",
+        [{"Content-Length": str(len(BODY))}, {}, {"Content-Length": "12"}, {"Content-Length": "invalid"}],
+    )
+    def test_read_body_should_return_the_whole_body(self, headers):
+        # Arrange
+        response = _streamed_response(headers, [BODY[:100], BODY[100:5000], BODY[5000:]])
+        # Act
+        body = read_body(response)
+        # Assert
+        assert body == BODY
+
+    @pytest.mark.asyncio
+    async def test_aread_body_should_return_the_whole_body(self):
+        # Arrange
+        response = _streamed_response({"Content-Length": str(len(BODY))}, [BODY[:100], BODY[100:]])
+        # Act
+        body = await aread_body(response)
+        # Assert
+        assert body == BODY
+
+    def test_conditional_headers_should_send_the_etag(self):
+        assert conditional_headers({"A": "1"}, '"v1"') == {"A": "1", "If-None-Match": '"v1"'}
+        assert conditional_headers({"A": "1"}, None) == {"A": "1"}
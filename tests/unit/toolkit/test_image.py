@@ -1,7 +1,18 @@
+import base64
+import io
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import numpy as np
 import pytest
+from PIL import Image as PilImage
 from pydantic import BaseModel
 
-from bria_client.toolkit import Image
+from bria_client.engines.base.sync_http_request import SyncHTTPRequest
+from bria_client.toolkit import EncodeProfile, Image
+from bria_client.toolkit.image import ImageOutputType, resolve_images
 
 
 @pytest.mark.unit
@@ -24,6 +35,236 @@ class TestImage:
         # Assert
         assert Image.is_base64(image.as_bria_api_input)
 
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 1000, 48 * 1024])
+    def test_iter_base64_should_concatenate_to_api_input(self, pil_image, chunk_size):
+        # Arrange
+        image = Image(pil_image)
+        # Act
+        streamed = b"".join(image.iter_base64(chunk_size=chunk_size))
+        # Assert
+        assert streamed.decode() == image.as_bria_api_input
+        assert image.base64_length == len(streamed)
+
+    def test_iter_base64_on_url_should_yield_url(self, image_url):
+        assert b"".join(Image(image_url).iter_base64(chunk_size=7)).decode() == image_url
+
+    def test_image_on_init_should_not_process_source_until_used(self, local_image_path, mocker):
+        # Arrange
+        open_image = mocker.spy(Image, "_process_image")
+        # Act
+        image = Image(local_image_path)
+        untouched = open_image.call_count == 0 and not image.is_resolved
+        image.as_bria_api_input
+        image.as_bria_api_input
+        # Assert
+        assert untouched
+        assert open_image.call_count == 1
+        assert image.is_resolved
+
+    def test_image_on_init_with_unsupported_source_should_raise(self):
+        with pytest.raises(ValueError):
+            Image(1234)  # pyright: ignore[reportArgumentType]
+
+    def test_image_with_invalid_path_should_raise_on_use(self, tmp_path):
+        image = Image(str(tmp_path / "missing.png"))
+        with pytest.raises(ValueError):
+            image.as_bria_api_input
+
+    @pytest.mark.asyncio
+    async def test_resolve_images_should_encode_pending_images_off_the_event_loop(self, pil_image, np_image, image_url, mocker):
+        # Arrange
+        payload = {"image": Image(pil_image), "masks": [Image(np_image)], "reference": Image(image_url), "prompt": "cat"}
+        resolving_threads = set()
+        original_resolve = Image.resolve
+
+        def tracking_resolve(image):
+            resolving_threads.add(threading.get_ident())
+            return original_resolve(image)
+
+        mocker.patch.object(Image, "resolve", tracking_resolve)
+        # Act
+        await resolve_images(payload)
+        # Assert
+        assert all(image.is_resolved for image in (payload["image"], payload["masks"][0], payload["reference"]))
+        assert threading.get_ident() not in resolving_threads
+
+    @pytest.mark.parametrize("fmt", ["PNG", "JPEG", "WEBP"])
+    def test_local_file_in_accepted_format_should_be_sent_as_is(self, tmp_path, pil_image, fmt, mocker):
+        # Arrange
+        path = tmp_path / f"image.{fmt.lower()}"
+        pil_image.convert("RGB").save(path, format=fmt)
+        pil_open = mocker.spy(PilImage, "open")
+        # Act
+        api_input = Image(path).as_bria_api_input
+        # Assert
+        assert base64.b64decode(api_input) == path.read_bytes()
+        pil_open.assert_not_called()
+
+    def test_small_local_file_should_be_read_instead_of_mapped(self, tmp_path, pil_image):
+        # Arrange
+        path = tmp_path / "image.png"
+        pil_image.save(path, format="PNG")
+        # Act
+        image = Image(path).resolve()
+        # Assert
+        assert isinstance(image._encoded.obj, bytes)
+
+    @pytest.mark.parametrize("send", [lambda image: image.as_bria_api_input.encode(), lambda image: b"".join(image.iter_base64(chunk_size=30))])
+    def test_large_local_file_should_be_unmapped_once_sent_and_mapped_again_on_next_use(self, tmp_path, pil_image, send, mocker):
+        # Arrange
+        mocker.patch("bria_client.toolkit.image.MAP_THRESHOLD", 0)
+        path = tmp_path / "image.png"
+        pil_image.save(path, format="PNG")
+        image = Image(path).resolve()
+        mapping = image._encoded.obj
+        # Act
+        first = send(image)
+        PilImage.new("RGB", (3, 3), "red").save(path, format="PNG")
+        second = send(image)
+        # Assert
+        assert isinstance(mapping, mmap.mmap) and mapping.closed
+        assert not image.is_resolved
+        assert base64.b64decode(second) == path.read_bytes() != base64.b64decode(first)
+
+    def test_local_file_in_other_format_should_be_re_encoded(self, tmp_path, pil_image, mocker):
+        # Arrange
+        path = tmp_path / "image.bmp"
+        pil_image.convert("RGB").save(path, format="BMP")
+        pil_open = mocker.spy(PilImage, "open")
+        # Act
+        api_input = Image(str(path)).as_bria_api_input
+        # Assert
+        pil_open.assert_called_once()
+        assert Image.is_base64(api_input)
+
+    def test_url_2_pil_should_decode_the_image_downloaded_through_the_storage_pool(self, pil_image, mocker):
+        # Arrange
+        buffer = io.BytesIO()
+        pil_image.save(buffer, format="PNG")
+        http_request = SyncHTTPRequest()
+        mocker.patch.object(httpx.HTTPTransport, "handle_request", return_value=httpx.Response(200, content=buffer.getvalue()))
+        # Act
+        downloaded = Image._url_2_pil("https://cdn.example.com/image.png", http_request)
+        # Assert
+        assert downloaded.size == pil_image.size
+        assert np.array_equal(np.asarray(downloaded), np.asarray(pil_image))
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0d", ImageOutputType.PNG),
+            (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01", ImageOutputType.JPEG),
+            (b"RIFF\x00\x00\x00\x00WEBP", ImageOutputType.WEBP),
+            (b"RIFF\x00\x00\x00\x00WAVE", None),
+            (b"BM", None),
+            (b"", None),
+        ],
+    )
+    def test_sniff_format_should_recognize_passthrough_formats(self, header, expected):
+        assert Image.sniff_format(header) == expected
+
+
+@pytest.mark.unit
+class TestNumpyImage:
+    @staticmethod
+    def _decode(image: Image) -> np.ndarray:
+        return np.asarray(PilImage.open(io.BytesIO(base64.b64decode(image.as_bria_api_input))))
+
+    @pytest.mark.parametrize("channels", [2, 3, 4])
+    def test_uint8_array_should_round_trip_without_fromarray(self, np_image, channels, mocker):
+        # Arrange
+        array = np_image[:, :, :channels].copy()
+        fromarray = mocker.spy(PilImage, "fromarray")
+        # Act
+        decoded = self._decode(Image(array))
+        # Assert
+        fromarray.assert_not_called()
+        assert np.array_equal(decoded, array)
+
+    def test_gray_and_single_channel_arrays_should_encode_as_gray(self, np_image):
+        gray = np_image[:, :, 0].copy()
+        assert np.array_equal(self._decode(Image(gray)), gray)
+        assert np.array_equal(self._decode(Image(gray[:, :, None])), gray)
+
+    def test_non_contiguous_array_should_keep_pixels(self, np_image):
+        # Arrange
+        array = np_image[::2, ::3, :3]
+        # Act
+        decoded = self._decode(Image(array))
+        # Assert
+        assert np.array_equal(decoded, array)
+
+    def test_array_should_default_to_fast_png(self, np_image):
+        decoded = PilImage.open(io.BytesIO(base64.b64decode(Image(np_image).as_bria_api_input)))
+        assert decoded.format == "PNG"
+
+    def test_array_with_unsupported_shape_should_raise_on_use(self):
+        with pytest.raises(ValueError, match=r"array of shape \(4, 4, 5\) and dtype uint8$"):
+            Image(np.zeros((4, 4, 5), dtype=np.uint8)).as_bria_api_input
+
+    def test_non_uint8_array_should_still_be_supported(self):
+        assert Image(np.zeros((4, 4), dtype=np.uint16)).as_bria_api_input
+
+    def test_from_batch_should_encode_every_frame_in_order(self, np_image):
+        # Arrange
+        batch = np.stack([np_image, np_image[::-1], np.zeros_like(np_image)])
+        # Act
+        images = Image.from_batch(batch)
+        # Assert
+        assert all(image.is_resolved for image in images)
+        assert [np.array_equal(self._decode(image), frame) for image, frame in zip(images, batch, strict=True)] == [True] * 3
+
+    def test_from_batch_should_use_given_executor(self, np_image):
+        # Arrange
+        batch = np.stack([np_image] * 4)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # Act
+            images = Image.from_batch(batch, encoding="small", executor=pool)
+        # Assert
+        assert {PilImage.open(io.BytesIO(base64.b64decode(image.as_bria_api_input))).format for image in images} == {"WEBP"}
+
+    def test_from_batch_without_resolve_should_stay_lazy(self, np_image):
+        images = Image.from_batch(np.stack([np_image] * 2), resolve=False)
+        assert not any(image.is_resolved for image in images)
+
+    def test_from_batch_with_single_image_should_raise(self, np_image):
+        with pytest.raises(ValueError):
+            Image.from_batch(np_image[:, :, 0])
+
+
+@pytest.mark.unit
+class TestEncodeProfile:
+    @pytest.mark.parametrize("preset,expected_format", [("fast", "PNG"), ("small", "WEBP"), ("lossless", "WEBP")])
+    def test_preset_should_encode_in_preset_format(self, pil_image, preset, expected_format):
+        # Act
+        api_input = Image(pil_image, encoding=preset).as_bria_api_input
+        # Assert
+        assert PilImage.open(io.BytesIO(base64.b64decode(api_input))).format == expected_format
+
+    def test_lossless_preset_should_keep_pixels(self, np_image):
+        api_input = Image(np_image, encoding="lossless").as_bria_api_input
+        decoded = np.asarray(PilImage.open(io.BytesIO(base64.b64decode(api_input))).convert("RGBA"))
+        assert np.array_equal(decoded, np_image)
+
+    def test_jpeg_profile_on_rgba_image_should_drop_alpha(self, pil_image):
+        api_input = Image(pil_image, encoding=EncodeProfile(format=ImageOutputType.JPEG, quality=70)).as_bria_api_input
+        assert PilImage.open(io.BytesIO(base64.b64decode(api_input))).mode == "RGB"
+
+    def test_small_preset_should_be_smaller_than_default(self, np_image):
+        assert Image(np_image, encoding="small").base64_length < Image(np_image).base64_length
+
+    def test_explicit_encoding_should_re_encode_local_files(self, local_image_path):
+        api_input = Image(local_image_path, encoding="small").as_bria_api_input
+        assert PilImage.open(io.BytesIO(base64.b64decode(api_input))).format == "WEBP"
+
+    def test_unknown_preset_should_raise(self, pil_image):
+        with pytest.raises(ValueError, match="Unknown encode preset"):
+            Image(pil_image, encoding="tiny")
+
+    def test_save_params_should_only_hold_options_of_the_format(self):
+        profile = EncodeProfile(format=ImageOutputType.PNG, compress_level=3, quality=50)
+        assert profile.save_params == {"format": "PNG", "compress_level": 3}
+
 
 @pytest.mark.unit
 class TestImageSource:
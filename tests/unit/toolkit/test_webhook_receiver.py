@@ -0,0 +1,196 @@
+import io
+import json
+
+import pytest
+
+from bria_client.toolkit.models import Status
+from bria_client.toolkit.webhook_receiver import WebhookReceiver
+from bria_client.toolkit.webhook_verification import WebhookVerifier
+
+API_TOKEN = "test-api-token"
+URL = "https://my-server.example.com/webhook"
+
+
+@pytest.mark.unit
+class TestWebhookReceiver:
+    def test_delivery_should_resolve_the_pending_job(self, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+
+        # Act
+        status = receiver.receive(*webhook_delivery("req-1"))
+
+        # Assert
+        assert status == 200
+        assert pending.wait(0).status == Status.COMPLETED
+        assert pending.wait(0).result.image_url == "https://cdn.bria.ai/final.png"
+        assert len(receiver) == 0
+
+    def test_delivery_before_expect_should_resolve_the_job_once_expected(self, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        receiver.receive(*webhook_delivery("req-1"))
+
+        # Act
+        pending = receiver.expect("req-1")
+
+        # Assert
+        assert pending.future.done()
+        assert pending.wait(0).request_id == "req-1"
+
+    def test_invalid_signature_should_be_rejected(self, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+
+        # Act
+        status = receiver.receive(*webhook_delivery("req-1", api_token="wrong-token"))
+
+        # Assert
+        assert status == 401
+        assert not pending.future.done()
+
+    def test_missing_headers_should_be_rejected(self):
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        assert receiver.receive(b"{}", {}) == 400
+
+    def test_redelivery_should_be_acknowledged_without_processing(self, mocker, webhook_delivery):
+        # Arrange
+        on_delivery = mocker.Mock()
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN, on_delivery=on_delivery)
+        payload, headers = webhook_delivery("req-1")
+
+        # Act
+        statuses = [receiver.receive(payload, headers), receiver.receive(payload, headers)]
+
+        # Assert
+        assert statuses == [200, 200]
+        on_delivery.assert_called_once()
+
+    def test_non_terminal_delivery_should_not_resolve_the_job(self, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+
+        # Act
+        receiver.receive(*webhook_delivery("req-1", body={"request_id": "req-1", "status": "IN_PROGRESS"}))
+
+        # Assert
+        assert not pending.future.done()
+
+    def test_terminal_delivery_after_a_non_terminal_one_should_resolve_the_job(self, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+        receiver.receive(*webhook_delivery("req-1", body={"request_id": "req-1", "status": "IN_PROGRESS"}))
+
+        # Act
+        status = receiver.receive(*webhook_delivery("req-1"))
+
+        # Assert
+        assert status == 200
+        assert pending.wait(0).status == Status.COMPLETED
+
+    def test_pending_jobs_should_be_bounded(self):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN, max_pending=2)
+
+        # Act
+        for request_id in ("req-1", "req-2", "req-3"):
+            receiver.expect(request_id)
+
+        # Assert
+        assert receiver.pending("req-1") is None
+        assert len(receiver) == 2
+
+    @pytest.mark.asyncio
+    async def test_asgi_app_should_verify_and_resolve(self, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+        payload, headers = webhook_delivery("req-1")
+        scope = {"type": "http", "method": "POST", "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()]}
+        messages = iter([{"type": "http.request", "body": payload[:10], "more_body": True}, {"type": "http.request", "body": payload[10:]}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message)
+
+        # Act
+        await receiver(scope, receive, send)
+
+        # Assert
+        assert sent[0]["status"] == 200
+        assert (await pending.wait_async(1)).status == Status.COMPLETED
+
+    def test_wsgi_app_should_verify_and_resolve(self, mocker, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+        payload, headers = webhook_delivery("req-1")
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_LENGTH": str(len(payload)),
+            "wsgi.input": io.BytesIO(payload),
+            **{f"HTTP_{name.upper().replace('-', '_')}": value for name, value in headers.items()},
+        }
+        start_response = mocker.Mock()
+
+        # Act
+        body = receiver.wsgi(environ, start_response)
+
+        # Assert
+        assert start_response.call_args.args[0] == "200 OK"
+        assert json.loads(b"".join(body)) == {"ok": True}
+        assert pending.wait(0).status == Status.COMPLETED
+
+    def test_wsgi_app_should_read_a_chunked_body(self, mocker, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+        payload, headers = webhook_delivery("req-1")
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "HTTP_TRANSFER_ENCODING": "chunked",
+            "wsgi.input": io.BytesIO(payload),
+            **{f"HTTP_{name.upper().replace('-', '_')}": value for name, value in headers.items()},
+        }
+        start_response = mocker.Mock()
+
+        # Act
+        receiver.wsgi(environ, start_response)
+
+        # Assert
+        assert start_response.call_args.args[0] == "200 OK"
+        assert pending.wait(0).status == Status.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_wait_async_should_return_none_when_not_delivered_in_time(self):
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        pending = receiver.expect("req-1")
+        assert await pending.wait_async(0.01) is None
+        assert not pending.future.cancelled()
+
+    def test_redelivery_should_be_acknowledged_although_replayed(self, webhook_delivery):
+        # Arrange
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        payload, headers = webhook_delivery("req-1")
+        receiver.receive(payload, headers)
+
+        # Act
+        statuses = [receiver.receive(payload, headers), receiver.receive(payload, {**headers, "Bria-Webhook-Signature": "v1=forged"})]
+
+        # Assert
+        assert statuses == [200, 401]
+
+    def test_stale_delivery_should_be_rejected(self, webhook_delivery):
+        receiver = WebhookReceiver(url=URL, api_token=API_TOKEN)
+        assert receiver.receive(*webhook_delivery("req-1", timestamp="1700000000")) == 401
+
+    def test_verifier_should_replace_the_api_token(self, webhook_delivery):
+        receiver = WebhookReceiver(url=URL, verifier=WebhookVerifier(["old-token", API_TOKEN]))
+        assert receiver.receive(*webhook_delivery("req-1", api_token="old-token")) == 200
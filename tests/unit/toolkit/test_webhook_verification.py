@@ -1,10 +1,11 @@
 import base64
 import hashlib
 import hmac
+import time
 
 import pytest
 
-from bria_client.toolkit.webhook_verification import WEBHOOK_SIGNING_SALT, verify_webhook_signature
+from bria_client.toolkit.webhook_verification import WEBHOOK_SIGNING_SALT, WebhookVerifier, verify_webhook_signature
 
 API_TOKEN = "test-api-token"
 WEBHOOK_ID = "req_abc123"
@@ -62,3 +63,117 @@ class TestVerifyWebhookSignature:
 
     def test_empty_signature_header_returns_false(self):
         assert verify_webhook_signature(PAYLOAD, WEBHOOK_ID, TIMESTAMP, "", API_TOKEN) is False
+
+    def test_non_utf8_payload_should_verify(self):
+        payload = b"\xff\xfe binary"
+        signing_key = hmac.new(API_TOKEN.encode(), WEBHOOK_SIGNING_SALT, hashlib.sha256).digest()
+        signature = base64.b64encode(hmac.new(signing_key, f"{WEBHOOK_ID}.{TIMESTAMP}.".encode() + payload, hashlib.sha256).digest()).decode()
+        assert verify_webhook_signature(payload, WEBHOOK_ID, TIMESTAMP, f"v1={signature}", API_TOKEN) is True
+
+
+@pytest.mark.unit
+class TestWebhookVerifier:
+    def test_shared_vector_signature_should_verify(self):
+        # Arrange
+        verifier = WebhookVerifier(CONTRACT_API_TOKEN, tolerance=None)
+
+        # Act
+        result = verifier.verify(CONTRACT_PAYLOAD, CONTRACT_WEBHOOK_ID, CONTRACT_TIMESTAMP, CONTRACT_SIGNATURE)
+
+        # Assert
+        assert result is True
+
+    def test_memoryview_payload_should_verify(self):
+        verifier = WebhookVerifier(CONTRACT_API_TOKEN, tolerance=None)
+        assert verifier.verify(memoryview(CONTRACT_PAYLOAD), CONTRACT_WEBHOOK_ID, CONTRACT_TIMESTAMP, CONTRACT_SIGNATURE) is True
+
+    def test_timestamp_outside_tolerance_should_be_rejected(self):
+        # Arrange
+        verifier = WebhookVerifier(API_TOKEN, tolerance=300)
+        stale = str(int(time.time()) - 301)
+        header = _make_signature(API_TOKEN, WEBHOOK_ID, stale, PAYLOAD)
+
+        # Act / Assert
+        assert verifier.verify(PAYLOAD, WEBHOOK_ID, stale, header) is False
+        assert verifier.verify_signature(PAYLOAD, WEBHOOK_ID, stale, header) is True
+
+    def test_invalid_timestamp_should_be_rejected(self):
+        verifier = WebhookVerifier(API_TOKEN)
+        header = _make_signature(API_TOKEN, WEBHOOK_ID, "not-a-time", PAYLOAD)
+        assert verifier.verify(PAYLOAD, WEBHOOK_ID, "not-a-time", header) is False
+
+    def test_replayed_delivery_should_be_rejected(self):
+        # Arrange
+        verifier = WebhookVerifier(API_TOKEN)
+        now = str(int(time.time()))
+        header = _make_signature(API_TOKEN, WEBHOOK_ID, now, PAYLOAD)
+
+        # Act
+        results = [verifier.verify(PAYLOAD, WEBHOOK_ID, now, header), verifier.verify(PAYLOAD, WEBHOOK_ID, now, header)]
+
+        # Assert
+        assert results == [True, False]
+
+    @pytest.mark.parametrize("reformat", [lambda header: f" {header}", lambda header: f"{header},v1=x", lambda header: f"v1=x, {header}"])
+    def test_replay_with_a_reformatted_signature_header_should_be_rejected(self, reformat):
+        # Arrange
+        verifier = WebhookVerifier(API_TOKEN)
+        now = str(int(time.time()))
+        header = _make_signature(API_TOKEN, WEBHOOK_ID, now, PAYLOAD)
+        verifier.verify(PAYLOAD, WEBHOOK_ID, now, header)
+
+        # Act
+        replayed = verifier.verify(PAYLOAD, WEBHOOK_ID, now, reformat(header))
+
+        # Assert
+        assert replayed is False
+
+    def test_other_payload_with_the_same_id_and_timestamp_should_not_be_a_replay(self):
+        # Arrange
+        verifier = WebhookVerifier(API_TOKEN)
+        now = str(int(time.time()))
+        completed = b'{"status":"COMPLETED","request_id":"req_abc123"}'
+        running = b'{"status":"RUNNING","request_id":"req_abc123"}'
+
+        # Act
+        results = [verifier.verify(payload, WEBHOOK_ID, now, _make_signature(API_TOKEN, WEBHOOK_ID, now, payload)) for payload in (running, completed)]
+
+        # Assert
+        assert results == [True, True]
+
+    def test_raw_tokens_should_not_be_kept(self):
+        verifier = WebhookVerifier(API_TOKEN)
+        assert API_TOKEN not in verifier._macs
+
+    def test_replay_cache_should_be_bounded(self):
+        # Arrange
+        verifier = WebhookVerifier(API_TOKEN, max_replays=2)
+        now = str(int(time.time()))
+        headers = {webhook_id: _make_signature(API_TOKEN, webhook_id, now, PAYLOAD) for webhook_id in ("a", "b", "c")}
+
+        # Act
+        for webhook_id, header in headers.items():
+            verifier.verify(PAYLOAD, webhook_id, now, header)
+
+        # Assert
+        assert len(verifier._verified) == 2
+        assert verifier.verify(PAYLOAD, "a", now, headers["a"]) is True
+
+    def test_every_active_token_should_be_accepted(self):
+        # Arrange
+        verifier = WebhookVerifier(["old-token", "new-token"], tolerance=None)
+
+        # Act / Assert
+        for api_token in ("old-token", "new-token"):
+            assert verifier.verify_signature(PAYLOAD, WEBHOOK_ID, TIMESTAMP, _make_signature(api_token, WEBHOOK_ID, TIMESTAMP, PAYLOAD)) is True
+
+    def test_removed_token_should_be_rejected(self):
+        # Arrange
+        verifier = WebhookVerifier(["old-token", "new-token"], tolerance=None)
+
+        # Act
+        verifier.remove_token("old-token")
+
+        # Assert
+        assert verifier.verify_signature(PAYLOAD, WEBHOOK_ID, TIMESTAMP, _make_signature("old-token", WEBHOOK_ID, TIMESTAMP, PAYLOAD)) is False
+        assert verifier.verify_signature(PAYLOAD, WEBHOOK_ID, TIMESTAMP, _make_signature("new-token", WEBHOOK_ID, TIMESTAMP, PAYLOAD)) is True